@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark thumbnail decoding: the original full-decode path vs ThumbnailDecoder
+
+Camera JPEGs with an embedded EXIF thumbnail show the biggest gain; generated samples have none.
+
+Usage:
+    python benchmark_thumbnails.py [image_directory] [--size 48] [--limit 200]
+
+Without a directory a set of synthetic JPEG/PNG/WebP/TIFF images is generated in a temp folder.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from PIL import Image
+
+from image_viewer import ThumbnailDecoder
+
+SUPPORTED_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif', '.webp')
+
+def legacy_list_thumbnail( filepath, size ):
+    """Original TreeviewImageList.load_thumbnail decode"""
+    with Image.open( filepath ) as img:
+        if img.mode in ('RGBA', 'LA', 'P'):
+            img = img.convert( 'RGB' )
+        img.thumbnail( size, Image.Resampling.LANCZOS )
+        return img
+
+def legacy_oriented_thumbnail( filepath, size ):
+    """Original ImageViewer.get_thumbnail decode - full-size orientation before shrinking"""
+    with Image.open( filepath ) as img:
+        orientation = img.getexif().get( 0x0112, 1 )
+        if orientation in (3, 6, 8):
+            img = img.rotate( {3: 180, 6: 270, 8: 90}[orientation], expand=True )
+        img.thumbnail( size, Image.Resampling.LANCZOS )
+        return img
+
+def create_sample_images( directory ):
+    """Generate large synthetic images covering the common formats"""
+    gradient = Image.linear_gradient( 'L' ).resize( (6000, 4000) )
+    rgb = Image.merge( 'RGB', (gradient, gradient.rotate( 90, expand=False ), gradient.transpose( Image.Transpose.FLIP_LEFT_RIGHT )) )
+
+    paths = []
+    for i in range( 4 ):
+        path = os.path.join( directory, f"sample_{i}.jpg" )
+        exif = Image.Exif()
+        exif[0x0112] = 6 if i % 2 else 1
+        rgb.save( path, quality=90, exif=exif )
+        paths.append( path )
+
+    rgba = rgb.resize( (3000, 2000) ).convert( 'RGBA' )
+    for ext in ('png', 'webp', 'tiff'):
+        path = os.path.join( directory, f"sample.{ext}" )
+        rgba.save( path )
+        paths.append( path )
+
+    return paths
+
+def time_decoder( name, decode, paths, size, rounds ):
+    """Time a decode function over all paths and print the per-thumbnail cost"""
+    start = time.perf_counter()
+    for _ in range( rounds ):
+        for path in paths:
+            decode( path, size )
+    elapsed = time.perf_counter() - start
+    per_image = elapsed / (len( paths ) * rounds) * 1000
+    print( f"{name:<28} {per_image:8.2f} ms/thumbnail" )
+    return per_image
+
+def main():
+    parser = argparse.ArgumentParser( description="Benchmark thumbnail decoding paths" )
+    parser.add_argument( "directory", nargs="?", help="Directory of images to benchmark (defaults to generated samples)" )
+    parser.add_argument( "--size", type=int, default=48, help="Thumbnail edge length in pixels" )
+    parser.add_argument( "--limit", type=int, default=200, help="Maximum number of images to decode" )
+    parser.add_argument( "--rounds", type=int, default=3, help="Passes over the image set" )
+    args = parser.parse_args()
+
+    size = (args.size, args.size)
+    decoder = ThumbnailDecoder()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.directory:
+            paths = []
+            for root, dirs, files in os.walk( args.directory ):
+                for filename in files:
+                    if filename.lower().endswith( SUPPORTED_EXTENSIONS ):
+                        paths.append( os.path.join( root, filename ) )
+            paths = paths[:args.limit]
+        else:
+            print( "Generating sample images..." )
+            paths = create_sample_images( temp_dir )
+
+        if not paths:
+            print( "No images found" )
+            return
+
+        print( f"Decoding {len( paths )} images x {args.rounds} rounds at {size[0]}x{size[1]}\n" )
+        list_time = time_decoder( "legacy list thumbnail", legacy_list_thumbnail, paths, size, args.rounds )
+        oriented_time = time_decoder( "legacy oriented thumbnail", legacy_oriented_thumbnail, paths, size, args.rounds )
+        time_decoder( "ThumbnailDecoder (no EXIF)", ThumbnailDecoder( use_embedded=False ).decode, paths, size, args.rounds )
+        fast_time = time_decoder( "ThumbnailDecoder", decoder.decode, paths, size, args.rounds )
+
+        print( f"\nSpeedup vs list path:     {list_time / fast_time:5.1f}x" )
+        print( f"Speedup vs oriented path: {oriented_time / fast_time:5.1f}x" )
+
+if __name__ == "__main__":
+    main()
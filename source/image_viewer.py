@@ -8,21 +8,938 @@ import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 import sqlite3
 import os
-from PIL import Image, ImageTk, ExifTags
+from PIL import Image, ImageTk
 from PIL.ExifTags import TAGS
 import threading
 import time
 from pathlib import Path
 import json
 import bisect
-from collections import deque
+from collections import deque, OrderedDict
 import weakref
 import shutil
+import io
+import queue
+import struct
+import multiprocessing
+from contextlib import contextmanager
+from itertools import compress
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+class ThumbnailStore:
+    """Persistent sidecar SQLite store for encoded thumbnails, keyed by relative path, mtime and file size"""
+    
+    def __init__( self, catalog_path ):
+        self.catalog_path = catalog_path
+        self.base_directory = os.path.dirname( catalog_path )
+        self.store_path = os.path.splitext( catalog_path )[0] + "_thumbs.db"
+        
+        # Single shared connection guarded by a lock - thumbnails are read and written from worker threads
+        self._lock = threading.Lock()
+        self._pending_writes = 0
+        self.commit_interval = 32  # Commit after this many writes to keep per-thumbnail cost low
+        self.commit_delay = 0.25  # Seconds a partial batch may hold the write lock before it is committed anyway
+        self._flush_timer = None
+        
+        self.conn = sqlite3.connect( self.store_path, check_same_thread=False )
+        self.conn.execute( "PRAGMA journal_mode=WAL" )
+        self.conn.execute( "PRAGMA synchronous=NORMAL" )
+        self.conn.execute( '''
+            CREATE TABLE IF NOT EXISTS thumbnails (
+                relative_path TEXT NOT NULL,
+                size_key TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                file_size INTEGER NOT NULL,
+                data BLOB NOT NULL,
+                PRIMARY KEY (relative_path, size_key)
+            )
+        ''' )
+        self.conn.commit()
+    
+    def relative_key( self, filepath ):
+        """Get the catalog-relative key for a file path"""
+        try:
+            return os.path.relpath( filepath, self.base_directory )
+        except ValueError:
+            # Different drive on Windows - fall back to the absolute path
+            return os.path.abspath( filepath )
+    
+    def get( self, filepath, size ):
+        """Return the stored thumbnail as a PIL image, or None if missing or stale"""
+        try:
+            stat = os.stat( filepath )
+        except OSError:
+            return None
+            
+        size_key = f"{size[0]}x{size[1]}"
+        try:
+            with self._lock:
+                row = self.conn.execute(
+                    "SELECT mtime, file_size, data FROM thumbnails WHERE relative_path = ? AND size_key = ?",
+                    (self.relative_key( filepath ), size_key) ).fetchone()
+                    
+            if not row or row[0] != stat.st_mtime or row[1] != stat.st_size:
+                return None
+                
+            img = Image.open( io.BytesIO( row[2] ) )
+            img.load()
+            return img
+            
+        except Exception as e:
+            print( f"Error reading stored thumbnail for {filepath}: {e}" )
+            return None
+    
+    @staticmethod
+    def encode( img ):
+        """Encode a thumbnail to the JPEG bytes kept in the store"""
+        if img.mode != 'RGB':
+            img = img.convert( 'RGB' )
+            
+        buffer = io.BytesIO()
+        img.save( buffer, format='JPEG', quality=90 )
+        return buffer.getvalue()
+    
+    def get_stamps( self, size ):
+        """Return {relative_path: (mtime, file_size)} for every stored thumbnail of this size - no image data is read"""
+        try:
+            with self._lock:
+                rows = self.conn.execute(
+                    "SELECT relative_path, mtime, file_size FROM thumbnails WHERE size_key = ?",
+                    (f"{size[0]}x{size[1]}",) ).fetchall()
+            return {row[0]: (row[1], row[2]) for row in rows}
+        except Exception as e:
+            print( f"Error reading thumbnail stamps: {e}" )
+            return {}
+    
+    def put( self, filepath, size, img ):
+        """Encode and store a thumbnail for the given file"""
+        try:
+            self.put_data( filepath, size, self.encode( img ) )
+        except Exception as e:
+            print( f"Error storing thumbnail for {filepath}: {e}" )
+    
+    def put_data( self, filepath, size, data ):
+        """Store already encoded thumbnail bytes for the given file"""
+        try:
+            stat = os.stat( filepath )
+            
+            with self._lock:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO thumbnails (relative_path, size_key, mtime, file_size, data) VALUES (?, ?, ?, ?, ?)",
+                    (self.relative_key( filepath ), f"{size[0]}x{size[1]}", stat.st_mtime, stat.st_size, data) )
+                    
+                self._pending_writes += 1
+                if self._pending_writes >= self.commit_interval:
+                    self.conn.commit()
+                    self._pending_writes = 0
+                elif self._pending_writes == 1:
+                    # The open transaction blocks every other writer - never leave a partial batch pending for long
+                    self._flush_timer = threading.Timer( self.commit_delay, self.flush )
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
+                    
+        except Exception as e:
+            print( f"Error storing thumbnail for {filepath}: {e}" )
+    
+    def flush( self ):
+        """Commit any pending thumbnail writes"""
+        try:
+            with self._lock:
+                if self._pending_writes:
+                    self.conn.commit()
+                    self._pending_writes = 0
+        except Exception as e:
+            print( f"Error flushing thumbnail store: {e}" )
+    
+    def close( self ):
+        """Flush pending writes and close the store"""
+        if self._flush_timer:
+            self._flush_timer.cancel()
+        self.flush()
+        try:
+            with self._lock:
+                self.conn.close()
+        except Exception as e:
+            print( f"Error closing thumbnail store: {e}" )
+
+class CatalogConnections:
+    """Long-lived connections to a catalog database - one read connection per thread and a single shared writer"""
+    
+    def __init__( self, database_path, cache_size_mb=64, mmap_size_mb=256 ):
+        self.database_path = database_path
+        self.cache_size_mb = cache_size_mb  # Page cache per connection
+        self.mmap_size_mb = mmap_size_mb  # Memory-mapped reads skip a copy through the page cache
+        
+        self._local = threading.local()
+        self._readers = []  # Every per-thread reader, so close() can reach them
+        self._lock = threading.Lock()
+        self._write_lock = threading.RLock()  # Write transactions on the shared writer run one at a time
+        self._closed = False
+        
+        # WAL lets readers carry on while a scan or bulk tag operation is writing
+        self._writer = self._connect()
+        self._writer.execute( "PRAGMA journal_mode=WAL" )
+    
+    def _connect( self, query_only=False ):
+        """Open a connection with the catalog pragmas applied"""
+        conn = sqlite3.connect( self.database_path, timeout=30, check_same_thread=False )
+        conn.execute( "PRAGMA synchronous=NORMAL" )
+        conn.execute( f"PRAGMA cache_size=-{self.cache_size_mb * 1024}" )  # Negative values are KiB
+        conn.execute( f"PRAGMA mmap_size={self.mmap_size_mb * 1024 * 1024}" )
+        conn.execute( "PRAGMA temp_store=MEMORY" )
+        if query_only:
+            conn.execute( "PRAGMA query_only=ON" )
+        return conn
+    
+    def reader( self ):
+        """Return the calling thread's read-only connection, opening it on first use"""
+        if self._closed:
+            raise sqlite3.ProgrammingError( "Catalog connections are closed" )
+            
+        conn = getattr( self._local, 'conn', None )
+        if conn is None:
+            conn = self._connect( query_only=True )
+            self._local.conn = conn
+            with self._lock:
+                self._readers.append( conn )
+        return conn
+    
+    @contextmanager
+    def write( self ):
+        """Run a write transaction on the shared writer - commits on success, rolls back on error"""
+        with self._write_lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError( "Catalog connections are closed" )
+                
+            try:
+                yield self._writer
+                self._writer.commit()
+            except Exception:
+                self._writer.rollback()
+                raise
+    
+    def close( self ):
+        """Close the writer and every per-thread reader"""
+        with self._write_lock, self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            
+            for conn in self._readers + [self._writer]:
+                try:
+                    conn.close()
+                except Exception as e:
+                    print( f"Error closing catalog connection: {e}" )
+            self._readers.clear()
+
+class CatalogFilterIndex:
+    """In-memory rating and tag index over a catalog - filters are int bitset operations instead of nested tag SQL"""
+    
+    def __init__( self, base_directory ):
+        self.base_directory = base_directory
+        self.items = []  # Item dicts in list order (filename, id), shared with the image list
+        self.ids = []  # Image id per position
+        self._positions_by_path = {}  # relative_path -> positions (the catalog can hold duplicate rows for a path)
+        self.rating_bits = {}  # rating -> bitset of positions (None for unrated rows, which no rating range matches)
+        self.tag_bits = {}  # tag name -> bitset of positions
+        self.removed_bits = 0  # Positions deleted from the catalog since the load
+        self.generation = 0  # Bumped on every change
+    
+    def load( self, conn, show_thumbnails=True ):
+        """Read every image and tag link from the catalog - run off the Tk thread for large catalogs"""
+        rating_positions = {}
+        position_by_id = {}
+        
+        cursor = conn.execute( "SELECT id, relative_path, filename, orientation, width, height, rating FROM images ORDER BY filename COLLATE NOCASE, id" )
+        for position, (image_id, relative_path, filename, orientation, width, height, rating) in enumerate( cursor ):
+            self.items.append( {
+                'id': image_id,
+                'filename': filename,
+                'filepath': os.path.join( self.base_directory, relative_path ) if relative_path else None,
+                'orientation': orientation,
+                'width': width,
+                'height': height,
+                'show_thumbnails': show_thumbnails
+            } )
+            self.ids.append( image_id )
+            self._positions_by_path.setdefault( relative_path, [] ).append( position )
+            position_by_id[image_id] = position
+            rating_positions.setdefault( rating, [] ).append( position )
+            
+        tag_positions = {}
+        cursor = conn.execute( "SELECT it.image_id, t.name FROM image_tags it JOIN tags t ON it.tag_id = t.id" )
+        for image_id, name in cursor:
+            position = position_by_id.get( image_id )
+            if position is not None:
+                tag_positions.setdefault( name, [] ).append( position )
+                
+        self.rating_bits = {rating: self._bits( positions ) for rating, positions in rating_positions.items()}
+        self.tag_bits = {name: self._bits( positions ) for name, positions in tag_positions.items()}
+        self.generation += 1
+    
+    def _bits( self, positions ):
+        """Build a bitset with the given positions set"""
+        buffer = bytearray( (len( self.items ) + 7) // 8 )
+        for position in positions:
+            buffer[position >> 3] |= 1 << (position & 7)
+        return int.from_bytes( buffer, 'little' )
+    
+    def filter( self, min_rating, max_rating, or_tags, and_tags, excluded_tags, show_thumbnails=True ):
+        """Return the item dicts matching the filters in list order - same semantics as the filter SQL"""
+        mask = ((1 << len( self.items )) - 1) & ~self.removed_bits
+        
+        if min_rating > 0 or max_rating < 10:
+            rating_mask = 0
+            for rating, bits in self.rating_bits.items():
+                if rating is not None and min_rating <= rating <= max_rating:
+                    rating_mask |= bits
+            mask &= rating_mask
+            
+        for name in excluded_tags:
+            mask &= ~self.tag_bits.get( name, 0 )
+        
+        # Include (OR) and include (AND) groups are alternatives, like the OR-joined SQL conditions
+        if or_tags or and_tags:
+            include_mask = 0
+            for name in or_tags:
+                include_mask |= self.tag_bits.get( name, 0 )
+            if and_tags:
+                and_mask = mask
+                for name in and_tags:
+                    and_mask &= self.tag_bits.get( name, 0 )
+                include_mask |= and_mask
+            mask &= include_mask
+        
+        # Lowest bit first, as 0/1 flag bytes for compress
+        flags = bin( mask )[:1:-1].encode().translate( self._FLAG_TABLE )
+        items = list( compress( self.items, flags ) )
+        
+        # The list toggles thumbnails on the shared dicts too, so always set the flag
+        for item in items:
+            item['show_thumbnails'] = show_thumbnails
+        return items
+        
+    _FLAG_TABLE = bytes.maketrans( b'01', b'\x00\x01' )
+    
+    def update_images( self, conn, relative_paths ):
+        """Re-read rating and tags for images after a write and patch their bits"""
+        positions = sorted( {position for path in relative_paths for position in self._positions_by_path.get( path, () )} )
+        if not positions:
+            return
+        
+        # Clear the changed positions everywhere, then set them again from the catalog
+        keep = ~self._bits( positions )
+        for rating in self.rating_bits:
+            self.rating_bits[rating] &= keep
+        for name in self.tag_bits:
+            self.tag_bits[name] &= keep
+            
+        position_by_id = {self.ids[position]: position for position in positions}
+        image_ids = list( position_by_id )
+        found = set()
+        rating_positions = {}
+        tag_positions = {}
+        
+        # Stay under SQLite's bound parameter limit
+        for start in range( 0, len( image_ids ), 900 ):
+            batch = image_ids[start:start + 900]
+            placeholders = ','.join( ['?'] * len( batch ) )
+            
+            for image_id, rating in conn.execute( f"SELECT id, rating FROM images WHERE id IN ({placeholders})", batch ):
+                found.add( image_id )
+                rating_positions.setdefault( rating, [] ).append( position_by_id[image_id] )
+                
+            for image_id, name in conn.execute( f"SELECT it.image_id, t.name FROM image_tags it JOIN tags t ON it.tag_id = t.id WHERE it.image_id IN ({placeholders})", batch ):
+                tag_positions.setdefault( name, [] ).append( position_by_id[image_id] )
+                
+        for rating, rating_list in rating_positions.items():
+            self.rating_bits[rating] = self.rating_bits.get( rating, 0 ) | self._bits( rating_list )
+        for name, tag_list in tag_positions.items():
+            self.tag_bits[name] = self.tag_bits.get( name, 0 ) | self._bits( tag_list )
+        
+        # Rows that are gone were deleted
+        deleted = [position for image_id, position in position_by_id.items() if image_id not in found]
+        if deleted:
+            self.removed_bits |= self._bits( deleted )
+            
+        self.generation += 1
+
+class DecodePool:
+    """Fixed-size worker pool with a bounded job queue; results are collected for draining on the Tk thread"""
+    
+    def __init__( self, worker_count=None, max_pending=None ):
+        self.worker_count = worker_count or os.cpu_count() or 4
+        self.max_pending = max_pending or self.worker_count * 4
+        
+        self._jobs = queue.Queue( maxsize=self.max_pending )
+        self._results = deque()  # (key, result) tuples, appended by workers
+        self._in_flight = set()  # Keys submitted but not yet drained
+        self._lock = threading.Lock()
+        self._shutdown = False
+        
+        self._workers = []
+        for i in range( self.worker_count ):
+            worker = threading.Thread( target=self._worker_loop, name=f"DecodePool-{i}", daemon=True )
+            worker.start()
+            self._workers.append( worker )
+    
+    def _worker_loop( self ):
+        """Run jobs until a shutdown sentinel is received"""
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                break
+                
+            key, func, args = job
+            try:
+                result = func( *args )
+            except Exception as e:
+                print( f"Error in decode worker for {key}: {e}" )
+                result = None
+                
+            self._results.append( (key, result) )
+    
+    def has_capacity( self ):
+        """Check whether another job can be submitted without blocking"""
+        return not self._shutdown and not self._jobs.full()
+    
+    def submit( self, key, func, *args ):
+        """Queue a job; returns False when the queue is full (backpressure) or the key is already queued"""
+        if self._shutdown:
+            return False
+            
+        with self._lock:
+            if key in self._in_flight:
+                return False
+                
+            try:
+                self._jobs.put_nowait( (key, func, args) )
+            except queue.Full:
+                return False
+                
+            self._in_flight.add( key )
+            return True
+    
+    def is_pending( self, key ):
+        """Check whether a job for this key is queued, running or waiting to be drained"""
+        return key in self._in_flight
+    
+    def is_idle( self ):
+        """Check whether there is no queued, running or undrained work"""
+        return not self._in_flight and not self._results
+    
+    def drain( self, callback, max_items=None, time_budget=None ):
+        """Hand completed results to callback( key, result ) - call from the Tk thread only"""
+        drained = 0
+        deadline = time.perf_counter() + time_budget if time_budget is not None else None
+        while self._results and (max_items is None or drained < max_items):
+            # Out of time for this frame - the rest waits for the next tick
+            if deadline is not None and drained and time.perf_counter() >= deadline:
+                break
+                
+            key, result = self._results.popleft()
+            with self._lock:
+                self._in_flight.discard( key )
+                
+            try:
+                callback( key, result )
+            except Exception as e:
+                print( f"Error handling decode result for {key}: {e}" )
+            drained += 1
+            
+        return drained
+    
+    def clear_pending( self ):
+        """Drop queued jobs that have not started yet"""
+        with self._lock:
+            while True:
+                try:
+                    key, func, args = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                self._in_flight.discard( key )
+    
+    def shutdown( self ):
+        """Stop accepting work and let the workers exit"""
+        if self._shutdown:
+            return
+            
+        self._shutdown = True
+        self.clear_pending()
+        for worker in self._workers:
+            try:
+                self._jobs.put_nowait( None )
+            except queue.Full:
+                pass
+
+class ThumbnailDecoder:
+    """Format-aware thumbnail decoder that picks the cheapest decode path and shrinks before filtering"""
+    
+    # EXIF orientation value -> transpose that corrects it
+    ORIENTATION_TRANSPOSE = {
+        2: Image.Transpose.FLIP_LEFT_RIGHT,
+        3: Image.Transpose.ROTATE_180,
+        4: Image.Transpose.FLIP_TOP_BOTTOM,
+        5: Image.Transpose.TRANSPOSE,
+        6: Image.Transpose.ROTATE_270,
+        7: Image.Transpose.TRANSVERSE,
+        8: Image.Transpose.ROTATE_90
+    }
+    
+    def __init__( self, resample=Image.Resampling.LANCZOS, reducing_gap=2.0, use_embedded=True ):
+        self.resample = resample
+        self.reducing_gap = reducing_gap  # Pre-shrink stops at this multiple of the final size
+        self.use_embedded = use_embedded  # Prefer the EXIF IFD1 thumbnail when it is big enough
+    
+    def decode( self, filepath, size, apply_orientation=True, orientation=None ):
+        """Decode filepath into an RGB thumbnail that fits within size; pass orientation when the catalog already knows it"""
+        with Image.open( filepath ) as img:
+            return self.decode_image( img, size, apply_orientation, orientation )
+    
+    def decode_image( self, img, size, apply_orientation=True, orientation=None ):
+        """Decode an already opened image into an RGB thumbnail - img may be drafted in place, so read its size first"""
+        if not apply_orientation:
+            orientation = 1
+        elif orientation is None:
+            orientation = self.get_orientation( img )
+        
+        # Orientations 5-8 swap width and height, so shrink against the rotated box
+        target = (size[1], size[0]) if orientation >= 5 else size
+        
+        # Embedded EXIF thumbnail avoids decoding the main image entirely
+        embedded = self._embedded_thumbnail( img, target ) if self.use_embedded else None
+        
+        img = embedded if embedded is not None else self._shrink_on_load( img, target )
+        img = self._to_rgb( img )
+        
+        # Final high-quality filter only ever runs on a small image
+        img.thumbnail( target, self.resample, reducing_gap=None )
+        
+        return self.apply_orientation( img, orientation )
+    
+    def decode_sizes( self, img, sizes, apply_orientation=True, orientation=None ):
+        """Decode an opened image once for several sizes; smaller sizes are resampled from the largest result"""
+        order = sorted( range( len( sizes ) ), key=lambda i: sizes[i][0] * sizes[i][1], reverse=True )
+        results = [None] * len( sizes )
+        
+        largest = self.decode_image( img, sizes[order[0]], apply_orientation, orientation )
+        results[order[0]] = largest
+        for i in order[1:]:
+            # Already oriented, so the box is used as-is
+            thumb = largest.copy()
+            thumb.thumbnail( sizes[i], self.resample, reducing_gap=None )
+            results[i] = thumb
+            
+        return results
+    
+    def from_source( self, source, size ):
+        """Derive an RGB thumbnail from an already decoded, oriented image without modifying it"""
+        scale = min( size[0] / source.width, size[1] / source.height, 1.0 )
+        new_size = (max( 1, round( source.width * scale ) ), max( 1, round( source.height * scale ) ))
+        thumb = source.resize( new_size, self.resample, reducing_gap=self.reducing_gap )
+        return self._to_rgb( thumb )
+    
+    def get_orientation( self, img ):
+        """Read the EXIF orientation tag without decoding pixel data"""
+        try:
+            return img.getexif().get( 0x0112, 1 ) or 1
+        except Exception:
+            return 1
+    
+    def read_embedded_thumbnail( self, img ):
+        """Return the JPEG bytes of the IFD1 thumbnail from the image's APP1 segment, or None"""
+        exif = img.info.get( 'exif' )
+        if not exif or not exif.startswith( b'Exif\x00\x00' ):
+            return None
+            
+        try:
+            tiff = exif[6:]
+            if tiff[:2] == b'II':
+                endian = '<'
+            elif tiff[:2] == b'MM':
+                endian = '>'
+            else:
+                return None
+            
+            # IFD0 -> offset of the next IFD (IFD1) stored after its entries
+            ifd0_offset = struct.unpack_from( endian + 'I', tiff, 4 )[0]
+            entry_count = struct.unpack_from( endian + 'H', tiff, ifd0_offset )[0]
+            ifd1_offset = struct.unpack_from( endian + 'I', tiff, ifd0_offset + 2 + entry_count * 12 )[0]
+            if not ifd1_offset:
+                return None
+            
+            # Scan IFD1 for JPEGInterchangeFormat (0x0201) and JPEGInterchangeFormatLength (0x0202)
+            thumb_offset = thumb_length = None
+            entry_count = struct.unpack_from( endian + 'H', tiff, ifd1_offset )[0]
+            for i in range( entry_count ):
+                entry = ifd1_offset + 2 + i * 12
+                tag, value_type = struct.unpack_from( endian + 'HH', tiff, entry )
+                if value_type == 3:  # SHORT
+                    value = struct.unpack_from( endian + 'H', tiff, entry + 8 )[0]
+                else:
+                    value = struct.unpack_from( endian + 'I', tiff, entry + 8 )[0]
+                    
+                if tag == 0x0201:
+                    thumb_offset = value
+                elif tag == 0x0202:
+                    thumb_length = value
+                    
+            if not thumb_offset or not thumb_length:
+                return None
+                
+            data = tiff[thumb_offset:thumb_offset + thumb_length]
+            return data if data.startswith( b'\xff\xd8' ) else None
+            
+        except struct.error:
+            # Truncated or malformed EXIF block
+            return None
+    
+    def _embedded_thumbnail( self, img, target ):
+        """Decode the embedded EXIF thumbnail if it matches the image and covers the target size"""
+        if img.format != 'JPEG':
+            return None
+            
+        data = self.read_embedded_thumbnail( img )
+        if not data:
+            return None
+            
+        try:
+            thumb = Image.open( io.BytesIO( data ) )
+            thumb.load()
+        except Exception:
+            return None
+        
+        # Reject letterboxed thumbnails whose aspect ratio differs from the main image
+        image_aspect = img.width / img.height
+        thumb_aspect = thumb.width / thumb.height
+        if abs( thumb_aspect - image_aspect ) > image_aspect * 0.03:
+            return None
+        
+        # Too small - upscaling would look worse than a full decode
+        scale = min( target[0] / img.width, target[1] / img.height, 1.0 )
+        if thumb.width < int( img.width * scale ) or thumb.height < int( img.height * scale ):
+            return None
+            
+        return thumb
+    
+    def apply_orientation( self, img, orientation ):
+        """Correct orientation with a lossless transpose"""
+        method = self.ORIENTATION_TRANSPOSE.get( orientation )
+        return img.transpose( method ) if method is not None else img
+    
+    def _shrink_on_load( self, img, target ):
+        """Reduce the image as cheaply as the format allows before the final filter"""
+        pre_size = (max( 1, int( target[0] * self.reducing_gap ) ), max( 1, int( target[1] * self.reducing_gap ) ))
+        
+        if img.format == 'JPEG':
+            # DCT scaling - libjpeg decodes directly at 1/2, 1/4 or 1/8 size
+            img.draft( 'RGB' if img.mode in ('RGB', 'YCbCr') else img.mode, pre_size )
+            img.load()
+        
+        # Palette and bilevel images must be expanded before they can be averaged
+        if img.mode in ('P', '1'):
+            img = self._to_rgb( img )
+        
+        # Integer box reduction (PNG, TIFF, WebP and what DCT scaling left over) is far cheaper than a large LANCZOS pass
+        factor = min( img.width // pre_size[0], img.height // pre_size[1] )
+        if factor > 1:
+            try:
+                img = img.reduce( factor )
+            except ValueError:
+                # Mode not supported by reduce - fall back to a cheap box resize
+                img = img.resize( (max( 1, img.width // factor ), max( 1, img.height // factor )), Image.Resampling.BOX )
+        else:
+            img.load()
+            
+        return img
+    
+    def _to_rgb( self, img ):
+        """Convert to RGB, flattening transparency onto white"""
+        if img.mode == 'RGB':
+            return img
+            
+        if img.mode == 'P' and 'transparency' in img.info:
+            img = img.convert( 'RGBA' )
+            
+        if img.mode in ('RGBA', 'LA', 'PA'):
+            background = Image.new( 'RGB', img.size, (255, 255, 255) )
+            background.paste( img, mask=img.getchannel( 'A' ) )
+            return background
+            
+        return img.convert( 'RGB' )
+
+def build_thumbnail_data( filepath, sizes ):
+    """Process pool job - decode filepath once and return the encoded thumbnail for each size, or None on failure"""
+    try:
+        with Image.open( filepath ) as img:
+            thumbs = ThumbnailDecoder().decode_sizes( img, sizes )
+        return [ThumbnailStore.encode( thumb ) for thumb in thumbs]
+    except Exception as e:
+        print( f"Error building thumbnail for {filepath}: {e}" )
+        return None
+
+def estimate_image_bytes( value ):
+    """Estimate the pixel memory held by a PhotoImage or PIL image"""
+    try:
+        if isinstance( value, Image.Image ):
+            return value.width * value.height * len( value.getbands() )
+        if hasattr( value, 'width' ) and hasattr( value, 'height' ):
+            # Tk photo images are stored as 32-bit RGBA
+            return value.width() * value.height() * 4
+    except Exception:
+        pass
+    return 1024
+
+class LRUImageCache:
+    """Dict-like LRU cache with a byte budget, owned by an ImageCacheManager"""
+    
+    def __init__( self, manager, name, budget_bytes, max_entries=None, size_func=None, on_evict=None ):
+        self.manager = manager
+        self.name = name
+        self.budget_bytes = budget_bytes
+        self.max_entries = max_entries
+        self.size_func = size_func or estimate_image_bytes
+        self.on_evict = on_evict  # Called as on_evict( key, value ) after an eviction
+        
+        self._entries = OrderedDict()  # key -> (value, size_bytes), oldest first
+        self.current_bytes = 0
+        
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __contains__( self, key ):
+        return key in self._entries
+    
+    def __len__( self ):
+        return len( self._entries )
+    
+    def __getitem__( self, key ):
+        value = self.get( key )
+        if value is None and key not in self._entries:
+            raise KeyError( key )
+        return value
+    
+    def __setitem__( self, key, value ):
+        self.put( key, value )
+    
+    def __delitem__( self, key ):
+        if self.pop( key, None ) is None:
+            raise KeyError( key )
+    
+    def keys( self ):
+        return list( self._entries.keys() )
+    
+    def get( self, key, default=None ):
+        """Return a cached value and mark it most recently used"""
+        with self.manager.lock:
+            entry = self._entries.get( key )
+            if entry is None:
+                self.misses += 1
+                return default
+            self._entries.move_to_end( key )
+            self.hits += 1
+            return entry[0]
+    
+    def put( self, key, value, size_bytes=None ):
+        """Insert or replace a value, then evict until budgets are met"""
+        if size_bytes is None:
+            size_bytes = self.size_func( value )
+            
+        evicted = []
+        with self.manager.lock:
+            old = self._entries.pop( key, None )
+            if old is not None:
+                self.current_bytes -= old[1]
+                
+            self._entries[key] = (value, size_bytes)
+            self.current_bytes += size_bytes
+            
+            # Own budget first, then the shared ceiling
+            while len( self._entries ) > 1 and (self.current_bytes > self.budget_bytes or
+                                               (self.max_entries and len( self._entries ) > self.max_entries)):
+                evicted.append( self._evict_oldest() )
+            evicted.extend( self.manager._enforce_ceiling() )
+            
+        self.manager._notify_evicted( evicted )
+    
+    def pop( self, key, default=None ):
+        """Remove a value without counting it as an eviction"""
+        with self.manager.lock:
+            entry = self._entries.pop( key, None )
+            if entry is None:
+                return default
+            self.current_bytes -= entry[1]
+            return entry[0]
+    
+    def clear( self ):
+        """Drop every entry"""
+        with self.manager.lock:
+            self._entries.clear()
+            self.current_bytes = 0
+    
+    def _evict_oldest( self ):
+        """Remove the least recently used entry - caller holds the manager lock"""
+        key, (value, size_bytes) = self._entries.popitem( last=False )
+        self.current_bytes -= size_bytes
+        self.evictions += 1
+        return (self, key, value)
+    
+    def stats( self ):
+        """Return counters for this cache"""
+        return {
+            'entries': len( self._entries ),
+            'bytes': self.current_bytes,
+            'budget_bytes': self.budget_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+class ImageCacheManager:
+    """Registry for all image caches that keeps their combined pixel footprint under one ceiling"""
+    
+    def __init__( self, max_bytes=256 * 1024 * 1024 ):
+        self.max_bytes = max_bytes
+        self.lock = threading.RLock()  # Shared by all caches - thumbnails are inserted from worker threads
+        self._caches = {}
+    
+    def register( self, name, budget_fraction, max_entries=None, size_func=None, on_evict=None ):
+        """Create a named cache whose byte budget is a fraction of the ceiling"""
+        cache = LRUImageCache( self, name, int( self.max_bytes * budget_fraction ), max_entries, size_func, on_evict )
+        with self.lock:
+            self._caches[name] = cache
+        return cache
+    
+    def get_cache( self, name ):
+        """Look up a registered cache by name"""
+        return self._caches.get( name )
+    
+    def total_bytes( self ):
+        """Combined footprint of every registered cache"""
+        return sum( cache.current_bytes for cache in self._caches.values() )
+    
+    def set_max_bytes( self, max_bytes ):
+        """Change the ceiling, rescaling every cache budget proportionally"""
+        with self.lock:
+            ratio = max_bytes / self.max_bytes if self.max_bytes else 1.0
+            self.max_bytes = max_bytes
+            for cache in self._caches.values():
+                cache.budget_bytes = int( cache.budget_bytes * ratio )
+            evicted = self._enforce_ceiling()
+        self._notify_evicted( evicted )
+    
+    def _enforce_ceiling( self ):
+        """Evict from the cache furthest over its budget until under the ceiling - caller holds the lock"""
+        evicted = []
+        while self.total_bytes() > self.max_bytes:
+            candidates = [cache for cache in self._caches.values() if cache._entries]
+            if not candidates:
+                break
+            cache = max( candidates, key=lambda c: c.current_bytes / max( 1, c.budget_bytes ) )
+            evicted.append( cache._evict_oldest() )
+        return evicted
+    
+    def _notify_evicted( self, evicted ):
+        """Run eviction callbacks outside the lock"""
+        for cache, key, value in evicted:
+            if cache.on_evict:
+                try:
+                    cache.on_evict( key, value )
+                except Exception as e:
+                    print( f"Error in eviction callback for {cache.name}: {e}" )
+    
+    def clear( self ):
+        """Empty every registered cache"""
+        with self.lock:
+            for cache in self._caches.values():
+                cache.clear()
+    
+    def stats( self ):
+        """Return per-cache counters plus totals"""
+        with self.lock:
+            stats = {name: cache.stats() for name, cache in self._caches.items()}
+            stats['total'] = {'bytes': self.total_bytes(), 'max_bytes': self.max_bytes}
+            return stats
+
+class DecodedImageCache:
+    """Shared cache of decoded, orientation-corrected source images so preview, fullscreen and thumbnails decode a file once"""
+    
+    def __init__( self, cache, decoder, min_source_size=(0, 0) ):
+        self.cache = cache  # LRUImageCache holding filepath -> (image, original_size)
+        self.decoder = decoder
+        self.min_source_size = min_source_size  # Sources cover at least this box so fullscreen can reuse them
+    
+    def _covers( self, entry, size ):
+        """Check whether a cached source can be scaled into size without upscaling a reduced decode"""
+        image, original_size = entry
+        if image.width * image.height >= original_size[0] * original_size[1]:
+            return True
+        return min( size[0] / image.width, size[1] / image.height ) <= 1.0
+    
+    def get( self, filepath, size ):
+        """Return (image, original_size) if a cached source covers size, otherwise None"""
+        entry = self.cache.get( filepath )
+        if entry and self._covers( entry, size ):
+            return entry
+        return None
+    
+    def load( self, filepath, size, orientation=None ):
+        """Return (image, original_size) covering size, decoding only when no cached source is large enough"""
+        entry = self.get( filepath, size )
+        if entry:
+            return entry
+            
+        box = (max( size[0], self.min_source_size[0] ), max( size[1], self.min_source_size[1] ))
+        with Image.open( filepath ) as image:
+            original_size = image.size
+            # Catalog images pass the orientation recorded at scan time - only unknown files parse EXIF here
+            if orientation is None:
+                orientation = self.decoder.get_orientation( image )
+            
+            # Size the image will be shown at, in stored (unrotated) pixels - orientations 5-8 swap the axes
+            width, height = (original_size[1], original_size[0]) if orientation >= 5 else original_size
+            scale = min( box[0] / width, box[1] / height )
+            fit = None
+            if scale < 1.0:
+                fit = (max( 1, int( width * scale ) ), max( 1, int( height * scale ) ))
+                if orientation >= 5:
+                    fit = (fit[1], fit[0])
+                # JPEG DCT scaling to the smallest 1/2, 1/4 or 1/8 decode that still covers it
+                image.draft( 'RGB', fit )
+                
+            image.load()
+            source = image
+            if fit:
+                # Formats without draft decode at full size - box-reduce by the integer factor that still covers fit
+                factor = int( min( image.width / fit[0], image.height / fit[1] ) )
+                if factor >= 2:
+                    # Palette and bilevel pixels are indexes, not intensities - expand them before averaging
+                    if image.mode == 'P':
+                        source = image.convert( 'RGBA' if 'transparency' in image.info else 'RGB' )
+                    elif image.mode == '1':
+                        source = image.convert( 'L' )
+                    try:
+                        source = source.reduce( factor )
+                    except ValueError:
+                        # Mode not supported by reduce (I;16 and friends) - fall back to a cheap box resize
+                        source = source.resize( (max( 1, source.width // factor ), max( 1, source.height // factor )), Image.Resampling.BOX )
+            source = self.decoder.apply_orientation( source, orientation )
+            
+        entry = (source, original_size)
+        self.cache.put( filepath, entry )
+        return entry
+    
+    def thumbnail( self, filepath, size ):
+        """Derive a thumbnail from a cached source, or None - never decodes, thumbnails have cheaper paths"""
+        entry = self.cache.get( filepath )
+        return self.decoder.from_source( entry[0], size ) if entry else None
 
 class TreeviewImageList:
     """Treeview-based image list that handles large datasets without coordinate limits"""
     
-    def __init__( self, parent, item_height=50 ):
+    def __init__( self, parent, item_height=50, decode_workers=None, cache_manager=None ):
         self.parent = parent
         self.item_height = item_height
         
@@ -32,40 +949,59 @@ class TreeviewImageList:
         # Data storage
         self.items = []
         self.filtered_items = []
+        self._items_by_path = {}  # filepath -> item dict, for metadata recorded at scan time
         
         # Selection tracking
         self.selected_indices = set()
         self.selection_callbacks = []
         self.last_clicked_index = None
         
-        # Thumbnail support
-        self._thumbnail_cache = {}
-        self._thumbnail_references = {}  # Keep references to prevent garbage collection
+        # Thumbnail support - caches are LRU and byte-budgeted by the shared cache manager
+        self.cache_manager = cache_manager or ImageCacheManager()
+        self._thumbnail_cache = self.cache_manager.register( 'list_thumbnails', 0.15 )
+        # Keep references to prevent garbage collection; photos are shared with _thumbnail_cache so they count as zero bytes
+        self._thumbnail_references = self.cache_manager.register( 'list_row_images', 0.0, max_entries=2000,
+                                                                  size_func=lambda photo: 0, on_evict=self._on_row_image_evicted )
         self.thumbnail_load_queue = deque()
         self.thumbnail_loading = False
-        self.max_cache_size = 500
+        
+        # Fixed-size decode pool (defaults to one worker per core); results are applied by a single drain callback
+        self.decode_pool = DecodePool( decode_workers )
+        self._drain_after_id = None
+        self.thumbnail_decoder = ThumbnailDecoder()
         
         # Priority-based thumbnail loading for TreeviewImageList
         self.priority_thumbnail_queue = []  # List of (priority, filepath, item_id) tuples
         self.visible_item_range = (0, 0)  # Track visible item range
         self.last_visible_center = -1  # Track scroll jumps
         self.thumbnail_size = (48, 48)  # Smaller to fit better in treeview rows
-        self.cached_visible_items = []  # Cache visible items to avoid repeated bbox calls
-        self.last_visible_update = 0  # Track when visible items were last updated
-        self._processing_priority = False  # Flag to track if priority processing is active
-        self._verifying_thumbnails = False  # Flag to prevent multiple simultaneous verifications
+        self._viewport_range = None  # Cached (first, last) visible index, reset on scroll/resize/refresh
+        self._processing_priority = False  # Flag to track if the single loader is active
+        self._failed_thumbnails = set()  # Filepaths that could not be decoded - not retried
+        
+        # Row ids are reused ("0".."N") on every refresh, so decode work is tagged with the list generation
+        self.generation = 0  # Bumped whenever filtered_items is rebuilt (filter, sort, set_items)
+        self._wanted_items = set()  # Row ids the current viewport still wants - checked by workers before decoding
         
-        # Debouncing for thumbnail loading
+        # Debouncing for thumbnail loading - scroll, resize, refresh and tab changes all request a collection pass
         self.thumbnail_load_delay = 200  # ms delay before loading (increased for large datasets)
-        self.pending_thumbnail_loads = {}  # {item_id: after_id}
-        self.last_scroll_time = 0
+        self._visibility_after_id = None
+        
+        # Decoded thumbnails are applied in batches on a frame-paced tick so scrolling stays smooth
+        self.apply_frame_interval = 16  # ms between apply ticks (~60 fps)
+        self.apply_time_budget = 0.008  # seconds of PhotoImage conversion per tick, leaving room to redraw
+        
+        # Predictive prefetch - scroll velocity decides how far ahead to queue and which rows will fly past
+        self.preload_range = 20  # Rows preloaded around the viewport when not scrolling
+        self.prefetch_interval = 50  # ms between prefetch passes while scrolling
+        self.prefetch_latency = 0.15  # Seconds from request to a thumbnail being on screen
+        self.prefetch_lookahead = 0.5  # Seconds of travel to queue beyond the predicted viewport
+        self._scroll_samples = deque( maxlen=8 )  # (time, first visible row) recorded from yscrollcommand
+        self._prefetch_after_id = None
         
         # Create UI components
         self.setup_ui()
         
-        # Start periodic verification for visible thumbnails
-        self.start_periodic_verification()
-        
     def setup_ui( self ):
         """Setup the treeview-based list UI"""
         # Main frame
@@ -84,7 +1020,9 @@ class TreeviewImageList:
         scrollbar_frame = tk.Frame( self.frame, width=25, bg='lightgray' )
         scrollbar_frame.pack_propagate( False )  # Don't shrink to contents
         scrollbar = tk.Scrollbar( scrollbar_frame, orient="vertical", command=self.treeview.yview, width=25, bg='lightgray', troughcolor='white' )
-        self.treeview.configure( yscrollcommand=scrollbar.set )
+        self.scrollbar = scrollbar
+        # Route view changes through the list so the cached viewport is invalidated on every kind of scroll
+        self.treeview.configure( yscrollcommand=self.on_yview_changed )
         
         # Pack components
         self.treeview.pack( side="left", fill="both", expand=True )
@@ -104,21 +1042,54 @@ class TreeviewImageList:
         self.treeview.bind( "<MouseWheel>", self.on_scroll )
         scrollbar.bind( "<ButtonRelease-1>", self.on_scroll_release )
         
+        # Viewport size changes alter which rows are visible
+        self.treeview.bind( "<Configure>", self.on_treeview_resize )
+        
         # Also bind Ctrl+A to the main frame for better accessibility
         self.frame.bind( "<Control-a>", self.select_all )
         self.frame.bind( "<Control-A>", self.select_all )
         
+    def get_item_for_path( self, filepath ):
+        """Look up the catalog item dict for a filepath, or None"""
+        return self._items_by_path.get( filepath )
+    
     def set_items( self, items ):
         """Set the list of items to display"""
         self.items = items
         self.filtered_items = items[:]
+        self._items_by_path = {item.get( 'filepath' ): item for item in items}
         self.selected_indices.clear()
+        self._failed_thumbnails.clear()
         self.refresh_treeview()
         
         # Update status if main app is available
         if self.main_app and hasattr( self.main_app, 'update_image_list_status' ):
             self.main_app.update_image_list_status()
         
+    def append_items( self, items ):
+        """Append items after the existing rows without rebuilding them - used while a catalog streams in"""
+        start_index = len( self.filtered_items )
+        self.items.extend( items )
+        self.filtered_items.extend( items )
+        for item in items:
+            self._items_by_path[item.get( 'filepath' )] = item
+            
+        for i, item_data in enumerate( items, start_index ):
+            item_id = str( i )
+            self.treeview.insert( '', 'end', iid=item_id, text=item_data.get( 'filename', 'Unknown' ) )
+            
+            # Only set cached thumbnails immediately
+            filepath = item_data.get( 'filepath' )
+            if item_data.get( 'show_thumbnails', False ) and filepath:
+                cached_photo = self._thumbnail_cache.get( filepath )
+                if cached_photo:
+                    self.treeview.item( item_id, image=cached_photo )
+                    self._thumbnail_references[item_id] = cached_photo
+        
+        # Row count changed - the cached viewport no longer matches the scrollbar
+        self.invalidate_viewport()
+        self.request_visible_thumbnails()
+    
     def filter_items( self, filter_func=None ):
         """Filter items based on a function"""
         if filter_func:
@@ -137,6 +1108,7 @@ class TreeviewImageList:
         """Refresh the treeview with current filtered items"""
         # Clear thumbnail references before deleting items
         self._thumbnail_references.clear()
+        self.invalidate_viewport()
         # Clear existing items
         for item in self.treeview.get_children():
             self.treeview.delete( item )
@@ -147,8 +1119,22 @@ class TreeviewImageList:
         else:
             self.refresh_treeview_immediate()
     
+    def _start_new_generation( self ):
+        """Invalidate all queued, in-flight and displayed thumbnail work for the previous list contents"""
+        self.generation += 1
+        self._scroll_samples.clear()
+        self.priority_thumbnail_queue = []
+        self.thumbnail_load_queue.clear()
+        self._wanted_items = set()
+        # Queued jobs are dropped outright; running ones finish but their result is discarded on apply
+        self.decode_pool.clear_pending()
+        self._thumbnail_references.clear()
+        self.invalidate_viewport()
+    
     def refresh_treeview_immediate( self ):
         """Immediate refresh for smaller datasets"""
+        self._start_new_generation()
+        
         # Add filtered items
         for i, item_data in enumerate( self.filtered_items ):
             filename = item_data.get( 'filename', 'Unknown' )
@@ -162,19 +1148,22 @@ class TreeviewImageList:
             # Only set cached thumbnails immediately, don't queue all items
             if show_thumbnails and filepath and os.path.exists( filepath ):
                 # Check if thumbnail is already cached
-                if filepath in self._thumbnail_cache:
+                cached_photo = self._thumbnail_cache.get( filepath )
+                if cached_photo:
                     # Use cached thumbnail immediately
                     try:
-                        self.treeview.item( item_id, image=self._thumbnail_cache[filepath] )
+                        self.treeview.item( item_id, image=cached_photo )
+                        self._thumbnail_references[item_id] = cached_photo
                     except Exception as e:
                         print( f"CACHED: Error applying cached thumbnail for {item_id}: {e}" )
         
         # After adding all items, load thumbnails for visible items only
-        if any( item_data.get( 'show_thumbnails', False ) for item_data in self.filtered_items ):
-            self.parent.after( 100, self.load_initial_visible_thumbnails )
+        self.request_visible_thumbnails( 100 )
     
     def refresh_treeview_chunked( self ):
         """Chunked refresh for large datasets to prevent UI blocking"""
+        self._start_new_generation()
+        
         self.chunked_refresh_data = {
             'current_index': 0,
             'chunk_size': 2000,  # Process 2000 items at a time for better speed
@@ -207,9 +1196,11 @@ class TreeviewImageList:
             
             # Only set cached thumbnails immediately
             if show_thumbnails and filepath and os.path.exists( filepath ):
-                if filepath in self._thumbnail_cache:
+                cached_photo = self._thumbnail_cache.get( filepath )
+                if cached_photo:
                     try:
-                        self.treeview.item( item_id, image=self._thumbnail_cache[filepath] )
+                        self.treeview.item( item_id, image=cached_photo )
+                        self._thumbnail_references[item_id] = cached_photo
                     except Exception as e:
                         print( f"CACHED: Error applying cached thumbnail for {item_id}: {e}" )
         
@@ -263,48 +1254,138 @@ class TreeviewImageList:
             self.main_app.update_image_list_status()
         
         # Start thumbnail loading for visible items
-        if any( item_data.get( 'show_thumbnails', False ) for item_data in self.filtered_items ):
-            self.parent.after( 100, self.load_initial_visible_thumbnails )
+        self.request_visible_thumbnails( 100 )
+    
+    def request_visible_thumbnails( self, delay=None ):
+        """Mark the viewport as needing thumbnails; one collection pass runs after the debounce delay"""
+        if self._visibility_after_id is not None:
+            self.parent.after_cancel( self._visibility_after_id )
+        if delay is None:
+            delay = self.thumbnail_load_delay
+        self._visibility_after_id = self.parent.after( delay, self._collect_visible_thumbnails )
+    
+    def _collect_visible_thumbnails( self ):
+        """Debounced collection pass once scrolling settles"""
+        self._visibility_after_id = None
+        self._update_thumbnail_window()
+    
+    def get_scroll_velocity( self ):
+        """Signed scroll speed in rows per second over the recent samples - 0 once scrolling has paused"""
+        if len( self._scroll_samples ) < 2:
+            return 0.0
+            
+        last_time, last_row = self._scroll_samples[-1]
+        if time.perf_counter() - last_time > 0.15:
+            return 0.0
+        
+        # Oldest sample within the last 250ms smooths out uneven wheel steps
+        for sample_time, sample_row in self._scroll_samples:
+            if last_time - sample_time <= 0.25:
+                break
+                
+        elapsed = last_time - sample_time
+        return (last_row - sample_row) / elapsed if elapsed > 0 else 0.0
+    
+    def _schedule_prefetch( self ):
+        """Throttled (not debounced) prefetch pass so thumbnails are queued while the scroll is still moving"""
+        if self._prefetch_after_id is None:
+            self._prefetch_after_id = self.parent.after( self.prefetch_interval, self._run_prefetch )
+    
+    def _run_prefetch( self ):
+        """Prefetch pass - requeue for the predicted viewport and keep going while the scroll moves"""
+        self._prefetch_after_id = None
+        if self.get_scroll_velocity():
+            self._update_thumbnail_window()
+            self._schedule_prefetch()
+    
+    def get_thumbnail_window( self, visible_start, visible_end ):
+        """Rows to load for the current scroll motion as (load_start, load_end, focus_row)"""
+        velocity = self.get_scroll_velocity()
+        speed = abs( velocity )
+        visible_rows = visible_end - visible_start + 1
+        
+        # Extra rows queued in the direction of travel, scaled by speed but capped so a fling doesn't queue thousands
+        ahead = self.preload_range + min( int( speed * self.prefetch_lookahead ), visible_rows * 3 )
+        behind = self.preload_range if not velocity else self.preload_range // 4
+        
+        # Faster than a screenful per second - rows that pass before a decode could land are skipped entirely
+        lead = int( speed * self.prefetch_latency ) if speed >= visible_rows else 0
+        
+        if velocity >= 0:
+            if lead:
+                load_start, load_end = visible_start + lead, visible_end + lead + ahead
+            else:
+                load_start, load_end = visible_start - behind, visible_end + ahead
+        else:
+            if lead:
+                load_start, load_end = visible_start - lead - ahead, visible_end - lead
+            else:
+                load_start, load_end = visible_start - ahead, visible_end + behind
+        
+        # Where the viewport is expected to be when these thumbnails arrive
+        focus_row = (visible_start + visible_end) // 2 + (lead if velocity >= 0 else -lead)
+        
+        last_index = len( self.filtered_items ) - 1
+        return max( 0, load_start ), min( last_index, load_end ), max( 0, min( last_index, focus_row ) )
     
-    def load_initial_visible_thumbnails( self ):
-        """Load thumbnails for initially visible items and preload adjacent ones"""
+    def _update_thumbnail_window( self ):
+        """Build the needs-thumbnails set for the predicted viewport and hand it to the loader"""
         try:
             # Skip thumbnail loading if main app is in performance mode
             if self.main_app and hasattr( self.main_app, 'performance_mode' ) and self.main_app.performance_mode:
                 return
-            # Get actually visible items
-            visible_items = self.get_visible_treeview_items()
             
-            if visible_items:
-                visible_indices = [int(item) for item in visible_items if item.isdigit()]
+            # Hidden (e.g. another tab is active) - the tab change will request again
+            if not self.treeview.winfo_ismapped():
+                return
                 
-                if visible_indices:
-                    visible_start = min( visible_indices )
-                    visible_end = max( visible_indices )
-                    
-                    # Define preload range for initial load
-                    preload_range = 20
-                    load_start = max( 0, visible_start - preload_range )
-                    load_end = min( len( self.filtered_items ) - 1, visible_end + preload_range )
+            visible_range = self.get_visible_range()
+            if not visible_range:
+                return
+                
+            visible_start, visible_end = visible_range
+            load_start, load_end, focus_row = self.get_thumbnail_window( visible_start, visible_end )
+            half_height = (visible_end - visible_start) // 2
+            
+            needed = []
+            wanted = set()
+            for index in range( load_start, load_end + 1 ):
+                item_data = self.filtered_items[index]
+                filepath = item_data.get( 'filepath' )
+                if not filepath or not item_data.get( 'show_thumbnails', False ):
+                    continue
+                
+                # Already displayed, in flight, or known to fail - O(1) checks, no queue scans
+                item_id = str( index )
+                wanted.add( item_id )
+                if (item_id in self._thumbnail_references or
+                    self.decode_pool.is_pending( (self.generation, item_id) ) or
+                    filepath in self._failed_thumbnails):
+                    continue
                     
-                    # Queue thumbnails for visible + preload range
-                    for index in range( load_start, load_end + 1 ):
-                        if index < len( self.filtered_items ):
-                            item_data = self.filtered_items[index]
-                            filepath = item_data.get( 'filepath' )
-                            show_thumbnails = item_data.get( 'show_thumbnails', False )
-                            item_id = str( index )
-                            
-                            if show_thumbnails and filepath and os.path.exists( filepath ):
-                                if filepath not in self._thumbnail_cache:
-                                    # Queue for priority loading
-                                    self.queue_thumbnail_load( filepath, item_id )
-                                
+                # Rows on the (predicted) screen first, then outward from it
+                distance = abs( index - focus_row )
+                priority = distance if distance <= half_height else 100 + distance
+                needed.append( (priority, filepath, item_id) )
+            
+            # The needs set for the current viewport replaces whatever was queued for an old position
+            import heapq
+            heapq.heapify( needed )
+            self.priority_thumbnail_queue = needed
+            # Queued jobs for rows outside this window are skipped by the workers
+            self._wanted_items = wanted
+            
+            if needed:
+                self._start_thumbnail_loader()
+                
         except Exception as e:
-            print( f"Error loading initial visible thumbnails: {e}" )
-        
-        # Verify all visible items are covered after initial load
-        self.parent.after( 300, self.verify_visible_thumbnails_loaded )
+            print( f"Error collecting visible thumbnails: {e}" )
+    
+    def _start_thumbnail_loader( self ):
+        """Make sure the single thumbnail loader is running"""
+        if not self._processing_priority:
+            self._processing_priority = True
+            self.parent.after( 1, self._process_priority_thumbnail_load )
             
     def on_selection_changed( self, event ):
         """Handle treeview selection changes"""
@@ -380,141 +1461,185 @@ class TreeviewImageList:
         return self._thumbnail_cache
         
     def load_thumbnail( self, filepath ):
-        """Load and cache a thumbnail for the given filepath"""
-        if filepath in self._thumbnail_cache:
-            return self._thumbnail_cache[filepath]
+        """Load and cache a thumbnail for the given filepath - Tk thread only"""
+        photo = self._thumbnail_cache.get( filepath )
+        if photo:
+            return photo
             
+        img = self.decode_thumbnail_image( filepath )
+        if img is None:
+            return None
+        return self._cache_thumbnail_photo( filepath, img )
+    
+    def decode_thumbnail_image( self, filepath ):
+        """Decode a thumbnail to a plain PIL image - safe to call from worker threads"""
         try:
-            # Load and resize image
-            with Image.open( filepath ) as img:
-                # Convert to RGB if necessary
-                if img.mode in ('RGBA', 'LA', 'P'):
-                    img = img.convert( 'RGB' )
-                
-                # Create thumbnail
-                img.thumbnail( self.thumbnail_size, Image.Resampling.LANCZOS )
-                
-                # Convert to PhotoImage for Tkinter
-                photo = ImageTk.PhotoImage( img )
+            # Try the persistent thumbnail store before decoding the original
+            store = self.main_app.thumbnail_store if self.main_app and hasattr( self.main_app, 'thumbnail_store' ) else None
+            img = store.get( filepath, self.thumbnail_size ) if store else None
+            
+            if img is None:
+                # Reuse a source the preview or fullscreen already decoded
+                shared = self.main_app.decoded_image_cache if self.main_app and hasattr( self.main_app, 'decoded_image_cache' ) else None
+                img = shared.thumbnail( filepath, self.thumbnail_size ) if shared else None
                 
-                # Cache the thumbnail
-                self._thumbnail_cache[filepath] = photo
-                
-                # Clean cache if it gets too large
-                if len( self._thumbnail_cache ) > self.max_cache_size:
-                    self.cleanup_thumbnail_cache()
-                    
-                return photo
+                if img is None:
+                    # Decode through the shared fast path (draft/reduce before the final filter)
+                    item = self._items_by_path.get( filepath )
+                    orientation = item.get( 'orientation' ) if item else None
+                    img = self.thumbnail_decoder.decode( filepath, self.thumbnail_size, orientation=orientation )
                 
+                # Write back so the next pass skips the decode
+                if store:
+                    store.put( filepath, self.thumbnail_size, img )
+            
+            # Force the pixel data in now so the Tk thread only has to copy it
+            img.load()
+            return img
+            
         except Exception as e:
             print( f"Error loading thumbnail for {filepath}: {e}" )
             return None
             
-    def cleanup_thumbnail_cache( self ):
-        """Remove old thumbnails from cache"""
-        # Remove 25% of cached items
-        items_to_remove = len( self._thumbnail_cache ) // 4
-        cache_keys = list( self._thumbnail_cache.keys() )
+    def _cache_thumbnail_photo( self, filepath, img ):
+        """Convert a decoded thumbnail to a PhotoImage and cache it - Tk thread only"""
+        try:
+            photo = ImageTk.PhotoImage( img )
+        except Exception as e:
+            print( f"Error converting thumbnail for {filepath}: {e}" )
+            return None
         
-        for key in cache_keys[:items_to_remove]:
-            del self._thumbnail_cache[key]
+        # Cache the thumbnail (the cache manager evicts least recently used entries)
+        self._thumbnail_cache[filepath] = photo
+        return photo
+    
+    def _on_row_image_evicted( self, item_id, photo ):
+        """Clear a row's image once its reference is evicted so Tk does not show a deleted photo"""
+        try:
+            if self.treeview.exists( item_id ) and self.treeview.item( item_id, 'image' ):
+                self.treeview.item( item_id, image='' )
+        except Exception:
+            pass  # Row or widget already gone
             
     def queue_thumbnail_load( self, filepath, item_id ):
-        """Queue a thumbnail for lazy loading with priority"""
-        if not filepath or not os.path.exists( filepath ):
+        """Queue a single thumbnail for loading with priority"""
+        if not filepath or filepath in self._failed_thumbnails:
             return
             
-        # Cancel any pending load for this item
-        if item_id in self.pending_thumbnail_loads:
-            self.parent.after_cancel( self.pending_thumbnail_loads[item_id] )
-            
         # Calculate priority for this item
         priority = self.calculate_treeview_thumbnail_priority( item_id )
         
-        # Add to priority queue
+        # Add to priority queue and let the single loader pick it up
+        self._wanted_items.add( item_id )
         import heapq
         heapq.heappush( self.priority_thumbnail_queue, (priority, filepath, item_id) )
-        
-        # Schedule thumbnail load after delay (but use priority queue)
-        after_id = self.parent.after( self.thumbnail_load_delay, 
-                                     lambda: self._process_priority_thumbnail_load() )
-        self.pending_thumbnail_loads[item_id] = after_id
+        self._start_thumbnail_loader()
         
     def calculate_treeview_thumbnail_priority( self, item_id ):
         """Calculate priority for treeview thumbnail loading"""
         try:
-            # Use cached visible items if recent, otherwise update
-            import time
-            current_time = time.time() * 1000  # Convert to milliseconds
-            
-            if not self.cached_visible_items or (current_time - self.last_visible_update > 100):
-                self.cached_visible_items = self.get_visible_treeview_items()
-                self.last_visible_update = current_time
+            # Cached viewport - only recomputed after a scroll, resize or refresh
+            visible_range = self.get_visible_range()
             
-            visible_items = self.cached_visible_items
-            
-            if visible_items:
-                visible_indices = [int(item) for item in visible_items if item.isdigit()]
+            if visible_range:
+                visible_start, visible_end = visible_range
+                visible_center = (visible_start + visible_end) // 2
                 
-                if visible_indices:
-                    visible_start = min( visible_indices )
-                    visible_end = max( visible_indices )
-                    visible_center = (visible_start + visible_end) // 2
-                    
-                    # Update visible range tracking
-                    self.update_treeview_visible_range( visible_start, visible_end )
+                # Update visible range tracking
+                self.update_treeview_visible_range( visible_start, visible_end )
+                
+                if item_id.isdigit():
+                    item_index = int( item_id )
                     
-                    if item_id.isdigit():
-                        item_index = int( item_id )
-                        
-                        if visible_start <= item_index <= visible_end:
-                            # Visible items get highest priority (0-50 based on distance from center)
-                            distance_from_center = abs( item_index - visible_center )
-                            return distance_from_center
+                    if visible_start <= item_index <= visible_end:
+                        # Visible items get highest priority (0-50 based on distance from center)
+                        distance_from_center = abs( item_index - visible_center )
+                        return distance_from_center
+                    else:
+                        # Adjacent items get medium priority for preloading
+                        preload_range = self.preload_range
+                        if (visible_start - preload_range) <= item_index < visible_start:
+                            # Items above visible range
+                            distance = visible_start - item_index
+                            return 100 + distance
+                        elif visible_end < item_index <= (visible_end + preload_range):
+                            # Items below visible range  
+                            distance = item_index - visible_end
+                            return 100 + distance
                         else:
-                            # Adjacent items get medium priority for preloading
-                            preload_range = 20
-                            if (visible_start - preload_range) <= item_index < visible_start:
-                                # Items above visible range
-                                distance = visible_start - item_index
-                                return 100 + distance
-                            elif visible_end < item_index <= (visible_end + preload_range):
-                                # Items below visible range  
-                                distance = item_index - visible_end
-                                return 100 + distance
-                            else:
-                                # Non-adjacent items get very low priority
-                                return 999
-            
+                            # Non-adjacent items get very low priority
+                            return 999
+                            
             return 999  # Default low priority for non-visible items
         except Exception as e:
             return 999  # Fallback priority
             
-    def get_visible_treeview_items( self ):
-        """Get only the items that are actually visible in the treeview viewport"""
-        try:
-            # Get the bounding box of the visible area
-            visible_items = []
+    def get_visible_range( self ):
+        """Get the (first, last) visible item index in O(1), cached until the next scroll, resize or refresh"""
+        if self._viewport_range is not None:
+            return self._viewport_range
             
-            # Get all items
-            all_items = self.treeview.get_children()
+        item_count = len( self.filtered_items )
+        if not item_count:
+            return None
+            
+        try:
+            # Rows under the top and bottom edges of the viewport
+            height = self.treeview.winfo_height()
+            top_id = self.treeview.identify_row( 1 )
+            bottom_id = self.treeview.identify_row( max( 1, height - 2 ) )
+            
+            if top_id.isdigit():
+                first = int( top_id )
+                if bottom_id.isdigit():
+                    last = int( bottom_id )
+                else:
+                    # List ends above the bottom edge (or rows are still being inserted)
+                    last = min( item_count - 1, first + max( 1, height // self.item_height ) )
+            else:
+                # Widget not mapped yet - fall back to the scroll fractions
+                top, bottom = self.treeview.yview()
+                first = int( top * item_count )
+                last = max( first, min( item_count - 1, int( bottom * item_count + 0.5 ) - 1 ) )
+                
+            self._viewport_range = (first, min( last, item_count - 1 ))
+            return self._viewport_range
             
-            # Check which ones are actually visible
-            for item in all_items:
-                try:
-                    # Get the bounding box of the item
-                    bbox = self.treeview.bbox( item )
-                    if bbox:  # bbox is None if item is not visible
-                        visible_items.append( item )
-                except:
-                    # If bbox fails, item is not visible
-                    continue
-                    
-            return visible_items
         except Exception as e:
-            print( f"Error getting visible items: {e}" )
+            print( f"Error getting visible range: {e}" )
+            return None
+    
+    def invalidate_viewport( self ):
+        """Forget the cached viewport so the next lookup recomputes it"""
+        self._viewport_range = None
+    
+    def on_yview_changed( self, first, last ):
+        """Treeview yscrollcommand - keep the scrollbar in sync and invalidate the cached viewport"""
+        self.scrollbar.set( first, last )
+        self.invalidate_viewport()
+        
+        # Track the top row over time for the velocity-aware prefetcher
+        top_row = float( first ) * len( self.filtered_items )
+        if not self._scroll_samples or self._scroll_samples[-1][1] != top_row:
+            self._scroll_samples.append( (time.perf_counter(), top_row) )
+            self._schedule_prefetch()
+            
+        self.request_visible_thumbnails()
+    
+    def on_treeview_resize( self, event ):
+        """Handle treeview resize - the number of visible rows may have changed"""
+        self.invalidate_viewport()
+        self.request_visible_thumbnails()
+    
+    def get_visible_treeview_items( self ):
+        """Get only the items that are actually visible in the treeview viewport"""
+        visible_range = self.get_visible_range()
+        if not visible_range:
             return []
             
+        first, last = visible_range
+        return [str( index ) for index in range( first, last + 1 )]
+    
     def update_treeview_visible_range( self, start_index, end_index ):
         """Update visible range and detect scroll jumps for treeview"""
         old_start, old_end = self.visible_item_range
@@ -531,131 +1656,115 @@ class TreeviewImageList:
         self.last_visible_center = new_center
         
     def _process_priority_thumbnail_load( self ):
-        """Process priority-based thumbnail loading"""
-        if not self.priority_thumbnail_queue:
-            self._processing_priority = False
-            if not self.thumbnail_loading:
-                self.process_thumbnail_queue()  # Fallback to old queue
-            return
-            
-        # Get highest priority thumbnail and process it directly
+        """Single loader - drain the needs queue into the decode pool, highest priority first"""
         import heapq
-        priority, filepath, item_id = heapq.heappop( self.priority_thumbnail_queue )
-        
-        # Skip items with very low priority (non-adjacent items)
-        if priority >= 999:
-            # Continue processing if there are more items
-            if self.priority_thumbnail_queue:
-                self.parent.after( 50, self._process_priority_thumbnail_load )
-            return
         
-        # Set processing flag
-        self._processing_priority = True
-        
-        # Process this thumbnail directly - allow multiple visible thumbnails to load in parallel
-        self._load_thumbnail_directly( filepath, item_id )
+        # Fill the decode pool as far as backpressure allows
+        while self.priority_thumbnail_queue and self.decode_pool.has_capacity():
+            priority, filepath, item_id = heapq.heappop( self.priority_thumbnail_queue )
+            
+            # Skip items with very low priority (non-adjacent items)
+            if priority >= 999:
+                continue
+                
+            if not self._load_thumbnail_directly( filepath, item_id ):
+                heapq.heappush( self.priority_thumbnail_queue, (priority, filepath, item_id) )
+                break
         
-        # Continue processing more items with different speeds based on priority
         if self.priority_thumbnail_queue:
-            if priority < 50:  # Visible items
-                self.parent.after( 1, self._process_priority_thumbnail_load )
-            elif priority < 150:  # Preload items
-                self.parent.after( 10, self._process_priority_thumbnail_load )
-            else:
-                self.parent.after( 50, self._process_priority_thumbnail_load )
+            # Pool is full - try again once the workers have made progress
+            self.parent.after( 16, self._process_priority_thumbnail_load )
+        else:
+            self._processing_priority = False
+            if not self.thumbnail_loading:
+                self.process_thumbnail_queue()  # Fallback to old queue
             
     def _load_thumbnail_directly( self, filepath, item_id ):
-        """Load a thumbnail directly, bypassing the FIFO queue"""
-        # Don't set thumbnail_loading flag to allow parallel loading of visible items
+        """Submit a thumbnail to the decode pool, bypassing the FIFO queue; returns False when the pool is full"""
+        # Already decoded - apply without a round trip through the pool
+        cached_photo = self._thumbnail_cache.get( filepath )
+        if cached_photo:
+            self._set_row_thumbnail( item_id, cached_photo )
+            return True
+            
+        # Keyed by generation so a job for the same row id in an older list never masks this one
+        job_key = (self.generation, item_id)
+        if self.decode_pool.is_pending( job_key ):
+            return True
+            
+        if not self.decode_pool.submit( job_key, self._decode_thumbnail_job, filepath, item_id, self.generation ):
+            return False
+            
+        self._schedule_thumbnail_drain()
+        return True
         
-        def load_thumbnail_async():
-            """Load thumbnail in background thread"""
-            try:
-                # Check if item still exists
-                if not self.treeview.exists( item_id ):
-                    return
-                    
-                # Check cache first
-                if filepath in self._thumbnail_cache:
-                    photo = self._thumbnail_cache[filepath]
-                else:
-                    # Load thumbnail
-                    photo = self.load_thumbnail( filepath )
-                    
-                if photo:
-                    # Update UI on main thread
-                    def update_ui():
-                        try:
-                            if self.treeview.exists( item_id ):
-                                # Get current text to preserve it
-                                current_text = self.treeview.item( item_id, 'text' )
-                                # Set both image and text (image appears before text in treeview)
-                                self.treeview.item( item_id, image=photo, text=current_text )
-                                # Keep reference to prevent garbage collection
-                                self._thumbnail_references[item_id] = photo
-                                
-                                # Force treeview to refresh this item
-                                self.treeview.update_idletasks()
-                            else:
-                                print( f"THUMBNAIL: Item {item_id} no longer exists when trying to set thumbnail" )
-                        except Exception as e:
-                            print( f"THUMBNAIL: Error setting thumbnail for item {item_id}: {e}" )
-                    self.parent.after( 0, update_ui )
-                    
-            except Exception as e:
-                print( f"Error loading priority thumbnail for {filepath}: {e}" )
-                
-        # Load thumbnail in background thread
-        threading.Thread( target=load_thumbnail_async, daemon=True ).start()
+    def _decode_thumbnail_job( self, filepath, item_id, generation ):
+        """Decode pool job - returns a PIL image; PhotoImage creation is left to the Tk thread"""
+        # Stale before it started - the list was rebuilt or the row scrolled out of the wanted window
+        if generation != self.generation or item_id not in self._wanted_items:
+            return None
+        return (filepath, self.decode_thumbnail_image( filepath ))
+    
+    def _schedule_thumbnail_drain( self ):
+        """Make sure a single drain of the decode pool is scheduled on the Tk thread"""
+        if self._drain_after_id is None:
+            self._drain_after_id = self.parent.after( self.apply_frame_interval, self._drain_decode_results )
+    
+    def _drain_decode_results( self ):
+        """Frame tick - convert and apply as many finished thumbnails as fit in the budget, then let Tk redraw once"""
+        self._drain_after_id = None
+        self.decode_pool.drain( self._apply_decoded_thumbnail, time_budget=self.apply_time_budget )
         
-    def _continue_priority_processing( self ):
-        """Continue processing the priority queue"""
-        self.thumbnail_loading = False
-        if self.priority_thumbnail_queue:
-            self._process_priority_thumbnail_load()
-        
-    def _delayed_thumbnail_load( self, filepath, item_id ):
-        """Actually load the thumbnail after the delay"""
-        # Remove from pending loads
-        if item_id in self.pending_thumbnail_loads:
-            del self.pending_thumbnail_loads[item_id]
-            
-        # Only load if item still exists and is visible
-        if self.treeview.exists( item_id ):
-            # Use priority system instead of FIFO queue
-            priority = self.calculate_treeview_thumbnail_priority( item_id )
-            import heapq
-            heapq.heappush( self.priority_thumbnail_queue, (priority, filepath, item_id) )
+        if not self.decode_pool.is_idle():
+            self._schedule_thumbnail_drain()
+    
+    def _apply_decoded_thumbnail( self, job_key, result ):
+        """Drain callback - set a decoded thumbnail on its treeview row"""
+        generation, item_id = job_key
+        if not result:
+            return
             
-            if not self.thumbnail_loading:
-                self._process_priority_thumbnail_load()
-                
+        filepath, img = result
+        photo = self._cache_thumbnail_photo( filepath, img ) if img is not None else None
+        if not photo:
+            # Decode failed - don't keep re-requesting it on every scroll
+            self._failed_thumbnails.add( filepath )
+            return
+            
+        # Row id now belongs to a different image - the photo stays cached by filepath for reuse
+        if generation != self.generation:
+            return
+            
+        self._set_row_thumbnail( item_id, photo )
+    
+    def _set_row_thumbnail( self, item_id, photo ):
+        """Set a thumbnail on a treeview row - no forced redraw, Tk repaints once after the batch"""
+        try:
+            if self.treeview.exists( item_id ):
+                self.treeview.item( item_id, image=photo )
+                # Keep reference to prevent garbage collection
+                self._thumbnail_references[item_id] = photo
+        except Exception as e:
+            print( f"THUMBNAIL: Error setting thumbnail for item {item_id}: {e}" )
+        
     def process_thumbnail_queue( self ):
-        """Process thumbnail loading queue in background"""
+        """Feed the FIFO thumbnail queue into the decode pool"""
         if not self.thumbnail_load_queue:
             self.thumbnail_loading = False
             return
             
         self.thumbnail_loading = True
         
-        # Get next item from queue
-        filepath, item_id = self.thumbnail_load_queue.popleft()
+        # Submit as many items as the pool will accept
+        while self.thumbnail_load_queue:
+            filepath, item_id = self.thumbnail_load_queue[0]
+            self._wanted_items.add( item_id )
+            if not self._load_thumbnail_directly( filepath, item_id ):
+                break
+            self.thumbnail_load_queue.popleft()
         
-        def load_thumbnail_async():
-            """Load thumbnail in background thread"""
-            try:
-                photo = self.load_thumbnail( filepath )
-                if photo:
-                    # Update treeview item with thumbnail on main thread
-                    self.parent.after( 0, lambda: self.update_item_thumbnail( item_id, photo ) )
-            except Exception as e:
-                print( f"Error in thumbnail thread: {e}" )
-            finally:
-                # Continue processing queue after a short delay
-                self.parent.after( 10, self.process_thumbnail_queue )
-                
-        # Load thumbnail in background thread
-        threading.Thread( target=load_thumbnail_async, daemon=True ).start()
+        # Pool is full (backpressure) - try again once some work has finished
+        self.parent.after( 16, self.process_thumbnail_queue )
         
     def update_item_thumbnail( self, item_id, photo ):
         """Update treeview item with loaded thumbnail"""
@@ -691,213 +1800,22 @@ class TreeviewImageList:
             
     def load_visible_thumbnails( self ):
         """Load thumbnails for currently visible items only"""
-        try:
-            # Get the visible region of the treeview
-            visible_items = self.treeview.get_children()
-            
-            # Queue thumbnails for visible items
-            for item_id in visible_items:
-                if item_id.isdigit():
-                    index = int( item_id )
-                    if index < len( self.filtered_items ):
-                        item_data = self.filtered_items[index]
-                        filepath = item_data.get( 'filepath' )
-                        show_thumbnails = item_data.get( 'show_thumbnails', False )
-                        
-                        if show_thumbnails and filepath and os.path.exists( filepath ):
-                            if filepath not in self._thumbnail_cache:
-                                self.queue_thumbnail_load( filepath, item_id )
-                                
-        except Exception as e:
-            print( f"Error loading visible thumbnails: {e}" )
+        self.request_visible_thumbnails( 0 )
             
     def on_scroll( self, event ):
-        """Handle scroll events to track scrolling activity"""
-        import time
-        self.last_scroll_time = time.time()
-        
+        """Handle scroll events - drop work for the old position and request thumbnails once scrolling settles"""
         # Invalidate cached visible items on scroll
-        self.cached_visible_items = []
-        self.last_visible_update = 0
-        
-        # Cancel all pending thumbnail loads during scrolling
-        self.cancel_pending_thumbnail_loads()
+        self.invalidate_viewport()
         
         # Clear priority queue to avoid loading thumbnails for old positions
         self.priority_thumbnail_queue.clear()
         
-        # Schedule thumbnail loading check after scroll stops (increased delay for better performance)
-        self.parent.after( self.thumbnail_load_delay + 100, self.check_scroll_stopped )
+        self.request_visible_thumbnails()
         
     def on_scroll_release( self, event ):
         """Handle scrollbar release"""
         self.on_scroll( event )
         
-    def cancel_pending_thumbnail_loads( self ):
-        """Cancel all pending thumbnail loads"""
-        for after_id in self.pending_thumbnail_loads.values():
-            self.parent.after_cancel( after_id )
-        self.pending_thumbnail_loads.clear()
-        
-    def check_scroll_stopped( self ):
-        """Check if scrolling has stopped and load visible thumbnails"""
-        import time
-        current_time = time.time()
-        
-        # If no recent scroll activity, load visible thumbnails
-        if current_time - self.last_scroll_time >= (self.thumbnail_load_delay / 1000.0):
-            self.load_visible_thumbnails_debounced()
-            # Also schedule verification to catch any missed items
-            self.parent.after( 400, self.verify_visible_thumbnails_loaded )
-            
-    def load_visible_thumbnails_debounced( self ):
-        """Load thumbnails for visible items and preload adjacent items"""
-        try:
-            # Get actually visible items
-            visible_items = self.get_visible_treeview_items()
-            
-            if visible_items:
-                visible_indices = [int(item) for item in visible_items if item.isdigit()]
-                
-                if visible_indices:
-                    visible_start = min( visible_indices )
-                    visible_end = max( visible_indices )
-                    
-                    # Define preload range
-                    preload_range = 20
-                    load_start = max( 0, visible_start - preload_range )
-                    load_end = min( len( self.filtered_items ) - 1, visible_end + preload_range )
-                    
-                    # Queue thumbnails for visible + preload range
-                    for index in range( load_start, load_end + 1 ):
-                        if index < len( self.filtered_items ):
-                            item_data = self.filtered_items[index]
-                            filepath = item_data.get( 'filepath' )
-                            show_thumbnails = item_data.get( 'show_thumbnails', False )
-                            item_id = str( index )
-                            
-                            if show_thumbnails and filepath and os.path.exists( filepath ):
-                                if filepath not in self._thumbnail_cache:
-                                    # Queue with priority based on visibility/distance
-                                    self.queue_thumbnail_load( filepath, item_id )
-                                
-        except Exception as e:
-            print( f"Error loading visible thumbnails (debounced): {e}" )
-        
-        # After initial loading, verify all visible items are covered
-        self.parent.after( 200, self.verify_visible_thumbnails_loaded )
-    
-    def verify_visible_thumbnails_loaded( self ):
-        """Verify all visible thumbnails are loaded or queued, re-queue any missing ones"""
-        # Prevent multiple simultaneous verifications
-        if self._verifying_thumbnails:
-            return
-        self._verifying_thumbnails = True
-        
-        try:
-            visible_items = self.get_visible_treeview_items()
-            missing_count = 0
-            total_visible = 0
-            loaded_count = 0
-            pending_count = 0
-            
-            for item_id in visible_items:
-                if item_id.isdigit():
-                    index = int( item_id )
-                    if index < len( self.filtered_items ):
-                        item_data = self.filtered_items[index]
-                        filepath = item_data.get( 'filepath' )
-                        show_thumbnails = item_data.get( 'show_thumbnails', False )
-                        
-                        if show_thumbnails and filepath and os.path.exists( filepath ):
-                            total_visible += 1
-                            
-                            # Check if thumbnail is actually DISPLAYED in treeview (not just cached)
-                            is_displayed = False
-                            try:
-                                # Check if treeview item has an image set
-                                item_info = self.treeview.item( item_id )
-                                is_displayed = bool( item_info.get( 'image' ) )
-                            except:
-                                is_displayed = False
-                                
-                            is_pending = item_id in self.pending_thumbnail_loads
-                            is_queued = any( item_id == queued_id for _, _, queued_id in self.priority_thumbnail_queue )
-                            
-                            if is_displayed:
-                                loaded_count += 1
-                            elif is_pending or is_queued:
-                                pending_count += 1
-                            else:
-                                # Missing or not displayed - re-queue with priority 0
-                                missing_count += 1
-                                import heapq
-                                heapq.heappush( self.priority_thumbnail_queue, (0, filepath, item_id) )
-                                
-                                # Also trigger immediate processing if not already running
-                                if not hasattr( self, '_processing_priority' ) or not self._processing_priority:
-                                    self._processing_priority = True
-                                    self.parent.after( 1, self._process_priority_thumbnail_load )
-            
-            if missing_count > 0:
-                # Schedule another verification in case more are missed
-                self.parent.after( 200, self.verify_visible_thumbnails_loaded )
-            elif pending_count > 0:
-                # Still have pending items, check again soon
-                self.parent.after( 500, self.verify_visible_thumbnails_loaded )
-                                
-        except Exception as e:
-            print( f"Error verifying visible thumbnails: {e}" )
-        finally:
-            # Reset verification flag
-            self._verifying_thumbnails = False
-    
-    def start_periodic_verification( self ):
-        """Start periodic verification of visible thumbnails"""
-        self.periodic_verification()
-    
-    def periodic_verification( self ):
-        """Periodically verify visible thumbnails are loaded"""
-        try:
-            # Only run periodic verification if we have items and thumbnails are enabled
-            if (self.filtered_items and 
-                any( item_data.get( 'show_thumbnails', False ) for item_data in self.filtered_items )):
-                
-                visible_items = self.get_visible_treeview_items()
-                if visible_items:
-                    # Check if any visible items are missing thumbnails
-                    missing_any = False
-                    for item_id in visible_items:
-                        if item_id.isdigit():
-                            index = int( item_id )
-                            if index < len( self.filtered_items ):
-                                item_data = self.filtered_items[index]
-                                filepath = item_data.get( 'filepath' )
-                                show_thumbnails = item_data.get( 'show_thumbnails', False )
-                                
-                                if show_thumbnails and filepath and os.path.exists( filepath ):
-                                    # Check if thumbnail is actually displayed
-                                    is_displayed = False
-                                    try:
-                                        item_info = self.treeview.item( item_id )
-                                        is_displayed = bool( item_info.get( 'image' ) )
-                                    except:
-                                        is_displayed = False
-                                    
-                                    if not is_displayed and item_id not in self.pending_thumbnail_loads:
-                                        missing_any = True
-                                        break
-                    
-                    # If missing any, run full verification
-                    if missing_any:
-                        self.verify_visible_thumbnails_loaded()
-        
-        except Exception as e:
-            print( f"Error in periodic verification: {e}" )
-        
-        # Schedule next periodic check
-        self.parent.after( 2000, self.periodic_verification )  # Every 2 seconds
-
     def select_all( self, event ):
         """Select all items in the filtered list"""
         if self.filtered_items:
@@ -934,6 +1852,14 @@ class ImageViewer:
         # Performance mode flags
         self.performance_mode = False  # Disable heavy operations during large operations
         self.last_interaction_time = 0  # Track user interaction for performance mode
+        
+        # Large result sets stream into the list - the first screenful shows while the rest loads
+        self.catalog_stream = None  # thread_data of the stream in progress, None when idle
+        self._catalog_stream_generation = 0  # Bumped per refresh so a superseded stream stops
+        self.stream_first_chunk = 200  # Rows in the first chunk - enough for a screenful
+        self.stream_chunk_size = 2000  # Rows per chunk after that
+        self.stream_poll_interval = 16  # ms between appends on the Tk thread
+        self.stream_append_budget = 0.02  # Seconds of row inserts per tick so the list stays scrollable
         self.current_directory = None
         self.fullscreen_window = None
         self.fullscreen_images = []
@@ -951,19 +1877,66 @@ class ImageViewer:
         self.image_metadata_cache = {}  # Cache for image metadata (rating, dimensions, tags)
         self.tag_cache = {}  # Cache for tag data
         self.cache_max_size = 1000  # Maximum items to keep in cache
-        
-        # Fullscreen lazy loading
-        self.fullscreen_filenames = []  # Store filenames instead of full paths
-        self.fullscreen_paths_cache = {}  # Cache for resolved paths
+        self.filter_result_cache = OrderedDict()  # Normalized filter and sort state -> sorted item list, least recent first
+        self.filter_result_cache_size = 8  # Filter combinations to remember
+        self._catalog_cache_version = None  # Catalog version the caches were filled under
+        
+        # Fullscreen navigation snapshot
+        self.fullscreen_image_ids = []  # Database ids parallel to fullscreen_images (None outside a catalog)
+        
+        # Long-lived connections to the open catalog
+        self.catalog = None
+        
+        # In-memory filter index for the open catalog, built in the background - None until ready
+        self.filter_index = None
+        self._filter_index_build = 0  # Bumped per build so a superseded build is discarded
+        self._pending_index_updates = []  # Filepaths written while a build was running
+        
+        # Persistent thumbnail store for the open catalog
+        self.thumbnail_store = None
+        self.thumbnail_decoder = ThumbnailDecoder()
+        
+        # All in-memory image caches share one LRU cache manager and memory ceiling
+        self.image_cache_manager = ImageCacheManager( self.load_image_cache_limit() )
+        self._preview_cache = self.image_cache_manager.register( 'previews', 0.40 )
+        
+        # Decoded sources shared by preview, fullscreen and thumbnails - decoded at screen size so fullscreen can reuse them
+        self.decoded_image_cache = DecodedImageCache(
+            self.image_cache_manager.register( 'decoded_sources', 0.30, size_func=lambda entry: estimate_image_bytes( entry[0] ) ),
+            self.thumbnail_decoder,
+            min_source_size=(self.root.winfo_screenwidth(), self.root.winfo_screenheight()) )
+        
+        # Background decoding of the images next to the current preview so wheel-stepping hits the cache
+        self.preview_pool = DecodePool( worker_count=2 )
+        self.preview_prefetch_count = 2  # Neighbours decoded in each direction
+        self._preview_drain_after_id = None
+        
+        # Fullscreen prefetch ring - screen-sized images around fullscreen_index decoded in the background
+        self.fullscreen_pool = DecodePool( worker_count=2 )
+        self.fullscreen_prefetch_ahead = 3  # Images decoded in the direction of travel
+        self.fullscreen_prefetch_behind = 1  # Images kept for stepping back
+        self._fullscreen_ring = {}  # (filepath, screen_size) -> PhotoImage
+        self._fullscreen_ring_keys = set()  # Keys inside the current ring, stale results are dropped
+        self._fullscreen_drain_after_id = None
+        self.fullscreen_refine_delay = 150  # ms of idle before a fast fullscreen render is redone with LANCZOS
+        self._fullscreen_refine_after_id = None
+        
+        # Rapid navigation - held keys and fast wheel steps only draw the latest index, from cached images
+        self.fullscreen_rapid_interval = 0.1  # Seconds between steps below which navigation counts as rapid (key repeat)
+        self.fullscreen_settle_delay = 150  # ms without a step before the landing image is rendered at full quality
+        self._fullscreen_rapid = False
+        self._fullscreen_last_step = 0.0
+        self._fullscreen_direction = 1
+        self._fullscreen_render_after_id = None
+        self._fullscreen_settle_after_id = None
         
         # Options settings
         self.show_thumbnails = tk.BooleanVar( value=True )  # Default to show thumbnails
         self.confirm_before_delete = tk.BooleanVar( value=True )  # Default to confirm before delete
-        self.thumbnail_cache = {}  # Cache for 64x64 thumbnails
-        self.thumbnail_load_queue = []  # Queue of items waiting for thumbnail loading
-        self.thumbnail_loading = False  # Flag to prevent concurrent loading
-        self.visible_items_timer = {}  # Track how long items have been visible
-        self.visibility_check_timer = None
+        self.generate_thumbnails_on_scan = tk.BooleanVar( value=True )  # Write list thumbnails to the store while scanning
+        self.generate_previews_on_scan = tk.BooleanVar( value=False )  # Also write preview-size images (larger store)
+        self.scan_preview_size = (1024, 1024)  # Preview-size entry generated during the scan
+        self.thumbnail_cache = self.image_cache_manager.register( 'thumbnails', 0.10 )  # Cache for 64x64 thumbnails
         
         # Quickmove settings
         self.quickmove_enabled = tk.BooleanVar( value=False )
@@ -977,6 +1950,7 @@ class ImageViewer:
         self.load_settings()
         self.load_quickmove_settings()
         self.load_confirm_delete_setting()
+        self.load_scan_thumbnail_settings()
         
         # Restore window geometry and active tab after everything is set up
         self.root.after( 100, self.restore_window_geometry )
@@ -1018,6 +1992,7 @@ class ImageViewer:
         database_menu.add_command( label="Create Database Here", command=self.create_database_here )
         database_menu.add_command( label="Open Database", command=self.open_database )
         database_menu.add_command( label="Rescan", command=self.rescan_database )
+        database_menu.add_command( label="Build All Thumbnails", command=self.build_all_thumbnails )
         database_menu.add_separator()
         database_menu.add_command( label="Remove Duplicates from Database", command=self.remove_database_duplicates )
         database_menu.add_command( label="Clean Up Database", command=self.clean_up_database )
@@ -1030,6 +2005,11 @@ class ImageViewer:
                                     command=self.on_thumbnails_toggle )
         options_menu.add_checkbutton( label="Confirm Before Delete", variable=self.confirm_before_delete,
                                     command=self.on_confirm_delete_toggle )
+        options_menu.add_separator()
+        options_menu.add_checkbutton( label="Generate Thumbnails During Scan", variable=self.generate_thumbnails_on_scan,
+                                    command=self.save_scan_thumbnail_settings )
+        options_menu.add_checkbutton( label="Generate Preview Images During Scan", variable=self.generate_previews_on_scan,
+                                    command=self.save_scan_thumbnail_settings )
         
         # Help menu
         help_menu = tk.Menu( menubar, tearoff=0 )
@@ -1602,7 +2582,7 @@ class ImageViewer:
         debug_button.pack( side=tk.BOTTOM, pady=(2, 0) )
         
         # Create treeview-based image list that handles large datasets properly
-        self.virtual_image_list = TreeviewImageList( image_list_frame, item_height=68 )
+        self.virtual_image_list = TreeviewImageList( image_list_frame, item_height=68, cache_manager=self.image_cache_manager )
         self.virtual_image_list.frame.pack( fill=tk.BOTH, expand=True )
         
         # Set reference to main app for thumbnail generation
@@ -1644,6 +2624,14 @@ class ImageViewer:
             else:
                 status_text = f"{total_images} total items, {selected_count} selected"
             
+            # Results still streaming in - the match count is only known for unfiltered loads
+            stream = self.catalog_stream
+            if stream:
+                if stream['filtered']:
+                    status_text = f"Loading {total_images:,} matching images ({stream['total_images']:,} in catalog)... {status_text}"
+                else:
+                    status_text = f"Loading {total_images:,} of {stream['total_images']:,}... {status_text}"
+            
             self.image_list_status_label.configure( text=status_text )
             
     def debug_virtual_scrolling( self ):
@@ -1844,14 +2832,13 @@ class ImageViewer:
             return False
             
         try:
-            conn = sqlite3.connect( self.current_database_path )
+            conn = self.catalog.reader()
             cursor = conn.cursor()
             
             relative_path = os.path.relpath( filepath, self.current_database )
             cursor.execute( "SELECT id FROM images WHERE relative_path = ?", (relative_path,) )
             result = cursor.fetchone()
             
-            conn.close()
             return result is not None
         except Exception:
             return False
@@ -1916,6 +2903,7 @@ class ImageViewer:
                 self.current_browse_directory = os.path.dirname( filepath )
                 self.update_browse_folder_images( filepath )
                 self.display_image_preview( filepath, self.browse_preview_label )
+                self.prefetch_browse_neighbors()
                 # Save the directory containing the selected image
                 self.save_directory_only( self.current_browse_directory )
             elif os.path.isdir( filepath ):
@@ -2048,12 +3036,18 @@ class ImageViewer:
                 self.browse_image_index -= 1
                 self.current_browse_image = self.browse_folder_images[self.browse_image_index]
                 self.display_image_preview( self.current_browse_image, self.browse_preview_label )
+                self.prefetch_browse_neighbors( -1 )
         else:
             # Scroll down - next image (don't wrap)
             if self.browse_image_index < len( self.browse_folder_images ) - 1:
                 self.browse_image_index += 1
                 self.current_browse_image = self.browse_folder_images[self.browse_image_index]
                 self.display_image_preview( self.current_browse_image, self.browse_preview_label )
+                self.prefetch_browse_neighbors( 1 )
+    
+    def prefetch_browse_neighbors( self, direction=1 ):
+        """Prefetch the images next to the current browse preview"""
+        self.prefetch_preview_neighbors( self.browse_folder_images, self.browse_image_index, self.browse_preview_label, direction )
                 
     def on_browse_preview_scroll_up( self, event ):
         """Handle scroll up (Button-4) for browse preview"""
@@ -2063,6 +3057,7 @@ class ImageViewer:
             self.browse_image_index -= 1
             self.current_browse_image = self.browse_folder_images[self.browse_image_index]
             self.display_image_preview( self.current_browse_image, self.browse_preview_label )
+            self.prefetch_browse_neighbors( -1 )
             
     def on_browse_preview_scroll_down( self, event ):
         """Handle scroll down (Button-5) for browse preview"""
@@ -2072,6 +3067,7 @@ class ImageViewer:
             self.browse_image_index += 1
             self.current_browse_image = self.browse_folder_images[self.browse_image_index]
             self.display_image_preview( self.current_browse_image, self.browse_preview_label )
+            self.prefetch_browse_neighbors( 1 )
                 
     def on_browse_preview_resize( self, event ):
         """Handle resize events for browse preview label"""
@@ -2083,10 +3079,9 @@ class ImageViewer:
             # Clear the preview cache for this image so it gets regenerated at new size
             if hasattr( self.browse_preview_label, 'current_image_path' ) and self.browse_preview_label.current_image_path:
                 cache_key = f"{self.browse_preview_label.current_image_path}_{id(self.browse_preview_label)}"
-                if hasattr( self, '_preview_cache' ) and cache_key in self._preview_cache:
-                    del self._preview_cache[cache_key]
-                # Redisplay the image with the new size
-                self.display_image_preview( self.browse_preview_label.current_image_path, self.browse_preview_label )
+                self._preview_cache.pop( cache_key, None )
+                # Cheap rescale from the decoded source now, full-quality redraw once the drag settles
+                self.rescale_preview( self.browse_preview_label )
                 
     def on_database_preview_resize( self, event ):
         """Handle resize events for database preview label"""
@@ -2098,10 +3093,9 @@ class ImageViewer:
             # Clear the preview cache for this image so it gets regenerated at new size
             if hasattr( self.database_preview_label, 'current_image_path' ) and self.database_preview_label.current_image_path:
                 cache_key = f"{self.database_preview_label.current_image_path}_{id(self.database_preview_label)}"
-                if hasattr( self, '_preview_cache' ) and cache_key in self._preview_cache:
-                    del self._preview_cache[cache_key]
-                # Redisplay the image with the new size
-                self.display_image_preview( self.database_preview_label.current_image_path, self.database_preview_label )
+                self._preview_cache.pop( cache_key, None )
+                # Cheap rescale from the decoded source now, full-quality redraw once the drag settles
+                self.rescale_preview( self.database_preview_label )
                 
     def on_database_preview_scroll( self, event ):
         """Handle mouse wheel scrolling over database preview image with debouncing"""
@@ -2152,8 +3146,10 @@ class ImageViewer:
         if hasattr( self, '_preview_scroll_after_id' ):
             self.root.after_cancel( self._preview_scroll_after_id )
         
-        # Schedule debounced update for heavy operations
-        self._preview_scroll_after_id = self.root.after( 50, lambda: self._update_preview_scroll_complete( new_index ) )
+        # Schedule debounced update for heavy operations - tagged with the list generation so a re-filter
+        # or re-sort within the debounce window doesn't select whatever row now has this index
+        generation = self.virtual_image_list.generation
+        self._preview_scroll_after_id = self.root.after( 50, lambda: self._update_preview_scroll_complete( new_index, generation ) )
         
         # Immediately update preview without waiting - this is fast
         if new_index < len( self.virtual_image_list.filtered_items ):
@@ -2163,14 +3159,22 @@ class ImageViewer:
                 self.current_database_image = filepath
                 self.selected_image_files = [filepath]  # Update immediately so rating shortcuts work
                 self.display_image_preview( filepath, self.database_preview_label )
+            
+            # Get the next steps decoding while this one is on screen
+            self.prefetch_preview_neighbors( self.virtual_image_list.filtered_items, new_index,
+                                             self.database_preview_label, 1 if new_index > current_index else -1 )
     
-    def _update_preview_scroll_complete( self, new_index ):
+    def _update_preview_scroll_complete( self, new_index, generation=None ):
         """Complete the preview scroll update with heavy operations"""
         try:
             # Clear the after_id since we're now executing
             if hasattr( self, '_preview_scroll_after_id' ):
                 delattr( self, '_preview_scroll_after_id' )
             
+            # The list was rebuilt since the scroll - new_index refers to a different image now
+            if generation is not None and generation != self.virtual_image_list.generation:
+                return
+            
             # Ensure the virtual_image_list.selected_indices is properly set
             self.virtual_image_list.selected_indices = {new_index}
             
@@ -2205,14 +3209,18 @@ class ImageViewer:
             self.update_image_list_status()
             
             # Trigger thumbnail loading for visible items after scrolling
-            if self.show_thumbnails.get() and hasattr( self.virtual_image_list, 'load_visible_thumbnails_debounced' ):
-                self.root.after( 50, self.virtual_image_list.load_visible_thumbnails_debounced )
+            if self.show_thumbnails.get():
+                self.virtual_image_list.request_visible_thumbnails( 50 )
             
         except Exception as e:
             print( f"Error in preview scroll complete: {e}" )
     
     def _load_tags_deferred( self, filepath ):
         """Load tags in a deferred manner to prevent blocking"""
+        # Selection moved on before this ran - the newer selection schedules its own load
+        if self.selected_image_files != [filepath]:
+            return
+            
         try:
             self.load_image_tags_for_editing()
             self.update_file_tags_display( filepath )
@@ -2231,55 +3239,15 @@ class ImageViewer:
         event.delta = -1  # Simulate scroll down
         self.on_database_preview_scroll( event )
                 
-    def apply_exif_orientation( self, image ):
-        """Apply EXIF orientation to rotate image correctly"""
+    def apply_exif_orientation( self, image, orientation=None ):
+        """Apply EXIF orientation with a lossless transpose; pass orientation when the catalog already knows it"""
         try:
-            # Try the newer Pillow method first (available in Pillow 6.0+)
-            if hasattr(image, 'getexif'):
-                exif = image.getexif()
-                orientation = exif.get(0x0112)  # 0x0112 is the EXIF orientation tag
-            else:
-                # Fallback to older method
-                exif = image._getexif()
-                orientation = None
-                if exif is not None:
-                    # Find the orientation tag
-                    for tag, value in ExifTags.TAGS.items():
-                        if value == 'Orientation':
-                            orientation = exif.get(tag)
-                            break
-            
-            if orientation:
-                # Apply rotation based on orientation value
-                if orientation == 2:
-                    # Horizontal flip
-                    image = image.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-                elif orientation == 3:
-                    # 180 degree rotation
-                    image = image.rotate(180, expand=True)
-                elif orientation == 4:
-                    # Vertical flip
-                    image = image.transpose(Image.Transpose.FLIP_TOP_BOTTOM)
-                elif orientation == 5:
-                    # Horizontal flip + 90 degree rotation
-                    image = image.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-                    image = image.rotate(90, expand=True)
-                elif orientation == 6:
-                    # 90 degree rotation (clockwise)
-                    image = image.rotate(270, expand=True)
-                elif orientation == 7:
-                    # Horizontal flip + 270 degree rotation
-                    image = image.transpose(Image.Transpose.FLIP_LEFT_RIGHT)
-                    image = image.rotate(270, expand=True)
-                elif orientation == 8:
-                    # 270 degree rotation (counter-clockwise)
-                    image = image.rotate(90, expand=True)
-                        
+            if orientation is None:
+                orientation = self.thumbnail_decoder.get_orientation( image )
+            return self.thumbnail_decoder.apply_orientation( image, orientation )
         except (AttributeError, KeyError, TypeError, OSError):
             # No EXIF data, orientation tag, or other error - return original image
-            pass
-        
-        return image
+            return image
 
     def extract_image_file_tags( self, filepath ):
         """Extract keywords/tags from image file metadata (EXIF, IPTC, XMP)"""
@@ -2399,11 +3367,14 @@ class ImageViewer:
         """Display image preview in the specified label widget with caching"""
         # Check cache first for fast display
         cache_key = f"{filepath}_{id(label_widget)}"
-        if hasattr( self, '_preview_cache' ) and cache_key in self._preview_cache:
-            cached_photo = self._preview_cache[cache_key]
+        cached_photo = self._preview_cache.get( cache_key )
+        if cached_photo:
             label_widget.configure( image=cached_photo, text="" )
             label_widget.image = cached_photo
             label_widget.current_image_path = filepath
+            # Prefetched previews are the fast resample - refine once the user stops on this one
+            if not getattr( cached_photo, '_refined', False ):
+                self._schedule_preview_refine( label_widget )
             # Update path label with cached resolution if available
             if hasattr( cached_photo, '_image_resolution' ):
                 res_text = f"{filepath} - {cached_photo._image_resolution}"
@@ -2414,126 +3385,275 @@ class ImageViewer:
             return
             
         try:
-            # Fast image loading with size limit for performance
-            with Image.open( filepath ) as image:
-                # Get original size
-                original_width, original_height = image.size
-                
-                # Update the path label with resolution
-                resolution_text = f"{filepath} - {original_width}x{original_height}"
-                if label_widget == self.browse_preview_label:
-                    self.browse_path_label.configure( text=resolution_text )
-                elif label_widget == self.database_preview_label:
-                    self.database_path_label.configure( text=resolution_text )
-                
-                # Skip very large images by loading a smaller version first
-                if original_width > 2000 or original_height > 2000:
-                    # Create a draft for faster loading of large images
-                    image.draft( 'RGB', (800, 800) )
-                
-                # Apply EXIF orientation correction (cached)
-                image = self.apply_exif_orientation( image )
-                
-                # Get the available space (use cached values when possible)
-                if hasattr( label_widget, '_cached_size' ):
-                    available_width, available_height = label_widget._cached_size
-                else:
-                    label_widget.update_idletasks()  # Only when necessary
-                    available_width = label_widget.winfo_width()
-                    available_height = label_widget.winfo_height()
-                    
-                    # Use a minimum size if the widget hasn't been sized yet
-                    if available_width <= 1 or available_height <= 1:
-                        available_width = 400
-                        available_height = 400
-                    else:
-                        # Leave some padding around the image
-                        available_width -= 20
-                        available_height -= 20
-                    
-                    # Cache the size for future use
-                    label_widget._cached_size = (available_width, available_height)
-                    
-                # Calculate the scale factor to fit the image in the available space
-                img_width, img_height = image.size
-                scale_width = available_width / img_width
-                scale_height = available_height / img_height
-                scale_factor = min( scale_width, scale_height )
-                
-                # Calculate new dimensions
-                new_width = int( img_width * scale_factor )
-                new_height = int( img_height * scale_factor )
-                
-                # Use faster resampling for better performance during scrolling
-                resample_method = Image.Resampling.BILINEAR  # Faster than LANCZOS
-                resized_image = image.resize( (new_width, new_height), resample_method )
-                
-                photo = ImageTk.PhotoImage( resized_image )
-                
-                # Store original resolution for display
-                photo._image_resolution = f"{original_width}x{original_height}"
-                
-                # Cache the result
-                if not hasattr( self, '_preview_cache' ):
-                    self._preview_cache = {}
-                
-                # Limit cache size for memory management
-                if len( self._preview_cache ) > 20:  # Keep only recent previews
-                    # Remove oldest entries
-                    oldest_keys = list( self._preview_cache.keys() )[:10]
-                    for key in oldest_keys:
-                        del self._preview_cache[key]
-                
-                self._preview_cache[cache_key] = photo
+            available_size = self.get_preview_size( label_widget )
+            stored = self.get_stored_preview( filepath )
+            if stored is not None:
+                # The scan-time preview stands in without touching the original; the refine decodes it on idle
+                source, original_size = stored
+                label_widget._preview_source = None
+            else:
+                # Draft-decode and show a fast resample now; the high-quality pass runs on idle
+                source, original_size = self.decode_preview_source( filepath, available_size )
+                label_widget._preview_source = (filepath, source, original_size)
+            resized_image = self.scale_preview_image( source, available_size )
+            
+            # Update the path label with resolution
+            resolution_text = f"{filepath} - {original_size[0]}x{original_size[1]}"
+            if label_widget == self.browse_preview_label:
+                self.browse_path_label.configure( text=resolution_text )
+            elif label_widget == self.database_preview_label:
+                self.database_path_label.configure( text=resolution_text )
                 
-                label_widget.configure( image=photo, text="" )
-                label_widget.image = photo  # Keep a reference
+            photo = self._cache_preview_photo( cache_key, resized_image, original_size )
+            
+            label_widget.configure( image=photo, text="" )
+            label_widget.image = photo  # Keep a reference
             label_widget.current_image_path = filepath  # Store the current image path for resize events
+            self._schedule_preview_refine( label_widget )
             
         except Exception as e:
             label_widget.configure( image="", text=f"Error loading image:\n{str(e)}" )
             label_widget.image = None
             label_widget.current_image_path = None
+            label_widget._preview_source = None
             # Clear the path label on error
             if label_widget == self.browse_preview_label:
                 self.browse_path_label.configure( text="" )
             elif label_widget == self.database_preview_label:
                 self.database_path_label.configure( text="" )
             
+    def get_preview_size( self, label_widget ):
+        """Get the space available for a preview in label_widget (cached until the next resize)"""
+        if hasattr( label_widget, '_cached_size' ):
+            return label_widget._cached_size
+            
+        label_widget.update_idletasks()  # Only when necessary
+        available_width = label_widget.winfo_width()
+        available_height = label_widget.winfo_height()
+        
+        # Use a minimum size if the widget hasn't been sized yet
+        if available_width <= 1 or available_height <= 1:
+            available_width = 400
+            available_height = 400
+        else:
+            # Leave some padding around the image
+            available_width -= 20
+            available_height -= 20
+        
+        # Cache the size for future use
+        label_widget._cached_size = (available_width, available_height)
+        return label_widget._cached_size
+    
+    def get_image_orientation( self, filepath ):
+        """EXIF orientation recorded in the catalog for filepath, or None when unknown (browse files, old catalogs)"""
+        if not hasattr( self, 'virtual_image_list' ):
+            return None
+        item = self.virtual_image_list.get_item_for_path( filepath )
+        return item.get( 'orientation' ) if item else None
+    
+    def get_stored_preview( self, filepath ):
+        """Scan-time preview from the thumbnail store with the original size from the catalog, or None"""
+        if not self.thumbnail_store or not hasattr( self, 'virtual_image_list' ):
+            return None
+            
+        item = self.virtual_image_list.get_item_for_path( filepath )
+        if not item or not item.get( 'width' ) or not item.get( 'height' ):
+            return None
+            
+        img = self.thumbnail_store.get( filepath, self.scan_preview_size )
+        if img is None:
+            return None
+        return img, (item['width'], item['height'])
+    
+    def decode_preview_source( self, filepath, available_size ):
+        """Get a decoded image at no less than available_size with orientation applied; returns (image, original_size)"""
+        return self.decoded_image_cache.load( filepath, available_size, self.get_image_orientation( filepath ) )
+    
+    def scale_preview_image( self, source, available_size, resample=Image.Resampling.BILINEAR ):
+        """Scale a decoded source to fit available_size"""
+        # Calculate the scale factor to fit the image in the available space
+        img_width, img_height = source.size
+        scale_factor = min( available_size[0] / img_width, available_size[1] / img_height )
+        
+        # Calculate new dimensions
+        new_width = max( 1, int( img_width * scale_factor ) )
+        new_height = max( 1, int( img_height * scale_factor ) )
+        
+        # Fast passes pre-shrink with an integer reduce; LANCZOS runs the full filter
+        reducing_gap = 2.0 if resample != Image.Resampling.LANCZOS else None
+        return source.resize( (new_width, new_height), resample, reducing_gap=reducing_gap )
+    
+    def render_preview_image( self, filepath, available_size ):
+        """Decode and scale an image to fit available_size; returns (image, original_size) - no Tk calls, safe off-thread"""
+        source, original_size = self.decode_preview_source( filepath, available_size )
+        return self.scale_preview_image( source, available_size ), original_size
+    
+    def rescale_preview( self, label_widget ):
+        """Resize feedback from the source already in memory - the high-quality pass waits until resizing settles"""
+        filepath = getattr( label_widget, 'current_image_path', None )
+        source = getattr( label_widget, '_preview_source', None )
+        if not source or source[0] != filepath:
+            self.display_image_preview( filepath, label_widget )
+            return
+            
+        try:
+            available_size = self.get_preview_size( label_widget )
+            photo = ImageTk.PhotoImage( self.scale_preview_image( source[1], available_size ) )
+            photo._image_resolution = f"{source[2][0]}x{source[2][1]}"
+            
+            # Not cached - it is replaced as soon as the refine runs
+            label_widget.configure( image=photo, text="" )
+            label_widget.image = photo
+            self._schedule_preview_refine( label_widget )
+        except Exception as e:
+            print( f"Error rescaling preview: {e}" )
+    
+    def _schedule_preview_refine( self, label_widget, delay=150 ):
+        """Debounce the high-quality resample for a preview label"""
+        after_id = getattr( label_widget, '_refine_after_id', None )
+        if after_id:
+            self.root.after_cancel( after_id )
+        label_widget._refine_after_id = self.root.after( delay, lambda: self._refine_preview( label_widget ) )
+    
+    def _refine_preview( self, label_widget ):
+        """Replace the fast preview with a LANCZOS resample once scrolling or resizing has settled"""
+        label_widget._refine_after_id = None
+        filepath = getattr( label_widget, 'current_image_path', None )
+        if not filepath:
+            return
+            
+        try:
+            available_size = self.get_preview_size( label_widget )
+            source = getattr( label_widget, '_preview_source', None )
+            
+            # Decode again only if the in-memory source is for another file or too small for the new size
+            if source and source[0] == filepath:
+                source_image, original_size = source[1], source[2]
+                upscaling = min( available_size[0] / source_image.width, available_size[1] / source_image.height ) > 1
+                if upscaling and source_image.width * source_image.height < original_size[0] * original_size[1]:
+                    source = None
+            if not source or source[0] != filepath:
+                source_image, original_size = self.decode_preview_source( filepath, available_size )
+                label_widget._preview_source = (filepath, source_image, original_size)
+                
+            resized_image = self.scale_preview_image( source_image, available_size, Image.Resampling.LANCZOS )
+            photo = self._cache_preview_photo( f"{filepath}_{id(label_widget)}", resized_image, original_size )
+            photo._refined = True
+            
+            # Still showing this image
+            if label_widget.current_image_path == filepath:
+                label_widget.configure( image=photo, text="" )
+                label_widget.image = photo
+                
+        except Exception as e:
+            print( f"Error refining preview for {filepath}: {e}" )
+    
+    def _cache_preview_photo( self, cache_key, image, original_size ):
+        """Convert a scaled preview to a PhotoImage and cache it - Tk thread only"""
+        photo = ImageTk.PhotoImage( image )
+        
+        # Store original resolution for display
+        photo._image_resolution = f"{original_size[0]}x{original_size[1]}"
+        
+        # Cache the result (the cache manager evicts least recently used previews)
+        self._preview_cache[cache_key] = photo
+        return photo
+    
+    def prefetch_preview_neighbors( self, sequence, index, label_widget, direction=1 ):
+        """Decode the images around index in the background at the label's current size"""
+        available_size = getattr( label_widget, '_cached_size', None )
+        if not available_size:
+            return
+        
+        # Neighbours of the previous position are no longer worth decoding
+        self.preview_pool.clear_pending()
+        
+        # Nearest first, direction of travel before the way back
+        offsets = []
+        for step in range( 1, self.preview_prefetch_count + 1 ):
+            offsets.extend( (step * direction, -step * direction) )
+            
+        for offset in offsets:
+            neighbor_index = index + offset
+            if not 0 <= neighbor_index < len( sequence ):
+                continue
+            
+            # filtered_items holds dicts, browse_folder_images plain paths
+            item = sequence[neighbor_index]
+            filepath = item.get( 'filepath' ) if isinstance( item, dict ) else item
+            if not filepath:
+                continue
+                
+            cache_key = f"{filepath}_{id(label_widget)}"
+            if cache_key in self._preview_cache or self.preview_pool.is_pending( cache_key ):
+                continue
+            if not self.preview_pool.submit( cache_key, self._prefetch_preview_job, filepath, label_widget, available_size ):
+                break
+                
+        self._schedule_preview_drain()
+    
+    def _prefetch_preview_job( self, filepath, label_widget, available_size ):
+        """Preview pool job - label_widget is only passed through for the Tk thread"""
+        if not os.path.exists( filepath ):
+            return None
+        resized_image, original_size = self.render_preview_image( filepath, available_size )
+        return (label_widget, available_size, resized_image, original_size)
+    
+    def _schedule_preview_drain( self ):
+        """Make sure a single drain of the preview pool is scheduled"""
+        if self._preview_drain_after_id is None:
+            self._preview_drain_after_id = self.root.after( 16, self._drain_preview_results )
+    
+    def _drain_preview_results( self ):
+        """Move finished preview prefetches into the preview cache"""
+        self._preview_drain_after_id = None
+        self.preview_pool.drain( self._apply_prefetched_preview, time_budget=0.008 )
+        
+        if not self.preview_pool.is_idle():
+            self._schedule_preview_drain()
+    
+    def _apply_prefetched_preview( self, cache_key, result ):
+        """Preview pool drain callback - cache the prefetched preview unless it is stale"""
+        if not result:
+            return
+            
+        label_widget, available_size, resized_image, original_size = result
+        
+        # Label was resized while decoding - this preview has the wrong size
+        if getattr( label_widget, '_cached_size', None ) != available_size:
+            return
+        if cache_key in self._preview_cache:
+            return
+            
+        self._cache_preview_photo( cache_key, resized_image, original_size )
+    
     def enter_fullscreen_mode( self, filepath ):
-        """Enter fullscreen mode for viewing images with lazy loading for large databases"""
+        """Enter fullscreen mode over a snapshot of the current image list"""
         self.previous_tab = self.notebook.index( self.notebook.select() )
         
         # Determine which tab we're in and get appropriate image list
         current_tab = self.notebook.index( self.notebook.select() )
         
         if current_tab == 1 and self.current_database_path:  # Database tab
-            # Use lazy loading approach - store filenames instead of resolving all paths
-            self.fullscreen_filenames = []
-            self.fullscreen_images = []  # Keep for compatibility but will be populated lazily
-            self.fullscreen_paths_cache.clear()  # Clear path cache
+            # Snapshot the filtered list (id + full path) so navigation never goes back to the database
+            snapshot = [(item.get( 'id' ), item['filepath']) for item in self.virtual_image_list.filtered_items if item.get( 'filepath' )]
+            self.fullscreen_image_ids = [image_id for image_id, path in snapshot]
+            self.fullscreen_images = [path for image_id, path in snapshot]
             
-            # Get current filtered filenames from listbox
-            for i in range( self.database_image_listbox.size() ):
-                self.fullscreen_filenames.append( self.database_image_listbox.get( i ) )
-            
-            # Find current image index by filename
-            current_filename = os.path.basename( filepath ) if filepath else ""
+            # Find current image index by full path - filenames can repeat across folders
             try:
-                self.fullscreen_index = self.fullscreen_filenames.index( current_filename ) if current_filename in self.fullscreen_filenames else 0
+                self.fullscreen_index = self.fullscreen_images.index( filepath )
             except ValueError:
-                # Fallback: add current image as the only item
-                self.fullscreen_filenames = [current_filename] if current_filename else []
+                # Fallback: current image as the only item
+                self.fullscreen_image_ids = [None] if filepath else []
+                self.fullscreen_images = [filepath] if filepath else []
                 self.fullscreen_index = 0
-            
-            # Cache the current image path
-            if current_filename and filepath:
-                self.fullscreen_paths_cache[current_filename] = filepath
                 
         else:  # Browse tab or fallback
             # Get list of images in the same directory
             directory = os.path.dirname( filepath )
             self.fullscreen_images = []
+            self.fullscreen_image_ids = []
             
             try:
                 for file in sorted( os.listdir( directory ) ):
@@ -2598,79 +3718,261 @@ class ImageViewer:
         
     def on_fullscreen_previous( self, event ):
         """Navigate to previous image in fullscreen mode"""
-        max_images = len( self.fullscreen_filenames ) if self.fullscreen_filenames else len( self.fullscreen_images )
-        if max_images and self.fullscreen_index > 0:
-            self.fullscreen_index -= 1
-            self.display_fullscreen_image()
+        self.step_fullscreen( -1 )
             
     def on_fullscreen_next( self, event ):
         """Navigate to next image in fullscreen mode"""
-        max_images = len( self.fullscreen_filenames ) if self.fullscreen_filenames else len( self.fullscreen_images )
-        if max_images and self.fullscreen_index < max_images - 1:
-            self.fullscreen_index += 1
-            self.display_fullscreen_image()
+        self.step_fullscreen( 1 )
+    
+    def step_fullscreen( self, delta ):
+        """Move fullscreen_index by delta - rendering is coalesced so only the latest position is drawn"""
+        max_images = len( self.fullscreen_images )
+        if not max_images:
+            return
+        
+        # Don't wrap
+        new_index = max( 0, min( max_images - 1, self.fullscreen_index + delta ) )
+        if new_index == self.fullscreen_index:
+            return
+            
+        self.fullscreen_index = new_index
+        self._fullscreen_direction = 1 if delta > 0 else -1
+        
+        # Key auto-repeat (or a fast wheel) steps faster than an image can be decoded
+        now = time.perf_counter()
+        if now - self._fullscreen_last_step < self.fullscreen_rapid_interval:
+            self._fullscreen_rapid = True
+        self._fullscreen_last_step = now
+        
+        # Events that queue up while a frame renders only move the index - the idle callback draws the last one
+        if self._fullscreen_render_after_id is None:
+            self._fullscreen_render_after_id = self.root.after_idle( self._render_fullscreen_step )
+        
+        # The key counts as released once steps stop arriving (X11 auto-repeat also sends release events)
+        if self._fullscreen_rapid:
+            if self._fullscreen_settle_after_id:
+                self.root.after_cancel( self._fullscreen_settle_after_id )
+            self._fullscreen_settle_after_id = self.root.after( self.fullscreen_settle_delay, self._end_rapid_navigation )
+    
+    def _render_fullscreen_step( self ):
+        """Draw the current fullscreen position - cached images only while navigation is rapid"""
+        self._fullscreen_render_after_id = None
+        if not self.fullscreen_window:
+            return
+            
+        if self._fullscreen_rapid:
+            self.display_fullscreen_placeholder()
+        else:
+            self.display_fullscreen_image( direction=self._fullscreen_direction )
+    
+    def _end_rapid_navigation( self ):
+        """Render the landing image at full quality once rapid navigation stops"""
+        self._fullscreen_settle_after_id = None
+        self._fullscreen_rapid = False
+        if self.fullscreen_window:
+            self.display_fullscreen_image( direction=self._fullscreen_direction )
+    
+    def display_fullscreen_placeholder( self ):
+        """Show the current image from whatever is already decoded, without decoding the original"""
+        filepath = self.get_fullscreen_image_path( self.fullscreen_index )
+        if not filepath:
+            return
+            
+        try:
+            screen_size = (self.fullscreen_window.winfo_screenwidth(), self.fullscreen_window.winfo_screenheight())
+            photo = self.get_fullscreen_placeholder( filepath, screen_size )
+            
+            # Nothing cached - keep the previous frame, the title still tracks the position
+            if photo is not None:
+                self.fullscreen_label.configure( image=photo )
+                self.fullscreen_label.image = photo
+                
+            self.update_fullscreen_title( filepath )
+            
+        except Exception as e:
+            print( f"Error showing fullscreen placeholder for {filepath}: {e}" )
+        
+        # Keep the ring moving with the navigation so the landing image is likely ready
+        self.prefetch_fullscreen_ring( self._fullscreen_direction )
+    
+    def get_fullscreen_placeholder( self, filepath, screen_size ):
+        """Return a PhotoImage for filepath from the prefetch ring, a cached preview or a stored thumbnail, or None"""
+        photo = self._fullscreen_ring.get( (filepath, screen_size) )
+        if photo is not None:
+            return photo
+        
+        # Previews are shown as-is (smaller than the screen) - no resampling at all
+        for label_widget in (self.database_preview_label, self.browse_preview_label):
+            photo = self._preview_cache.get( f"{filepath}_{id(label_widget)}" )
+            if photo is not None:
+                return photo
+        
+        # Stored scan-time preview, then the list thumbnail - small JPEGs, cheap to upscale
+        if self.thumbnail_store:
+            for size in (self.scan_preview_size, self.virtual_image_list.thumbnail_size):
+                img = self.thumbnail_store.get( filepath, size )
+                if img is not None:
+                    return ImageTk.PhotoImage( self.scale_preview_image( img, screen_size ) )
+                    
+        return None
+    
+    def update_fullscreen_title( self, filepath ):
+        """Show the filename and position in the fullscreen window title"""
+        filename = os.path.basename( filepath )
+        self.fullscreen_window.title( f"Fullscreen View - {filename} ({self.fullscreen_index + 1}/{len(self.fullscreen_images)})" )
         
-    def display_fullscreen_image( self ):
-        """Display the current image in fullscreen mode with lazy loading"""
-        # Use lazy loading approach for database images
+    def display_fullscreen_image( self, direction=1 ):
+        """Display the current image in fullscreen mode, from the prefetch ring when it is ready"""
         filepath = self.get_fullscreen_image_path( self.fullscreen_index )
         
         if not filepath:
             return
         
         try:
-            image = Image.open( filepath )
+            # Get screen dimensions
+            screen_size = (self.fullscreen_window.winfo_screenwidth(), self.fullscreen_window.winfo_screenheight())
+            ring_key = (filepath, screen_size)
+            
+            photo = self._fullscreen_ring.get( ring_key )
+            if photo is None:
+                # Not prefetched (first image or a jump) - fast resample now, LANCZOS once navigation pauses
+                image = self.render_fullscreen_image( filepath, screen_size, self.get_image_orientation( filepath ),
+                                                      Image.Resampling.BILINEAR )
+                photo = ImageTk.PhotoImage( image )
+                photo._refined = False
+                self._fullscreen_ring[ring_key] = photo
             
-            # Apply EXIF orientation correction
-            image = self.apply_exif_orientation( image )
+            self.fullscreen_label.configure( image=photo )
+            self.fullscreen_label.image = photo
             
-            # Get screen dimensions
-            screen_width = self.fullscreen_window.winfo_screenwidth()
-            screen_height = self.fullscreen_window.winfo_screenheight()
+            if not getattr( photo, '_refined', True ):
+                self._schedule_fullscreen_refine()
             
-            # Calculate size to fit screen while maintaining aspect ratio
-            image_ratio = image.width / image.height
-            screen_ratio = screen_width / screen_height
+            # Update window title
+            self.update_fullscreen_title( filepath )
             
-            if image_ratio > screen_ratio:
-                # Image is wider than screen ratio
-                new_width = screen_width
-                new_height = int( screen_width / image_ratio )
-            else:
-                # Image is taller than screen ratio
-                new_height = screen_height
-                new_width = int( screen_height * image_ratio )
-                
-            image = image.resize( (new_width, new_height), Image.Resampling.LANCZOS )
+        except Exception as e:
+            self.fullscreen_label.configure( image="", text=f"Error loading image: {str(e)}", fg='white' )
+            self.fullscreen_label.image = None
+            
+        # Decode the next images while this one is being looked at
+        self.prefetch_fullscreen_ring( direction )
+    
+    def render_fullscreen_image( self, filepath, screen_size, orientation=None, resample=Image.Resampling.LANCZOS ):
+        """Decode an image and fit it to the screen - safe to call from worker threads"""
+        # Oriented source from the shared cache, decoded at the smallest draft/reduce scale covering the screen
+        image, original_size = self.decoded_image_cache.load( filepath, screen_size, orientation )
+        return self.scale_preview_image( image, screen_size, resample )
+    
+    def _schedule_fullscreen_refine( self ):
+        """Debounce the high-quality resample of the current fullscreen image"""
+        if self._fullscreen_refine_after_id:
+            self.root.after_cancel( self._fullscreen_refine_after_id )
+        self._fullscreen_refine_after_id = self.root.after( self.fullscreen_refine_delay, self._refine_fullscreen_image )
+    
+    def _refine_fullscreen_image( self ):
+        """Replace the fast fullscreen render with a LANCZOS resample once navigation has settled"""
+        self._fullscreen_refine_after_id = None
+        if not self.fullscreen_window:
+            return
+            
+        filepath = self.get_fullscreen_image_path( self.fullscreen_index )
+        if not filepath:
+            return
+            
+        try:
+            screen_size = (self.fullscreen_window.winfo_screenwidth(), self.fullscreen_window.winfo_screenheight())
+            image = self.render_fullscreen_image( filepath, screen_size, self.get_image_orientation( filepath ) )
             photo = ImageTk.PhotoImage( image )
+            photo._refined = True
+            self._fullscreen_ring[(filepath, screen_size)] = photo
             
             self.fullscreen_label.configure( image=photo )
             self.fullscreen_label.image = photo
             
-            # Update window title
-            filename = os.path.basename( filepath )
-            self.fullscreen_window.title( f"Fullscreen View - {filename} ({self.fullscreen_index + 1}/{len(self.fullscreen_images)})" )
-            
         except Exception as e:
-            self.fullscreen_label.configure( image="", text=f"Error loading image: {str(e)}", fg='white' )
-            self.fullscreen_label.image = None
+            print( f"Error refining fullscreen image {filepath}: {e}" )
+    
+    def prefetch_fullscreen_ring( self, direction=1 ):
+        """Queue background decodes for the images ahead of and behind fullscreen_index"""
+        if not self.fullscreen_window:
+            return
             
-    def on_fullscreen_scroll( self, event ):
-        """Handle mouse wheel in fullscreen mode with lazy loading"""
-        max_images = len( self.fullscreen_filenames ) if self.fullscreen_filenames else len( self.fullscreen_images )
-        if not max_images:
+        max_images = len( self.fullscreen_images )
+        screen_size = (self.fullscreen_window.winfo_screenwidth(), self.fullscreen_window.winfo_screenheight())
+        
+        # Positions queued for the previous index are no longer the most useful ones
+        self.fullscreen_pool.clear_pending()
+        
+        # Nearest first, with the direction of travel getting the larger share of the ring
+        offsets = [0]
+        for step in range( 1, max( self.fullscreen_prefetch_ahead, self.fullscreen_prefetch_behind ) + 1 ):
+            if step <= self.fullscreen_prefetch_ahead:
+                offsets.append( step * direction )
+            if step <= self.fullscreen_prefetch_behind:
+                offsets.append( -step * direction )
+                
+        ring_keys = set()
+        for offset in offsets:
+            index = self.fullscreen_index + offset
+            if not 0 <= index < max_images:
+                continue
+                
+            filepath = self.get_fullscreen_image_path( index )
+            if not filepath:
+                continue
+                
+            ring_key = (filepath, screen_size)
+            ring_keys.add( ring_key )
+            if ring_key in self._fullscreen_ring or self.fullscreen_pool.is_pending( ring_key ):
+                continue
+            self.fullscreen_pool.submit( ring_key, self._prefetch_fullscreen_job, filepath, screen_size,
+                                         self.get_image_orientation( filepath ) )
+        
+        # Release the screen-sized images that fell out of the ring
+        for ring_key in list( self._fullscreen_ring ):
+            if ring_key not in ring_keys:
+                del self._fullscreen_ring[ring_key]
+        self._fullscreen_ring_keys = ring_keys
+        
+        self._schedule_fullscreen_drain()
+    
+    def _prefetch_fullscreen_job( self, filepath, screen_size, orientation ):
+        """Fullscreen pool job - returns the screen-fitted image, PhotoImage creation stays on the Tk thread"""
+        if not os.path.exists( filepath ):
+            return None
+        image = self.render_fullscreen_image( filepath, screen_size, orientation )
+        image.load()
+        return image
+    
+    def _schedule_fullscreen_drain( self ):
+        """Make sure a single drain of the fullscreen pool is scheduled"""
+        if self._fullscreen_drain_after_id is None:
+            self._fullscreen_drain_after_id = self.root.after( 16, self._drain_fullscreen_results )
+    
+    def _drain_fullscreen_results( self ):
+        """Move finished fullscreen prefetches into the ring"""
+        self._fullscreen_drain_after_id = None
+        self.fullscreen_pool.drain( self._apply_prefetched_fullscreen, time_budget=0.008 )
+        
+        if not self.fullscreen_pool.is_idle():
+            self._schedule_fullscreen_drain()
+    
+    def _apply_prefetched_fullscreen( self, ring_key, image ):
+        """Fullscreen pool drain callback - keep the image only if it is still inside the ring"""
+        if image is None or not self.fullscreen_window:
+            return
+        if ring_key not in self._fullscreen_ring_keys or ring_key in self._fullscreen_ring:
             return
             
-        if event.delta > 0:
-            # Scroll up - previous image (don't wrap)
-            if self.fullscreen_index > 0:
-                self.fullscreen_index -= 1
-                self.display_fullscreen_image()
-        else:
-            # Scroll down - next image (don't wrap)
-            if self.fullscreen_index < max_images - 1:
-                self.fullscreen_index += 1
-                self.display_fullscreen_image()
+        photo = ImageTk.PhotoImage( image )
+        photo._refined = True  # Prefetch renders with LANCZOS off the Tk thread
+        self._fullscreen_ring[ring_key] = photo
+    
+    def on_fullscreen_scroll( self, event ):
+        """Handle mouse wheel in fullscreen mode"""
+        # Scroll up - previous image, scroll down - next image
+        self.step_fullscreen( -1 if event.delta > 0 else 1 )
         
     def exit_fullscreen_mode( self, event=None ):
         """Exit fullscreen mode and return to previous tab"""
@@ -2678,6 +3980,18 @@ class ImageViewer:
             self.fullscreen_window.destroy()
             self.fullscreen_window = None
             
+        # Cancel pending renders and drop the prefetch ring - screen-sized images are large
+        for after_id in (self._fullscreen_refine_after_id, self._fullscreen_render_after_id, self._fullscreen_settle_after_id):
+            if after_id:
+                self.root.after_cancel( after_id )
+        self._fullscreen_refine_after_id = None
+        self._fullscreen_render_after_id = None
+        self._fullscreen_settle_after_id = None
+        self._fullscreen_rapid = False
+        self.fullscreen_pool.clear_pending()
+        self._fullscreen_ring.clear()
+        self._fullscreen_ring_keys = set()
+        
         if self.previous_tab is not None:
             self.notebook.select( self.previous_tab )
             
@@ -2694,6 +4008,8 @@ class ImageViewer:
         current_tab = self.notebook.index( self.notebook.select() )
         if current_tab == 1:  # Database tab
             self.refresh_database_view()
+            # Thumbnail loading is suspended while the list is hidden - request the viewport again
+            self.virtual_image_list.request_visible_thumbnails()
             # Restore paned positions when switching to database tab
             self.root.after( 100, self.restore_paned_positions )
         
@@ -2730,6 +4046,9 @@ class ImageViewer:
                     relative_path TEXT NOT NULL UNIQUE,
                     width INTEGER,
                     height INTEGER,
+                    orientation INTEGER,
+                    format TEXT,
+                    file_size INTEGER,
                     rating INTEGER DEFAULT 0,
                     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
@@ -2765,6 +4084,23 @@ class ImageViewer:
         except Exception as e:
             messagebox.showerror( "Error", f"Failed to create database: {str(e)}" )
     
+    def ensure_image_metadata_columns( self, conn ):
+        """Add the scan-time metadata columns to catalogs created before they existed"""
+        try:
+            existing = {row[1] for row in conn.execute( "PRAGMA table_info(images)" )}
+            # NULL means not recorded yet - rendering falls back to reading the file header
+            for name, definition in (('orientation', 'INTEGER'), ('format', 'TEXT'), ('file_size', 'INTEGER')):
+                if name not in existing:
+                    conn.execute( f"ALTER TABLE images ADD COLUMN {name} {definition}" )
+            conn.commit()
+        except Exception as e:
+            print( f"Error upgrading database schema: {e}" )
+    
+    def read_image_metadata( self, filepath, img ):
+        """Header-only metadata recorded at scan time: (width, height, orientation, format, file_size)"""
+        width, height = img.size
+        return (width, height, self.thumbnail_decoder.get_orientation( img ), img.format, os.path.getsize( filepath ))
+    
     def ensure_database_indexes( self, conn=None ):
         """Ensure database indexes exist for better query performance"""
         try:
@@ -2778,6 +4114,7 @@ class ImageViewer:
             # Create indexes for common queries
             indexes = [
                 "CREATE INDEX IF NOT EXISTS idx_images_filename ON images(filename)",
+                "CREATE INDEX IF NOT EXISTS idx_images_filename_nocase ON images(filename COLLATE NOCASE, id)",  # List order
                 "CREATE INDEX IF NOT EXISTS idx_images_rating ON images(rating)",
                 "CREATE INDEX IF NOT EXISTS idx_image_tags_image_id ON image_tags(image_id)",
                 "CREATE INDEX IF NOT EXISTS idx_image_tags_tag_id ON image_tags(tag_id)",
@@ -2908,6 +4245,9 @@ class ImageViewer:
                     relative_path TEXT NOT NULL UNIQUE,
                     width INTEGER,
                     height INTEGER,
+                    orientation INTEGER,
+                    format TEXT,
+                    file_size INTEGER,
                     rating INTEGER DEFAULT 0,
                     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
@@ -2975,6 +4315,9 @@ class ImageViewer:
                     relative_path TEXT NOT NULL UNIQUE,
                     width INTEGER,
                     height INTEGER,
+                    orientation INTEGER,
+                    format TEXT,
+                    file_size INTEGER,
                     rating INTEGER DEFAULT 0,
                     created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
@@ -3017,18 +4360,18 @@ class ImageViewer:
                 filepath = os.path.join( root, file )
                 if self.is_image_file( filepath ):
                     try:
-                        # Get image dimensions
+                        # Get image dimensions, orientation and format from the header
                         with Image.open( filepath ) as img:
-                            width, height = img.size
+                            metadata = self.read_image_metadata( filepath, img )
                             
                         # Calculate relative path
                         relative_path = os.path.relpath( filepath, directory )
                         
                         # Insert into database (or replace if duplicate relative_path exists)
                         cursor.execute( '''
-                            INSERT OR REPLACE INTO images (filename, relative_path, width, height)
-                            VALUES (?, ?, ?, ?)
-                        ''', (file, relative_path, width, height) )
+                            INSERT OR REPLACE INTO images (filename, relative_path, width, height, orientation, format, file_size)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
+                        ''', (file, relative_path) + metadata )
                         
                     except Exception as e:
                         print( f"Error processing {filepath}: {e}" )
@@ -3049,6 +4392,8 @@ class ImageViewer:
             'db_path': db_path,
             'directory': directory,
             'progress_dialog': progress_dialog,
+            'thumbnail_sizes': self.get_scan_thumbnail_sizes(),  # Read the Tk variables here, not in the worker
+            'store': self.get_open_thumbnail_store( db_path ),  # A second connection would wait on the open store's write lock
             'exception': None,
             'completed': False
         }
@@ -3060,16 +4405,56 @@ class ImageViewer:
         # Start asynchronous monitoring from main thread
         self._schedule_progress_monitoring( thread_data, scan_thread )
     
+    def get_scan_thumbnail_sizes( self ):
+        """Thumbnail sizes to write to the store while scanning, according to the Options menu"""
+        sizes = []
+        if self.generate_thumbnails_on_scan.get():
+            list_size = self.virtual_image_list.thumbnail_size if hasattr( self, 'virtual_image_list' ) else (48, 48)
+            sizes.append( list_size )
+        if self.generate_previews_on_scan.get():
+            sizes.append( self.scan_preview_size )
+        return sizes
+    
+    def store_scan_thumbnails( self, store, filepath, img, sizes, orientation=None ):
+        """Generate thumbnails from an image that is already open for the scan and write them to the store"""
+        try:
+            for size, thumb in zip( sizes, self.thumbnail_decoder.decode_sizes( img, sizes, orientation=orientation ) ):
+                store.put( filepath, size, thumb )
+        except Exception as e:
+            # Not fatal - the list falls back to decoding on demand
+            print( f"Error generating scan thumbnails for {filepath}: {e}" )
+    
+    def generate_thumbnails_in_background( self, store, jobs, sizes ):
+        """Write thumbnails for (filepath, orientation) jobs to the store from a worker thread"""
+        def generate():
+            for filepath, orientation in jobs:
+                try:
+                    with Image.open( filepath ) as img:
+                        self.store_scan_thumbnails( store, filepath, img, sizes, orientation )
+                except Exception as e:
+                    print( f"Error generating thumbnail for {filepath}: {e}" )
+            store.flush()
+            
+        threading.Thread( target=generate, daemon=True ).start()
+    
     def _scan_worker_thread( self, thread_data ):
         """Worker thread for scanning directory and processing images"""
         conn = None
+        store = None
         try:
             db_path = thread_data['db_path']
             directory = thread_data['directory']
+            thumbnail_sizes = thread_data.get( 'thumbnail_sizes' )
             
             # Create database connection in worker thread
             conn = sqlite3.connect( db_path )
             cursor = conn.cursor()
+            # An existing catalog being overwritten may predate the metadata columns
+            self.ensure_image_metadata_columns( conn )
+            
+            # Thumbnails are generated from the same open file handle used to read the dimensions
+            if thumbnail_sizes:
+                store = thread_data['store'] or ThumbnailStore( db_path )
             
             # First pass: count total files for progress calculation
             total_files = 0
@@ -3101,16 +4486,18 @@ class ImageViewer:
                     return
                     
                 try:
-                    # Get image dimensions
+                    # Record dimensions, orientation and format once, from the header
                     with Image.open( filepath ) as img:
-                        width, height = img.size
+                        metadata = self.read_image_metadata( filepath, img )
+                        if store:
+                            self.store_scan_thumbnails( store, filepath, img, thumbnail_sizes, metadata[2] )
                         
                     # Calculate relative path
                     relative_path = os.path.relpath( filepath, directory )
                     filename = os.path.basename( filepath )
                     
                     # Add to batch
-                    batch_data.append( (filename, relative_path, width, height) )
+                    batch_data.append( (filename, relative_path) + metadata )
                     successful += 1
                     
                 except Exception as e:
@@ -3123,8 +4510,8 @@ class ImageViewer:
                     if batch_data:
                         # Batch insert for better performance (or replace if duplicate relative_path exists)
                         cursor.executemany( '''
-                            INSERT OR REPLACE INTO images (filename, relative_path, width, height)
-                            VALUES (?, ?, ?, ?)
+                            INSERT OR REPLACE INTO images (filename, relative_path, width, height, orientation, format, file_size)
+                            VALUES (?, ?, ?, ?, ?, ?, ?)
                         ''', batch_data )
                         
                         # Commit batch
@@ -3142,6 +4529,11 @@ class ImageViewer:
         finally:
             if conn:
                 conn.close()
+            if store and store is thread_data['store']:
+                # Shared with the UI - commit what the scan wrote and leave it open
+                store.flush()
+            elif store:
+                store.close()
             thread_data['completed'] = True
             print( f"Worker thread completed. Processed: {processed}, Successful: {successful}, Total: {total_files}" )
     
@@ -3250,6 +4642,9 @@ class ImageViewer:
                 
                 self.current_database_path = db_path
                 self.current_database = directory
+                self.open_catalog_connections( db_path )
+                self.open_thumbnail_store( db_path )
+                self.load_filter_index()
                 self.notebook.select( 1 )  # Switch to Database tab (this will call refresh_database_view via on_tab_changed)
                 
                 # Save the database state and update recent databases
@@ -3382,13 +4777,17 @@ class ImageViewer:
                 messagebox.showerror( "Error", "Invalid database file - missing required tables" )
                 return
             
-            # Ensure database indexes exist for better performance
+            # Ensure database indexes and metadata columns exist
             conn = sqlite3.connect( db_path )
+            self.ensure_image_metadata_columns( conn )
             self.ensure_database_indexes( conn )
             conn.close()
                 
             self.current_database_path = db_path
             self.current_database = os.path.dirname( db_path )
+            self.open_catalog_connections( db_path )
+            self.open_thumbnail_store( db_path )
+            self.load_filter_index()
             self.notebook.select( 1 )  # Switch to Database tab
             
             # Always refresh database view (in case tab was already selected)
@@ -3402,6 +4801,91 @@ class ImageViewer:
         except Exception as e:
             messagebox.showerror( "Error", f"Failed to open database: {str(e)}" )
             
+    def open_catalog_connections( self, db_path ):
+        """Replace the catalog connections with ones for db_path"""
+        if self.catalog and self.catalog.database_path == db_path:
+            return
+            
+        if self.catalog:
+            self.catalog.close()
+            self.catalog = None
+            
+        self.catalog = CatalogConnections( db_path )
+    
+    def load_filter_index( self ):
+        """Build the in-memory filter index for the open catalog in the background"""
+        if not self.current_database_path:
+            return
+        
+        # Filters use SQL until the new index is ready
+        self.filter_index = None
+        self._filter_index_build += 1
+        self._pending_index_updates = []
+        
+        build = self._filter_index_build
+        db_path = self.current_database_path
+        index = CatalogFilterIndex( os.path.dirname( db_path ) )
+        show_thumbnails = self.show_thumbnails.get()
+        
+        def build_index():
+            try:
+                conn = sqlite3.connect( db_path )
+                index.load( conn, show_thumbnails )
+                conn.close()
+                self.root.after( 0, lambda: self._install_filter_index( build, index ) )
+            except Exception as e:
+                print( f"Error building filter index: {e}" )
+                
+        threading.Thread( target=build_index, daemon=True ).start()
+    
+    def _install_filter_index( self, build, index ):
+        """Start filtering with a finished index unless the catalog or a newer build replaced it"""
+        if build != self._filter_index_build:
+            return
+            
+        self.filter_index = index
+        
+        # Writes made while the index was loading may have been missed
+        if self._pending_index_updates:
+            self.update_filter_index( self._pending_index_updates )
+            self._pending_index_updates = []
+    
+    def update_filter_index( self, filepaths ):
+        """Patch the filter index after rating or tag writes to these files"""
+        if not self.filter_index:
+            if self._filter_index_build:
+                self._pending_index_updates.extend( filepaths )
+            return
+            
+        try:
+            database_dir = os.path.dirname( self.current_database_path )
+            relative_paths = [os.path.relpath( filepath, database_dir ) for filepath in filepaths]
+            self.filter_index.update_images( self.catalog.reader(), relative_paths )
+        except Exception as e:
+            print( f"Error updating filter index: {e}" )
+            # Stale bits would hide or show the wrong images - rebuild instead
+            self.load_filter_index()
+    
+    def get_open_thumbnail_store( self, db_path ):
+        """Return the open thumbnail store if it belongs to db_path, otherwise None"""
+        if self.thumbnail_store and os.path.abspath( self.thumbnail_store.catalog_path ) == os.path.abspath( db_path ):
+            return self.thumbnail_store
+        return None
+    
+    def open_thumbnail_store( self, db_path ):
+        """Open the persistent thumbnail store that sits next to the catalog database"""
+        if self.thumbnail_store and self.thumbnail_store.catalog_path == db_path:
+            return
+            
+        if self.thumbnail_store:
+            self.thumbnail_store.close()
+            self.thumbnail_store = None
+            
+        try:
+            self.thumbnail_store = ThumbnailStore( db_path )
+        except Exception as e:
+            print( f"Error opening thumbnail store: {e}" )
+    
     def rescan_database( self ):
         """Rescan the database directory for new/removed images"""
         if not self.current_database_path:
@@ -3412,13 +4896,27 @@ class ImageViewer:
             conn = sqlite3.connect( self.current_database_path )
             cursor = conn.cursor()
             
-            # Get current images in database
-            cursor.execute( "SELECT id, relative_path FROM images" )
-            db_images = {row[1]: row[0] for row in cursor.fetchall()}
+            # New images get their thumbnails from a worker once the rescan is done - only headers are read here
+            thumbnail_sizes = self.get_scan_thumbnail_sizes()
+            if thumbnail_sizes:
+                self.open_thumbnail_store( self.current_database_path )
+            store = self.thumbnail_store if thumbnail_sizes else None
+            thumbnail_jobs = []
+            
+            # Get current images in database - rows without a format predate the metadata columns
+            self.ensure_image_metadata_columns( conn )
+            cursor.execute( "SELECT id, relative_path, format FROM images" )
+            db_images = {}
+            missing_metadata = set()
+            for image_id, relative_path, image_format in cursor.fetchall():
+                db_images[relative_path] = image_id
+                if image_format is None:
+                    missing_metadata.add( relative_path )
             
             # Scan directory for current images and collect new ones for batch processing
             current_images = set()
             new_images_batch = []
+            metadata_updates = []
             images_to_delete = []
             
             for root, dirs, files in os.walk( self.current_database ):
@@ -3432,18 +4930,32 @@ class ImageViewer:
                         if relative_path not in db_images:
                             try:
                                 with Image.open( filepath ) as img:
-                                    width, height = img.size
-                                    
-                                new_images_batch.append( (file, relative_path, width, height) )
+                                    metadata = self.read_image_metadata( filepath, img )
+                                new_images_batch.append( (file, relative_path) + metadata )
+                                thumbnail_jobs.append( (filepath, metadata[2]) )
                             except Exception as e:
                                 print( f"Error processing {filepath}: {e}" )
+                        elif relative_path in missing_metadata:
+                            # Backfill catalogs scanned before orientation/format/size were recorded
+                            try:
+                                with Image.open( filepath ) as img:
+                                    metadata = self.read_image_metadata( filepath, img )
+                                metadata_updates.append( metadata + (db_images[relative_path],) )
+                            except Exception as e:
+                                print( f"Error reading metadata for {filepath}: {e}" )
                                 
             # Batch insert new images (ignore if duplicate relative_path exists to preserve ratings)
             if new_images_batch:
                 cursor.executemany( '''
-                    INSERT OR IGNORE INTO images (filename, relative_path, width, height)
-                    VALUES (?, ?, ?, ?)
+                    INSERT OR IGNORE INTO images (filename, relative_path, width, height, orientation, format, file_size)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
                 ''', new_images_batch )
+                
+            if metadata_updates:
+                cursor.executemany( '''
+                    UPDATE images SET width = ?, height = ?, orientation = ?, format = ?, file_size = ?
+                    WHERE id = ?
+                ''', metadata_updates )
                                 
             # Collect images to delete for batch processing
             for relative_path, image_id in db_images.items():
@@ -3460,6 +4972,10 @@ class ImageViewer:
             conn.commit()
             conn.close()
             
+            if store and thumbnail_jobs:
+                self.generate_thumbnails_in_background( store, thumbnail_jobs, thumbnail_sizes )
+                
+            self.load_filter_index()
             self.refresh_database_view()
             
             messagebox.showinfo( "Success", "Database rescan completed successfully" )
@@ -3467,6 +4983,177 @@ class ImageViewer:
         except Exception as e:
             messagebox.showerror( "Error", f"Failed to rescan database: {str(e)}" )
             
+    def build_all_thumbnails( self ):
+        """Generate missing or stale thumbnails for every image in the catalog using a process pool"""
+        if not self.current_database_path:
+            messagebox.showwarning( "Warning", "No database is currently open" )
+            return
+            
+        self.open_thumbnail_store( self.current_database_path )
+        if not self.thumbnail_store:
+            messagebox.showerror( "Error", "Could not open the thumbnail store for this database" )
+            return
+            
+        sizes = [self.virtual_image_list.thumbnail_size]
+        if self.generate_previews_on_scan.get():
+            sizes.append( self.scan_preview_size )
+            
+        progress_dialog = self.create_progress_dialog( "Building Thumbnails", "Generating thumbnails for the catalog..." )
+        
+        # Shared with the worker thread - the Tk thread only reads it
+        job_data = {
+            'db_path': self.current_database_path,
+            'directory': self.current_database,
+            'store': self.thumbnail_store,
+            'sizes': sizes,
+            'progress_dialog': progress_dialog,
+            'phase': 'checking',
+            'total': 0,
+            'processed': 0,
+            'built': 0,
+            'failed': 0,
+            'up_to_date': 0,
+            'missing': 0,
+            'exception': None,
+            'completed': False
+        }
+        
+        build_thread = threading.Thread( target=self._build_thumbnails_worker, args=(job_data,), daemon=True )
+        build_thread.start()
+        
+        self.root.after( 100, lambda: self._check_build_thumbnails_progress( job_data ) )
+    
+    def _build_thumbnails_worker( self, job_data ):
+        """Worker thread - find missing or stale thumbnails and fan the decodes out to a process pool"""
+        executor = None
+        store = job_data['store']
+        sizes = job_data['sizes']
+        cancel_state = job_data['progress_dialog']
+        try:
+            conn = sqlite3.connect( job_data['db_path'] )
+            try:
+                relative_paths = [row[0] for row in conn.execute( "SELECT relative_path FROM images ORDER BY id" )]
+            finally:
+                conn.close()
+            
+            # Entries already stored with a matching mtime and size are skipped, so a cancelled build resumes where it stopped
+            stamps = [store.get_stamps( size ) for size in sizes]
+            todo = []
+            for relative_path in relative_paths:
+                if cancel_state.get( 'cancelled', False ):
+                    job_data['exception'] = Exception( "Operation cancelled by user" )
+                    return
+                    
+                filepath = os.path.join( job_data['directory'], relative_path )
+                try:
+                    stat = os.stat( filepath )
+                except OSError:
+                    job_data['missing'] += 1
+                    continue
+                    
+                key = store.relative_key( filepath )
+                current = (stat.st_mtime, stat.st_size)
+                if all( size_stamps.get( key ) == current for size_stamps in stamps ):
+                    job_data['up_to_date'] += 1
+                else:
+                    todo.append( filepath )
+                    
+            job_data['total'] = len( todo )
+            job_data['phase'] = 'building'
+            if not todo:
+                return
+            
+            # Separate processes so decoding scales past the GIL
+            max_workers = os.cpu_count() or 4
+            executor = ProcessPoolExecutor( max_workers=max_workers )
+            pending = {}
+            next_index = 0
+            
+            while next_index < len( todo ) or pending:
+                if cancel_state.get( 'cancelled', False ):
+                    job_data['exception'] = Exception( "Operation cancelled by user" )
+                    break
+                
+                # Keep only a small window in flight so cancelling is quick and memory stays flat
+                while next_index < len( todo ) and len( pending ) < max_workers * 2:
+                    filepath = todo[next_index]
+                    pending[executor.submit( build_thumbnail_data, filepath, sizes )] = filepath
+                    next_index += 1
+                    
+                done, _ = wait( pending, timeout=0.25, return_when=FIRST_COMPLETED )
+                for future in done:
+                    filepath = pending.pop( future )
+                    try:
+                        encoded = future.result()
+                    except Exception as e:
+                        print( f"Error building thumbnail for {filepath}: {e}" )
+                        encoded = None
+                        
+                    if encoded:
+                        for size, data in zip( sizes, encoded ):
+                            store.put_data( filepath, size, data )
+                        job_data['built'] += 1
+                    else:
+                        job_data['failed'] += 1
+                    job_data['processed'] += 1
+                    
+        except Exception as e:
+            job_data['exception'] = e
+        finally:
+            if executor:
+                executor.shutdown( wait=False, cancel_futures=True )
+            # Everything built so far is kept for the next run
+            store.flush()
+            job_data['completed'] = True
+    
+    def _check_build_thumbnails_progress( self, job_data ):
+        """Poll the thumbnail build from the Tk thread and report progress"""
+        try:
+            progress_dialog = job_data['progress_dialog']
+            if job_data['phase'] == 'building':
+                processed = job_data['processed']
+                total = job_data['total']
+                self.update_progress_dialog( progress_dialog, processed, total, f"Built {processed:,}/{total:,} thumbnails" )
+            else:
+                self.update_progress_dialog( progress_dialog, 0, 0, f"Checking catalog... {job_data['up_to_date']:,} up to date" )
+                
+            if not job_data['completed']:
+                self.root.after( 200, lambda: self._check_build_thumbnails_progress( job_data ) )
+                return
+                
+            self._finish_build_thumbnails( job_data )
+            
+        except Exception as e:
+            print( f"Error in thumbnail build monitoring: {e}" )
+    
+    def _finish_build_thumbnails( self, job_data ):
+        """Close the progress dialog and summarize the thumbnail build"""
+        self.close_progress_dialog( job_data['progress_dialog'] )
+        
+        # Show whatever was built for the rows on screen
+        if hasattr( self, 'virtual_image_list' ) and self.virtual_image_list:
+            self.virtual_image_list.request_visible_thumbnails( 0 )
+            
+        exception = job_data.get( 'exception' )
+        if exception and "cancelled" in str( exception ).lower():
+            messagebox.showinfo( "Thumbnail Build Cancelled",
+                                f"Built {job_data['built']:,} thumbnails before cancelling.\n\n"
+                                f"Run Build All Thumbnails again to continue where it stopped." )
+            return
+        if exception:
+            messagebox.showerror( "Error", f"Failed to build thumbnails: {str(exception)}" )
+            return
+            
+        message = f"Thumbnail build completed!\n\n"
+        message += f"Built: {job_data['built']:,}\n"
+        message += f"Already up to date: {job_data['up_to_date']:,}\n"
+        if job_data['failed'] > 0:
+            message += f"Failed: {job_data['failed']:,}\n"
+        if job_data['missing'] > 0:
+            message += f"Missing files: {job_data['missing']:,}\n"
+            
+        messagebox.showinfo( "Thumbnail Build Complete", message )
+    
     def remove_database_duplicates( self ):
         """Scan for and remove duplicate database entries pointing to the same file"""
         if not self.current_database_path:
@@ -3648,6 +5335,9 @@ class ImageViewer:
         
         messagebox.showinfo( "Duplicates Removed", message )
         
+        # Entries are gone - rebuild the filter index
+        self.load_filter_index()
+        
         # Refresh the database view
         self.refresh_database_view()
         self.refresh_filtered_images()
@@ -3827,6 +5517,9 @@ class ImageViewer:
         
         messagebox.showinfo( "Cleanup Complete", message )
         
+        # Entries are gone - rebuild the filter index
+        self.load_filter_index()
+        
         # Refresh the database view
         self.refresh_database_view()
         self.refresh_filtered_images()
@@ -3849,15 +5542,15 @@ class ImageViewer:
             return
             
         try:
-            # Clear cache when refreshing database view
-            self.clear_cache()
+            # Clear cached data only when the catalog has changed since it was cached
+            self.sync_catalog_caches()
             
             # Update database name label
             db_name = os.path.basename( self.current_database_path )
             db_directory = os.path.basename( self.current_database )
             self.database_name_label.configure( text=f"Database: {db_name} (in {db_directory})" )
             
-            conn = sqlite3.connect( self.current_database_path )
+            conn = self.catalog.reader()
             cursor = conn.cursor()
             
             # Load only tags that are actually used by files in the database
@@ -3931,7 +5624,6 @@ class ImageViewer:
             # Refresh to show all images (no filters = show all)
             self.refresh_filtered_images()
             
-            conn.close()
             
         except Exception as e:
             print( f"Error refreshing database view: {e}" )
@@ -3951,13 +5643,21 @@ class ImageViewer:
                         filename = self.virtual_image_list.filtered_items[index]['filename']
                         preserve_selection.append( filename )
         
+        # A stream from an earlier refresh must not append into this result
+        self.cancel_catalog_stream()
+        
+        # A recent filter on an unchanged catalog and the in-memory index both answer any catalog size without SQL
+        self.sync_catalog_caches()
+        if self.filter_index or self.get_filter_cache_key() in self.filter_result_cache:
+            self.refresh_filtered_images_regular( preserve_selection )
+            return
+        
         # Check database size first to determine if we need chunked loading
         try:
-            conn = sqlite3.connect( self.current_database_path )
+            conn = self.catalog.reader()
             cursor = conn.cursor()
             cursor.execute( "SELECT COUNT(*) FROM images" )
             total_images = cursor.fetchone()[0]
-            conn.close()
             
             # Use chunked loading for large databases (>3000 images)
             if total_images > 3000:
@@ -3972,91 +5672,118 @@ class ImageViewer:
         self.refresh_filtered_images_regular( preserve_selection )
     
     def refresh_filtered_images_regular( self, preserve_selection ):
-        """Regular refresh for smaller databases (legacy method)"""
+        """Regular refresh - from the filter result cache or the filter index when available, otherwise SQL for smaller databases"""
+        # Everything below runs in one pass - nothing for a stream's performance mode to protect
+        self.performance_mode = False
+        
         try:
-            conn = sqlite3.connect( self.current_database_path )
+            catalog_version = self.sync_catalog_caches()
+            filter_key = self.get_filter_cache_key()
+            cached_items = self.get_cached_filter_result( filter_key )
+            
+            conn = self.catalog.reader()
             cursor = conn.cursor()
             
             # Get rating filter values
             min_rating = self.min_rating_var.get()
             max_rating = self.max_rating_var.get()
             
-            # Build complex query for OR/AND/EXCLUDE logic plus rating filter
-            has_tag_filters = self.included_or_tags or self.included_and_tags or self.excluded_tags
-            has_rating_filter = min_rating > 0 or max_rating < 10
-            
-            if not has_tag_filters and not has_rating_filter:
-                # No filters - show all images
-                query = "SELECT DISTINCT i.relative_path, i.filename FROM images i ORDER BY i.filename"
-                params = []
-
+            if cached_items is not None:
+                # Already filtered and sorted - thumbnails may have been toggled since
+                virtual_items = cached_items
+                show_thumbnails = self.show_thumbnails.get()
+                for item in virtual_items:
+                    item['show_thumbnails'] = show_thumbnails
+                self.clear_image_list()
+            elif self.filter_index:
+                # Bitset evaluation against the in-memory index - no SQL
+                virtual_items = self.filter_index.filter( min_rating, max_rating, self.included_or_tags, self.included_and_tags,
+                                                          self.excluded_tags, self.show_thumbnails.get() )
+                self.clear_image_list()
             else:
-                # Start with all images
-                query = "SELECT DISTINCT i.relative_path, i.filename FROM images i WHERE 1=1"
-                params = []
-                
-                # Apply rating filter
-                if has_rating_filter:
-                    query += " AND i.rating >= ? AND i.rating <= ?"
-                    params.extend( [min_rating, max_rating] )
-                
-                # Apply EXCLUDE filter (highest priority - exclude any image with excluded tags)
-                if self.excluded_tags:
-                    placeholders = ','.join( ['?'] * len( self.excluded_tags ) )
-                    query += f" AND i.id NOT IN (SELECT it.image_id FROM image_tags it JOIN tags t ON it.tag_id = t.id WHERE t.name IN ({placeholders}))"
-                    params.extend( self.excluded_tags )
-                
-                # Apply OR and AND logic
-                include_conditions = []
-                
-                # Include (OR) - images that have ANY of these tags
-                if self.included_or_tags:
-                    placeholders = ','.join( ['?'] * len( self.included_or_tags ) )
-                    include_conditions.append( f"i.id IN (SELECT it.image_id FROM image_tags it JOIN tags t ON it.tag_id = t.id WHERE t.name IN ({placeholders}))" )
-                    params.extend( self.included_or_tags )
+                # Build complex query for OR/AND/EXCLUDE logic plus rating filter
+                has_tag_filters = self.included_or_tags or self.included_and_tags or self.excluded_tags
+                has_rating_filter = min_rating > 0 or max_rating < 10
+                
+                if not has_tag_filters and not has_rating_filter:
+                    # No filters - show all images
+                    query = "SELECT DISTINCT i.id, i.relative_path, i.filename, i.orientation, i.width, i.height FROM images i ORDER BY i.filename COLLATE NOCASE, i.id"
+                    params = []
+                    
+                else:
+                    # Start with all images
+                    query = "SELECT DISTINCT i.id, i.relative_path, i.filename, i.orientation, i.width, i.height FROM images i WHERE 1=1"
+                    params = []
+                    
+                    # Apply rating filter
+                    if has_rating_filter:
+                        query += " AND i.rating >= ? AND i.rating <= ?"
+                        params.extend( [min_rating, max_rating] )
+                    
+                    # Apply EXCLUDE filter (highest priority - exclude any image with excluded tags)
+                    if self.excluded_tags:
+                        placeholders = ','.join( ['?'] * len( self.excluded_tags ) )
+                        query += f" AND i.id NOT IN (SELECT it.image_id FROM image_tags it JOIN tags t ON it.tag_id = t.id WHERE t.name IN ({placeholders}))"
+                        params.extend( self.excluded_tags )
+                    
+                    # Apply OR and AND logic
+                    include_conditions = []
+                    
+                    # Include (OR) - images that have ANY of these tags
+                    if self.included_or_tags:
+                        placeholders = ','.join( ['?'] * len( self.included_or_tags ) )
+                        include_conditions.append( f"i.id IN (SELECT it.image_id FROM image_tags it JOIN tags t ON it.tag_id = t.id WHERE t.name IN ({placeholders}))" )
+                        params.extend( self.included_or_tags )
+                    
+                    # Include (AND) - images that have ALL of these tags
+                    if self.included_and_tags:
+                        and_condition = f"i.id IN (SELECT it.image_id FROM image_tags it JOIN tags t ON it.tag_id = t.id WHERE t.name IN ({','.join(['?'] * len(self.included_and_tags))}) GROUP BY it.image_id HAVING COUNT(DISTINCT t.name) = ?)"
+                        include_conditions.append( and_condition )
+                        params.extend( self.included_and_tags )
+                        params.append( len( self.included_and_tags ) )
+                    
+                    # Combine OR and AND conditions
+                    if include_conditions:
+                        query += " AND (" + " OR ".join( include_conditions ) + ")"
+                        
+                    query += " ORDER BY i.filename COLLATE NOCASE, i.id"
                 
-                # Include (AND) - images that have ALL of these tags
-                if self.included_and_tags:
-                    and_condition = f"i.id IN (SELECT it.image_id FROM image_tags it JOIN tags t ON it.tag_id = t.id WHERE t.name IN ({','.join(['?'] * len(self.included_and_tags))}) GROUP BY it.image_id HAVING COUNT(DISTINCT t.name) = ?)"
-                    include_conditions.append( and_condition )
-                    params.extend( self.included_and_tags )
-                    params.append( len( self.included_and_tags ) )
+                cursor.execute( query, params )
+                images = cursor.fetchall()
                 
-                # Combine OR and AND conditions
-                if include_conditions:
-                    query += " AND (" + " OR ".join( include_conditions ) + ")"
+                # Clear and populate the virtual image list
+                self.clear_image_list()
                 
-                query += " ORDER BY i.filename"
-            
-            cursor.execute( query, params )
-            images = cursor.fetchall()
-            
-            # Clear and populate the virtual image list
-            self.clear_image_list()
-            
-            # Create item data for virtual scrolling
-            virtual_items = []
-            for relative_path, filename in images:
-                filepath = os.path.join( self.current_database, relative_path ) if relative_path else None
-                virtual_items.append( {
-                    'filename': filename,
-                    'filepath': filepath,
-                    'show_thumbnails': self.show_thumbnails.get()
-                } )
+                # Create item data for virtual scrolling
+                virtual_items = []
+                for image_id, relative_path, filename, orientation, width, height in images:
+                    filepath = os.path.join( self.current_database, relative_path ) if relative_path else None
+                    virtual_items.append( {
+                        'id': image_id,
+                        'filename': filename,
+                        'filepath': filepath,
+                        'orientation': orientation,
+                        'width': width,
+                        'height': height,
+                        'show_thumbnails': self.show_thumbnails.get()
+                    } )
             
             # Set items in virtual list
             self.virtual_image_list.set_items( virtual_items )
             
             # Apply current sorting if we have items
-            if virtual_items and hasattr( self, 'sort_criteria_var' ):
+            if virtual_items and hasattr( self, 'sort_criteria_var' ) and cached_items is None:
                 # Apply sorting without triggering callbacks to avoid recursion
                 self.apply_sorting_internal()
+                
+            if cached_items is None:
+                self.cache_filter_result( filter_key, self.virtual_image_list.filtered_items, catalog_version )
             
             # Update status label
             self.update_image_list_status()
             
             # Handle selection restoration
-            filtered_filenames = [filename for relative_path, filename in images]
+            filtered_filenames = [item['filename'] for item in virtual_items]
             
             # If we have a preserved selection, try to restore it
             if preserve_selection and filtered_filenames:
@@ -4132,7 +5859,6 @@ class ImageViewer:
                 self.selected_image_files = []
                 self.clear_image_tag_interface()
                 
-            conn.close()
             
             # Start continuous visibility checking for thumbnails
             if self.show_thumbnails.get():
@@ -4144,31 +5870,42 @@ class ImageViewer:
         except Exception as e:
             print( f"Error refreshing filtered images: {e}" )
     
+    def cancel_catalog_stream( self ):
+        """Stop a running catalog stream from appending further chunks and release its performance mode"""
+        self._catalog_stream_generation += 1
+        if self.catalog_stream:
+            self.catalog_stream = None
+            self.performance_mode = False
+    
     def refresh_filtered_images_chunked( self, preserve_selection, total_images ):
-        """Chunked refresh for large databases with progress feedback"""
+        """Streaming refresh for large databases - the first screenful shows at once, the rest is appended as it loads"""
         # Enable performance mode for large datasets
         self.performance_mode = True
         
-        # Create progress dialog
-        progress_dialog = self.create_progress_dialog( "Loading Database", f"Loading {total_images:,} images..." )
+        # A newer refresh supersedes any stream still running
+        self._catalog_stream_generation += 1
         
         # Thread-safe data container
         thread_data = {
+            'generation': self._catalog_stream_generation,
+            'filter_key': self.get_filter_cache_key(),
+            'catalog_version': self.sync_catalog_caches(),
             'preserve_selection': preserve_selection,
             'total_images': total_images,
-            'progress_dialog': progress_dialog,
+            'filtered': False,  # Set by the worker - total_images is then the catalog size, not the match count
+            'chunks': deque(),  # Lists of item dicts, appended by the worker
             'exception': None,
             'completed': False,
-            'virtual_items': [],
-            'processed': 0
+            'started': False,  # First chunk has replaced the previous list contents
+            'loaded': 0
         }
+        self.catalog_stream = thread_data
         
         # Start background loading thread
         loading_thread = threading.Thread( target=self._chunked_loading_worker, args=(thread_data,), daemon=True )
         loading_thread.start()
         
-        # Start progress monitoring
-        self._schedule_chunked_progress_monitoring( thread_data, loading_thread )
+        self.root.after( self.stream_poll_interval, lambda: self._poll_catalog_stream( thread_data ) )
     
     def _chunked_loading_worker( self, thread_data ):
         """Worker thread for chunked database loading"""
@@ -4184,13 +5921,15 @@ class ImageViewer:
             has_tag_filters = self.included_or_tags or self.included_and_tags or self.excluded_tags
             has_rating_filter = min_rating > 0 or max_rating < 10
             
+            thread_data['filtered'] = bool( has_tag_filters or has_rating_filter )
+            
             if not has_tag_filters and not has_rating_filter:
-                # No filters - show all images with chunked loading
-                base_query = "SELECT DISTINCT i.relative_path, i.filename FROM images i ORDER BY i.filename LIMIT ? OFFSET ?"
+                # No filters - show all images
+                base_query = "SELECT DISTINCT i.id, i.relative_path, i.filename, i.orientation, i.width, i.height FROM images i ORDER BY i.filename COLLATE NOCASE, i.id"
                 base_params = []
             else:
                 # Build filtered query
-                base_query = "SELECT DISTINCT i.relative_path, i.filename FROM images i WHERE 1=1"
+                base_query = "SELECT DISTINCT i.id, i.relative_path, i.filename, i.orientation, i.width, i.height FROM images i WHERE 1=1"
                 base_params = []
                 
                 # Apply rating filter
@@ -4221,110 +5960,101 @@ class ImageViewer:
                 if include_conditions:
                     base_query += " AND (" + " OR ".join( include_conditions ) + ")"
                 
-                base_query += " ORDER BY i.filename LIMIT ? OFFSET ?"
+                base_query += " ORDER BY i.filename COLLATE NOCASE, i.id"
             
-            # Load in chunks
-            chunk_size = 1000  # Load 1000 images at a time
-            offset = 0
-            all_virtual_items = []
+            # Run the query once and stream it in chunks - re-running it with OFFSET per page is quadratic
+            chunk_size = self.stream_first_chunk  # Small first chunk so the list fills immediately
+            show_thumbnails = self.show_thumbnails.get()
+            cursor.execute( base_query, base_params )
             
             while True:
-                # Check for cancellation
-                if thread_data['progress_dialog'].get( 'cancelled', False ):
-                    thread_data['exception'] = Exception( "Operation cancelled by user" )
+                # Superseded by a newer refresh
+                if thread_data['generation'] != self._catalog_stream_generation:
+                    conn.close()
                     return
                 
-                # Execute chunked query
-                query_params = base_params + [chunk_size, offset]
-                cursor.execute( base_query, query_params )
-                chunk_images = cursor.fetchall()
+                chunk_images = cursor.fetchmany( chunk_size )
+                chunk_size = self.stream_chunk_size
                 
                 if not chunk_images:
                     break  # No more data
                 
                 # Process chunk
-                for relative_path, filename in chunk_images:
+                chunk_items = []
+                for image_id, relative_path, filename, orientation, width, height in chunk_images:
                     filepath = os.path.join( self.current_database, relative_path ) if relative_path else None
-                    all_virtual_items.append( {
+                    chunk_items.append( {
+                        'id': image_id,
                         'filename': filename,
                         'filepath': filepath,
-                        'show_thumbnails': self.show_thumbnails.get()
+                        'orientation': orientation,
+                        'width': width,
+                        'height': height,
+                        'show_thumbnails': show_thumbnails
                     } )
                 
-                # Update progress
-                thread_data['processed'] = len( all_virtual_items )
-                
-                offset += chunk_size
-                
-                # Small delay to prevent UI blocking
-                time.sleep( 0.01 )
+                # Hand the chunk to the Tk thread
+                thread_data['chunks'].append( chunk_items )
+                thread_data['loaded'] += len( chunk_items )
             
             conn.close()
-            
-            # Store results
-            thread_data['virtual_items'] = all_virtual_items
             thread_data['completed'] = True
             
         except Exception as e:
             thread_data['exception'] = e
     
-    def _schedule_chunked_progress_monitoring( self, thread_data, loading_thread ):
-        """Monitor chunked loading progress"""
-        self.root.after( 100, lambda: self._check_chunked_progress( thread_data, loading_thread ) )
-    
-    def _check_chunked_progress( self, thread_data, loading_thread ):
-        """Check chunked loading progress"""
-        try:
-            # Update progress
-            processed = thread_data.get( 'processed', 0 )
-            total = thread_data['total_images']
-            
-            self.update_progress_dialog( 
-                thread_data['progress_dialog'], 
-                processed, 
-                total, 
-                f"Loaded {processed:,}/{total:,} images" 
-            )
+    def _poll_catalog_stream( self, thread_data ):
+        """Append streamed chunks to the list within a per-tick time budget until the stream completes"""
+        # Superseded by a newer refresh - its own poll takes over, or a one-pass refresh already replaced the list
+        if thread_data['generation'] != self._catalog_stream_generation:
+            if not self.catalog_stream:
+                self.performance_mode = False
+            return
             
-            # Check if still running
-            if loading_thread.is_alive() and not thread_data['progress_dialog'].get( 'cancelled', False ):
-                # Schedule next check
-                self.root.after( 100, lambda: self._check_chunked_progress( thread_data, loading_thread ) )
-            else:
-                # Finalize
-                self._finalize_chunked_loading( thread_data )
-                
-        except Exception as e:
-            print( f"Error in chunked progress monitoring: {e}" )
-            self._finalize_chunked_loading( thread_data )
-    
-    def _finalize_chunked_loading( self, thread_data ):
-        """Finalize chunked loading operation"""
         try:
-            # Close progress dialog
-            self.close_progress_dialog( thread_data['progress_dialog'] )
-            
-            # Handle any exceptions
             if thread_data.get( 'exception' ):
-                if "cancelled" not in str( thread_data['exception'] ).lower():
-                    messagebox.showerror( "Error", f"Failed to load database: {thread_data['exception']}" )
+                self.catalog_stream = None
+                self.performance_mode = False
+                self.update_image_list_status()
+                messagebox.showerror( "Error", f"Failed to load database: {thread_data['exception']}" )
                 return
-            
-            # Apply results to UI (on main thread)
-            if thread_data.get( 'completed' ) and thread_data.get( 'virtual_items' ):
-                virtual_items = thread_data['virtual_items']
-                preserve_selection = thread_data['preserve_selection']
-                
-                # Clear and populate the virtual image list
-                self.clear_image_list()
-                self.virtual_image_list.set_items( virtual_items )
                 
-                # Defer sorting and other operations until UI is ready
-                self.root.after( 100, lambda: self._finalize_chunked_ui_operations( virtual_items, preserve_selection ) )
+            chunks = thread_data['chunks']
+            deadline = time.perf_counter() + self.stream_append_budget
+            while chunks and time.perf_counter() < deadline:
+                chunk_items = chunks.popleft()
+                if not thread_data['started']:
+                    # First screenful replaces the previous list contents
+                    thread_data['started'] = True
+                    self.clear_image_list()
+                    self.virtual_image_list.set_items( chunk_items )
+                else:
+                    self.virtual_image_list.append_items( chunk_items )
                     
+            if thread_data['completed'] and not chunks:
+                self._finish_catalog_stream( thread_data )
+                return
+                
+            self.update_image_list_status()
+            
         except Exception as e:
-            print( f"Error finalizing chunked loading: {e}" )
-            messagebox.showerror( "Error", f"Failed to finalize database loading: {str(e)}" )
+            print( f"Error streaming catalog results: {e}" )
+            self.catalog_stream = None
+            self.performance_mode = False
+            return
+            
+        self.root.after( self.stream_poll_interval, lambda: self._poll_catalog_stream( thread_data ) )
+    
+    def _finish_catalog_stream( self, thread_data ):
+        """Run the deferred sorting, selection restore and thumbnail loading once every row is in the list"""
+        self.catalog_stream = None
+        
+        # Empty result - the previous contents are still showing
+        if not thread_data['started']:
+            self.clear_image_list()
+            
+        self._finalize_chunked_ui_operations( self.virtual_image_list.filtered_items, thread_data['preserve_selection'] )
+        self.cache_filter_result( thread_data['filter_key'], self.virtual_image_list.filtered_items, thread_data['catalog_version'] )
     
     def _finalize_chunked_ui_operations( self, virtual_items, preserve_selection ):
         """Finalize UI operations after chunked loading completes"""
@@ -4346,13 +6076,16 @@ class ImageViewer:
             # Start thumbnail loading if enabled (heavily deferred for large datasets)
             if self.show_thumbnails.get():
                 # Use the TreeviewImageList's thumbnail system with longer delay
-                self.root.after( 2000, lambda: self.virtual_image_list.load_initial_visible_thumbnails() )
+                self.virtual_image_list.request_visible_thumbnails( 2000 )
                 
         except Exception as e:
             print( f"Error in deferred UI operations: {e}" )
     
     def _disable_performance_mode( self ):
         """Disable performance mode after operations complete"""
+        # A stream started since this was scheduled still needs it
+        if self.catalog_stream:
+            return
         self.performance_mode = False
         print( "Performance mode disabled - full functionality restored" )
     
@@ -4643,51 +6376,49 @@ class ImageViewer:
                 return
                 
             # For very large selections, use async processing
-            if len( self.selected_image_files ) > 100:
-                self.root.after( 1, lambda: self.apply_single_tag_change_async( tag_id, is_checked ) )
-                return
-            
-        try:
-            conn = sqlite3.connect( self.current_database_path )
-            cursor = conn.cursor()
-            
-            # Optimize: Get all image IDs in a single query instead of one per file
-            database_dir = os.path.dirname( self.current_database_path )
-            relative_paths = [os.path.relpath( filepath, database_dir ) 
-                            for filepath in self.selected_image_files]
-            
-            # Use a single query with IN clause for better performance
-            placeholders = ','.join( ['?'] * len( relative_paths ) )
-            cursor.execute( f"SELECT id, relative_path FROM images WHERE relative_path IN ({placeholders})", 
-                          relative_paths )
-            results = cursor.fetchall()
-            
-            # Create a mapping of relative_path to image_id, using the highest ID for duplicates
-            path_to_id = {}
-            for image_id, rel_path in results:
-                if rel_path not in path_to_id or image_id > path_to_id[rel_path]:
-                    path_to_id[rel_path] = image_id
-            
-            image_ids = [path_to_id[rel_path] for rel_path in relative_paths if rel_path in path_to_id]
-            
-            if not image_ids:
-                conn.close()
+            if len( self.selected_image_files ) > 100:
+                self.root.after( 1, lambda: self.apply_single_tag_change_async( tag_id, is_checked ) )
                 return
-                
-            # Apply the tag change using batch operations
-            if is_checked:
-                # Batch add tag to images
-                batch_data = [(image_id, tag_id) for image_id in image_ids]
-                cursor.executemany( "INSERT OR IGNORE INTO image_tags (image_id, tag_id) VALUES (?, ?)", 
-                                  batch_data )
-            else:
-                # Batch remove tag from images
-                batch_data = [(image_id, tag_id) for image_id in image_ids]
-                cursor.executemany( "DELETE FROM image_tags WHERE image_id = ? AND tag_id = ?", 
-                                  batch_data )
             
-            conn.commit()
-            conn.close()
+        try:
+            with self.catalog.write() as conn:
+                cursor = conn.cursor()
+                
+                # Optimize: Get all image IDs in a single query instead of one per file
+                database_dir = os.path.dirname( self.current_database_path )
+                relative_paths = [os.path.relpath( filepath, database_dir ) 
+                                for filepath in self.selected_image_files]
+                
+                # Use a single query with IN clause for better performance
+                placeholders = ','.join( ['?'] * len( relative_paths ) )
+                cursor.execute( f"SELECT id, relative_path FROM images WHERE relative_path IN ({placeholders})", 
+                              relative_paths )
+                results = cursor.fetchall()
+                
+                # Create a mapping of relative_path to image_id, using the highest ID for duplicates
+                path_to_id = {}
+                for image_id, rel_path in results:
+                    if rel_path not in path_to_id or image_id > path_to_id[rel_path]:
+                        path_to_id[rel_path] = image_id
+                        
+                image_ids = [path_to_id[rel_path] for rel_path in relative_paths if rel_path in path_to_id]
+                
+                if not image_ids:
+                    return
+                
+                # Apply the tag change using batch operations
+                if is_checked:
+                    # Batch add tag to images
+                    batch_data = [(image_id, tag_id) for image_id in image_ids]
+                    cursor.executemany( "INSERT OR IGNORE INTO image_tags (image_id, tag_id) VALUES (?, ?)", 
+                                      batch_data )
+                else:
+                    # Batch remove tag from images
+                    batch_data = [(image_id, tag_id) for image_id in image_ids]
+                    cursor.executemany( "DELETE FROM image_tags WHERE image_id = ? AND tag_id = ?", 
+                                      batch_data )
+                
+            self.update_filter_index( self.selected_image_files )
             
             # Invalidate cache for all affected images BEFORE refreshing views
             for filepath in self.selected_image_files:
@@ -4789,6 +6520,7 @@ class ImageViewer:
     def finish_async_tag_change( self, progress_window ):
         """Finish the async tag change operation"""
         progress_window.destroy()
+        self.update_filter_index( self.selected_image_files )
         # Only refresh filtered images for large selections
         self.refresh_filtered_images()
         # Note: load_image_tags_for_editing() is called automatically by 
@@ -4842,21 +6574,21 @@ class ImageViewer:
                 return
             
         try:
-            conn = sqlite3.connect( self.current_database_path )
-            cursor = conn.cursor()
-            
-            rating = self.image_rating_var.get()
-            
-            # Optimize: Update all images in a single query instead of one per file
-            relative_paths = [os.path.relpath( filepath, os.path.dirname( self.current_database_path ) ) 
-                            for filepath in self.selected_image_files]
-            
-            # Use a single query with IN clause for better performance
-            placeholders = ','.join( ['?'] * len( relative_paths ) )
-            cursor.execute( f"UPDATE images SET rating = ? WHERE relative_path IN ({placeholders})", 
-                          [rating] + relative_paths )
+            with self.catalog.write() as conn:
+                cursor = conn.cursor()
+                
+                rating = self.image_rating_var.get()
+                
+                # Optimize: Update all images in a single query instead of one per file
+                relative_paths = [os.path.relpath( filepath, os.path.dirname( self.current_database_path ) ) 
+                                for filepath in self.selected_image_files]
+                
+                # Use a single query with IN clause for better performance
+                placeholders = ','.join( ['?'] * len( relative_paths ) )
+                cursor.execute( f"UPDATE images SET rating = ? WHERE relative_path IN ({placeholders})", 
+                              [rating] + relative_paths )
             
-            conn.commit()
+            self.update_filter_index( self.selected_image_files )
             
             # Invalidate cache for all affected images
             for filepath in self.selected_image_files:
@@ -4881,8 +6613,6 @@ class ImageViewer:
         except Exception as e:
             print( f"Error updating image rating: {e}" )
             messagebox.showerror( "Error", f"Failed to update image ratings: {str(e)}" )
-        finally:
-            conn.close()
             
     def apply_rating_changes_async( self, rating ):
         """Apply rating changes asynchronously for very large selections to prevent freezing"""
@@ -4951,6 +6681,7 @@ class ImageViewer:
     def finish_async_rating_change( self, progress_window ):
         """Finish the async rating change operation"""
         progress_window.destroy()
+        self.update_filter_index( self.selected_image_files )
         # Only refresh filtered images for large selections
         self.refresh_filtered_images()
         messagebox.showinfo( "Success", "Rating changes applied successfully!" )
@@ -4966,46 +6697,46 @@ class ImageViewer:
             return
             
         try:
-            conn = sqlite3.connect( self.current_database_path )
-            cursor = conn.cursor()
-            
-            # Get image IDs for the selected files
-            image_data = {}
-            for filepath in self.selected_image_files:
-                relative_path = os.path.relpath( filepath, os.path.dirname( self.current_database_path ) )
-                cursor.execute( "SELECT id FROM images WHERE relative_path = ?", (relative_path,) )
-                result = cursor.fetchone()
-                if result:
-                    image_data[filepath] = {'id': result[0]}
-            
-            if not image_data:
-                messagebox.showerror( "Error", "No valid images found in database" )
-                return
-                
-            changes_made = False
-            
-            # Add new tags (existing tag checkboxes and rating changes are handled immediately)
-            new_tags_text = self.image_new_tags_entry.get().strip()
-            if new_tags_text:
-                new_tags = [tag.strip() for tag in new_tags_text.split( ',' ) if tag.strip()]
+            with self.catalog.write() as conn:
+                cursor = conn.cursor()
                 
-                # Batch insert new tags
-                tag_batch = [(tag_name,) for tag_name in new_tags]
-                cursor.executemany( "INSERT OR IGNORE INTO tags (name) VALUES (?)", tag_batch )
+                # Get image IDs for the selected files
+                image_data = {}
+                for filepath in self.selected_image_files:
+                    relative_path = os.path.relpath( filepath, os.path.dirname( self.current_database_path ) )
+                    cursor.execute( "SELECT id FROM images WHERE relative_path = ?", (relative_path,) )
+                    result = cursor.fetchone()
+                    if result:
+                        image_data[filepath] = {'id': result[0]}
+                        
+                if not image_data:
+                    messagebox.showerror( "Error", "No valid images found in database" )
+                    return
+                    
+                changes_made = False
                 
-                for tag_name in new_tags:
-                    # Get tag ID
-                    cursor.execute( "SELECT id FROM tags WHERE name = ?", (tag_name,) )
-                    tag_id = cursor.fetchone()[0]
+                # Add new tags (existing tag checkboxes and rating changes are handled immediately)
+                new_tags_text = self.image_new_tags_entry.get().strip()
+                if new_tags_text:
+                    new_tags = [tag.strip() for tag in new_tags_text.split( ',' ) if tag.strip()]
+                    
+                    # Batch insert new tags
+                    tag_batch = [(tag_name,) for tag_name in new_tags]
+                    cursor.executemany( "INSERT OR IGNORE INTO tags (name) VALUES (?)", tag_batch )
+                    
+                    for tag_name in new_tags:
+                        # Get tag ID
+                        cursor.execute( "SELECT id FROM tags WHERE name = ?", (tag_name,) )
+                        tag_id = cursor.fetchone()[0]
+                        
+                        # Batch add tag to all selected images
+                        image_tag_batch = [(img_data['id'], tag_id) for img_data in image_data.values()]
+                        cursor.executemany( "INSERT OR IGNORE INTO image_tags (image_id, tag_id) VALUES (?, ?)", 
+                                          image_tag_batch )
+                    changes_made = True
                     
-                    # Batch add tag to all selected images
-                    image_tag_batch = [(img_data['id'], tag_id) for img_data in image_data.values()]
-                    cursor.executemany( "INSERT OR IGNORE INTO image_tags (image_id, tag_id) VALUES (?, ?)", 
-                                      image_tag_batch )
-                changes_made = True
-            
             if changes_made:
-                conn.commit()
+                self.update_filter_index( self.selected_image_files )
                 
                 # Invalidate cache for all affected images
                 for filepath in self.selected_image_files:
@@ -5021,10 +6752,6 @@ class ImageViewer:
                 # Reload the tag editing interface to reflect changes
                 self.load_image_tags_for_editing()
                 
-
-            
-            conn.close()
-            
         except Exception as e:
             messagebox.showerror( "Error", f"Failed to apply changes: {str(e)}" )
                 
@@ -5052,11 +6779,10 @@ class ImageViewer:
             return None
             
         try:
-            conn = sqlite3.connect( self.current_database_path )
+            conn = self.catalog.reader()
             cursor = conn.cursor()
             cursor.execute( "SELECT relative_path FROM images WHERE filename = ?", (filename,) )
             result = cursor.fetchone()
-            conn.close()
             
             if result:
                 return os.path.join( self.current_database, result[0] )
@@ -5072,7 +6798,7 @@ class ImageViewer:
             return []
             
         try:
-            conn = sqlite3.connect( self.current_database_path )
+            conn = self.catalog.reader()
             cursor = conn.cursor()
             
             # Create placeholders for the IN clause
@@ -5081,7 +6807,6 @@ class ImageViewer:
             
             cursor.execute( query, filenames )
             results = cursor.fetchall()
-            conn.close()
             
             # Create a mapping of filename to full path
             filename_to_path = {}
@@ -5101,25 +6826,15 @@ class ImageViewer:
             return []
     
     def get_fullscreen_image_path( self, index ):
-        """Lazily get the full path for a fullscreen image at the given index"""
-        if self.current_database_path and 0 <= index < len( self.fullscreen_filenames ):
-            filename = self.fullscreen_filenames[index]
-            
-            # Check cache first
-            if filename in self.fullscreen_paths_cache:
-                return self.fullscreen_paths_cache[filename]
-            
-            # Resolve path from database
-            full_path = self.find_image_path( filename )
-            if full_path:
-                # Cache the result
-                self.fullscreen_paths_cache[filename] = full_path
-                return full_path
-        
-        # Fallback to traditional approach for browse tab
+        """Get the full path for a fullscreen image at the given index from the snapshot"""
         if 0 <= index < len( self.fullscreen_images ):
             return self.fullscreen_images[index]
-            
+        return None
+    
+    def get_fullscreen_image_id( self, index ):
+        """Get the database id for a fullscreen image at the given index, None if unknown"""
+        if 0 <= index < len( self.fullscreen_image_ids ):
+            return self.fullscreen_image_ids[index]
         return None
         
 
@@ -5343,6 +7058,10 @@ class ImageViewer:
             print( f"Error sorting items: {e}" )
             return
         
+        # Already in this order (e.g. streamed sorted by filename) - nothing to rebuild
+        if self.is_same_order( items, self.virtual_image_list.filtered_items ):
+            return
+        
         # Update the virtual image list with sorted items
         self.virtual_image_list.filtered_items = items
         
@@ -5385,7 +7104,11 @@ class ImageViewer:
         
         # Trigger thumbnail loading if enabled
         if self.show_thumbnails.get():
-            self.virtual_image_list.parent.after( 100, self.virtual_image_list.load_visible_thumbnails_debounced )
+            self.virtual_image_list.request_visible_thumbnails( 100 )
+    
+    def is_same_order( self, items, current_items ):
+        """Check whether a sorted list holds the same item dicts in the same order as the displayed one"""
+        return len( items ) == len( current_items ) and all( a is b for a, b in zip( items, current_items ) )
     
     def apply_sorting_internal( self ):
         """Apply sorting without UI updates (used during refresh to avoid recursion)"""
@@ -5423,17 +7146,19 @@ class ImageViewer:
             print( f"Error sorting items: {e}" )
             return
         
-        # Update the virtual image list with sorted items
-        self.virtual_image_list.filtered_items = items
-        
-        # Use chunked refresh for large datasets (internal sorting)
-        if len( items ) > 1000:
-            # For large datasets, clear the treeview and start chunked refresh
-            for item in self.virtual_image_list.treeview.get_children():
-                self.virtual_image_list.treeview.delete( item )
-            self.virtual_image_list.refresh_treeview_chunked()
-        else:
-            self.virtual_image_list.refresh_treeview()
+        # Streamed and indexed lists already arrive in the default order - keep the rows instead of rebuilding them
+        if not self.is_same_order( items, self.virtual_image_list.filtered_items ):
+            # Update the virtual image list with sorted items
+            self.virtual_image_list.filtered_items = items
+            
+            # Use chunked refresh for large datasets (internal sorting)
+            if len( items ) > 1000:
+                # For large datasets, clear the treeview and start chunked refresh
+                for item in self.virtual_image_list.treeview.get_children():
+                    self.virtual_image_list.treeview.delete( item )
+                self.virtual_image_list.refresh_treeview_chunked()
+            else:
+                self.virtual_image_list.refresh_treeview()
         
         # Update sort status
         if criteria == "random":
@@ -5448,7 +7173,7 @@ class ImageViewer:
             return []
             
         try:
-            conn = sqlite3.connect( self.current_database_path )
+            conn = self.catalog.reader()
             cursor = conn.cursor()
             
             # Get image ID
@@ -5457,7 +7182,6 @@ class ImageViewer:
             result = cursor.fetchone()
             
             if not result:
-                conn.close()
                 return []
                 
             image_id = result[0]
@@ -5471,7 +7195,6 @@ class ImageViewer:
             ''', (image_id,) )
             
             tags = [row[0] for row in cursor.fetchall()]
-            conn.close()
             return tags
             
         except Exception as e:
@@ -5484,8 +7207,9 @@ class ImageViewer:
             messagebox.showwarning( "Warning", "No database is currently open" )
             return
             
-        dialog = TagDialog( self.root, filepath, self.current_database_path )
+        dialog = TagDialog( self.root, filepath, self.current_database_path, self.catalog )
         self.root.wait_window( dialog.dialog )
+        self.update_filter_index( [filepath] )
         
         # Refresh views after tag changes
         self.refresh_database_view()
@@ -5497,8 +7221,9 @@ class ImageViewer:
             messagebox.showwarning( "Warning", "No database is currently open" )
             return
             
-        dialog = MultiTagDialog( self.root, filepaths, self.current_database_path )
+        dialog = MultiTagDialog( self.root, filepaths, self.current_database_path, self.catalog )
         self.root.wait_window( dialog.dialog )
+        self.update_filter_index( filepaths )
         
         # Refresh views after tag changes
         self.refresh_database_view()
@@ -5533,8 +7258,9 @@ class ImageViewer:
         )
         
         if result:
-            dialog = MultiTagDialog( self.root, image_files, self.current_database_path )
+            dialog = MultiTagDialog( self.root, image_files, self.current_database_path, self.catalog )
             self.root.wait_window( dialog.dialog )
+            self.update_filter_index( image_files )
             
             # Refresh views after tag changes
             self.refresh_database_view()
@@ -6043,6 +7769,21 @@ class ImageViewer:
         except Exception as e:
             print( f"Error restoring rating filters: {e}" )
     
+    def load_image_cache_limit( self ):
+        """Read the in-memory image cache ceiling (in MB) from settings"""
+        cache_mb = 256
+        try:
+            if os.path.exists( self.settings_file ):
+                with open( self.settings_file, 'r' ) as f:
+                    settings = json.load( f )
+                    
+                cache_mb = int( settings.get( 'image_cache_mb', cache_mb ) )
+                
+        except Exception as e:
+            print( f"Error loading image cache limit: {e}" )
+            
+        return max( 32, cache_mb ) * 1024 * 1024
+    
     def restore_thumbnail_setting( self ):
         """Restore the thumbnail setting from saved settings"""
         try:
@@ -6073,6 +7814,57 @@ class ImageViewer:
         """Clear all cached data"""
         self.image_metadata_cache.clear()
         self.tag_cache.clear()
+        self.filter_result_cache.clear()
+    
+    def catalog_version( self ):
+        """Token that changes whenever the open catalog is written, by this app or another process"""
+        if not self.catalog:
+            return None
+        
+        # data_version moves when any other connection commits - this thread's reader never writes
+        data_version = self.catalog.reader().execute( "PRAGMA data_version" ).fetchone()[0]
+        return (self.catalog, data_version)
+    
+    def sync_catalog_caches( self ):
+        """Clear cached catalog data only if the catalog changed since it was cached, returning the current version"""
+        try:
+            version = self.catalog_version()
+        except Exception as e:
+            print( f"Error reading catalog version: {e}" )
+            version = None
+            
+        if version is None or version != self._catalog_cache_version:
+            self.clear_cache()
+            self._catalog_cache_version = version
+        return version
+    
+    def get_filter_cache_key( self ):
+        """Normalized filter and sort state - None when the result must not be reused"""
+        criteria = self.sort_criteria_var.get() if hasattr( self, 'sort_criteria_var' ) else None
+        if criteria == "random":
+            return None
+            
+        ascending = self.sort_ascending_var.get() if hasattr( self, 'sort_criteria_var' ) else True
+        return (frozenset( self.included_or_tags ), frozenset( self.included_and_tags ), frozenset( self.excluded_tags ),
+                self.min_rating_var.get(), self.max_rating_var.get(), criteria, ascending)
+    
+    def get_cached_filter_result( self, key ):
+        """Get the sorted items for a filter state or None if not cached"""
+        if key is None or key not in self.filter_result_cache:
+            return None
+            
+        self.filter_result_cache.move_to_end( key )
+        return self.filter_result_cache[key]
+    
+    def cache_filter_result( self, key, items, version ):
+        """Cache sorted items for a filter state, unless the catalog changed while they were loaded"""
+        if key is None or version is None or version != self._catalog_cache_version:
+            return
+            
+        self.filter_result_cache[key] = list( items )
+        self.filter_result_cache.move_to_end( key )
+        while len( self.filter_result_cache ) > self.filter_result_cache_size:
+            self.filter_result_cache.popitem( last=False )
     
     def get_cached_image_metadata( self, filepath ):
         """Get cached image metadata or None if not cached"""
@@ -6152,6 +7944,35 @@ class ImageViewer:
         except Exception as e:
             print( f"Error loading confirm delete setting: {e}" )
     
+    def save_scan_thumbnail_settings( self ):
+        """Save the scan-time thumbnail generation options to file"""
+        try:
+            settings = {}
+            if os.path.exists( self.settings_file ):
+                with open( self.settings_file, 'r' ) as f:
+                    settings = json.load( f )
+                    
+            settings['generate_thumbnails_on_scan'] = self.generate_thumbnails_on_scan.get()
+            settings['generate_previews_on_scan'] = self.generate_previews_on_scan.get()
+            
+            with open( self.settings_file, 'w' ) as f:
+                json.dump( settings, f, indent=2 )
+        except Exception as e:
+            print( f"Error saving scan thumbnail settings: {e}" )
+    
+    def load_scan_thumbnail_settings( self ):
+        """Load the scan-time thumbnail generation options from file"""
+        try:
+            if os.path.exists( self.settings_file ):
+                with open( self.settings_file, 'r' ) as f:
+                    settings = json.load( f )
+                    if 'generate_thumbnails_on_scan' in settings:
+                        self.generate_thumbnails_on_scan.set( settings['generate_thumbnails_on_scan'] )
+                    if 'generate_previews_on_scan' in settings:
+                        self.generate_previews_on_scan.set( settings['generate_previews_on_scan'] )
+        except Exception as e:
+            print( f"Error loading scan thumbnail settings: {e}" )
+    
     def show_todo_list( self ):
         """Show the TODO list dialog"""
         # Create TODO dialog window
@@ -6224,49 +8045,43 @@ class ImageViewer:
         todo_window.focus_set()
     
     def start_visibility_checking( self ):
-        """Start the continuous visibility checking for thumbnails"""
-        # Stop any existing timer
-        if self.visibility_check_timer:
-            self.root.after_cancel( self.visibility_check_timer )
-        
-        # Clear existing timers
-        self.visible_items_timer.clear()
-        
-        # Start checking
-        self.check_visible_thumbnails()
+        """Request thumbnails for the visible rows - loading is event-driven, so nothing polls while idle"""
+        if hasattr( self, 'virtual_image_list' ) and self.virtual_image_list:
+            self.virtual_image_list.request_visible_thumbnails()
     
     def get_thumbnail( self, filepath, size=(64, 64) ):
         """Generate or retrieve cached thumbnail for an image"""
         # Check thumbnail cache first
         cache_key = f"{filepath}_{size[0]}x{size[1]}"
-        if cache_key in self.thumbnail_cache:
-            return self.thumbnail_cache[cache_key]
-        
+        cached_photo = self.thumbnail_cache.get( cache_key )
+        if cached_photo:
+            return cached_photo
+            
         if not os.path.exists( filepath ):
             return None
         
         try:
-            # Load and resize image
-            with Image.open( filepath ) as img:
-                # Apply EXIF orientation correction
-                img = self.apply_exif_orientation( img )
-                
-                # Create thumbnail maintaining aspect ratio
-                img.thumbnail( size, Image.Resampling.LANCZOS )
-                
-                # Convert to PhotoImage for Tkinter
-                photo = ImageTk.PhotoImage( img )
-                
-                # Cache the thumbnail (limit cache size)
-                if len( self.thumbnail_cache ) >= 500:  # Increased cache size for better performance
-                    # Remove oldest entries
-                    oldest_keys = list( self.thumbnail_cache.keys() )[:100]
-                    for key in oldest_keys:
-                        del self.thumbnail_cache[key]
-                
-                self.thumbnail_cache[cache_key] = photo
-                return photo
+            # Try the persistent thumbnail store before decoding the original
+            img = self.thumbnail_store.get( filepath, size ) if self.thumbnail_store else None
+            
+            if img is None:
+                # Reuse a decoded source if preview or fullscreen has one, otherwise the fast path -
+                # orientation is applied after shrinking
+                img = self.decoded_image_cache.thumbnail( filepath, size )
+                if img is None:
+                    img = self.thumbnail_decoder.decode( filepath, size, orientation=self.get_image_orientation( filepath ) )
                 
+                # Write back so the next pass skips the decode
+                if self.thumbnail_store:
+                    self.thumbnail_store.put( filepath, size, img )
+            
+            # Convert to PhotoImage for Tkinter
+            photo = ImageTk.PhotoImage( img )
+            
+            # Cache the thumbnail (the cache manager evicts least recently used entries)
+            self.thumbnail_cache[cache_key] = photo
+            return photo
+            
         except Exception as e:
             print( f"Error creating thumbnail for {filepath}: {e}" )
             return None
@@ -6291,132 +8106,6 @@ class ImageViewer:
         """Handle scrollbar movement"""
         # Move the canvas view
         self.image_list_canvas.yview( *args )
-        # Visibility checking runs continuously, no need to trigger here
-    
-    def check_visible_thumbnails( self ):
-        """Check for visible items and track how long they've been visible"""
-        if not self.show_thumbnails.get():
-            return
-        
-        current_time = time.time()
-        visible_items = self.get_visible_image_items()
-        visible_item_ids = {id(item) for item in visible_items}
-        
-        # Remove items that are no longer visible from the timer
-        items_to_remove = []
-        for item_id in self.visible_items_timer:
-            if item_id not in visible_item_ids:
-                items_to_remove.append( item_id )
-        
-        for item_id in items_to_remove:
-            del self.visible_items_timer[item_id]
-        
-        # Update timers for currently visible items
-        for item in visible_items:
-            item_id = id( item )
-            if item_id not in self.visible_items_timer:
-                # First time seeing this item
-                self.visible_items_timer[item_id] = current_time
-            else:
-                # Check if item has been visible for 200ms
-                time_visible = current_time - self.visible_items_timer[item_id]
-                if (time_visible >= 0.3 and  # Increased delay to reduce CPU usage 
-                    not item['thumbnail_loaded'] and 
-                    item not in self.thumbnail_load_queue and 
-                    item['filepath'] and 
-                    os.path.exists( item['filepath'] )):
-                    # Add to queue after 200ms delay
-                    self.thumbnail_load_queue.append( item )
-        
-        # Start processing if we have items and not already running
-        if self.thumbnail_load_queue and not self.thumbnail_loading:
-            self.root.after( 10, self.process_thumbnail_queue )
-        
-        # Schedule next visibility check
-        if self.visibility_check_timer:
-            self.root.after_cancel( self.visibility_check_timer )
-        self.visibility_check_timer = self.root.after( 200, self.check_visible_thumbnails )  # Reduced frequency for better performance
-    
-    def process_thumbnail_queue( self ):
-        """Process the thumbnail loading queue lazily"""
-        if not self.thumbnail_load_queue or not self.show_thumbnails.get():
-            self.thumbnail_loading = False
-            return
-            
-        self.thumbnail_loading = True
-        
-        # Get the next item to process (prioritize visible items)
-        item_to_load = None
-        visible_items = self.get_visible_image_items()
-        
-        # First, try to find a visible item that needs thumbnail loading
-        for item in self.thumbnail_load_queue:
-            if item in visible_items and not item['thumbnail_loaded']:
-                item_to_load = item
-                break
-        
-        # If no visible items need loading, take the first item from queue
-        if not item_to_load:
-            for item in self.thumbnail_load_queue:
-                if not item['thumbnail_loaded']:
-                    item_to_load = item
-                    break
-        
-        if item_to_load:
-            self.load_single_thumbnail( item_to_load )
-            # Remove from queue if loaded or failed
-            if item_to_load in self.thumbnail_load_queue:
-                self.thumbnail_load_queue.remove( item_to_load )
-        
-        # Continue processing queue
-        if self.thumbnail_load_queue:
-            self.root.after( 50, self.process_thumbnail_queue )  # Small delay between loads
-        else:
-            self.thumbnail_loading = False
-    
-    def load_single_thumbnail( self, item_data ):
-        """Load thumbnail for a single item"""
-        if not item_data['filepath'] or not os.path.exists( item_data['filepath'] ):
-            item_data['thumbnail_loaded'] = True  # Mark as processed even if failed
-            return
-        
-        try:
-            thumbnail = self.get_thumbnail( item_data['filepath'] )
-            if thumbnail and item_data['thumb_label']:
-                # Update the placeholder with the actual thumbnail
-                item_data['thumb_label'].configure( image=thumbnail, text="", width=0, height=0 )
-                item_data['thumb_label'].image = thumbnail  # Keep reference
-                item_data['thumbnail_loaded'] = True
-        except Exception as e:
-            print( f"Error loading thumbnail for {item_data['filename']}: {e}" )
-            item_data['thumbnail_loaded'] = True  # Mark as processed even if failed
-            # Remove from queue to prevent retries
-            if item_data in self.thumbnail_load_queue:
-                self.thumbnail_load_queue.remove( item_data )
-    
-    def get_visible_image_items( self ):
-        """Get list of currently visible image items in the canvas"""
-        if not hasattr( self, 'image_list_canvas' ):
-            return []
-        
-        try:
-            # Get canvas viewport
-            canvas_top = self.image_list_canvas.canvasy( 0 )
-            canvas_bottom = canvas_top + self.image_list_canvas.winfo_height()
-            
-            visible_items = []
-            for item in self.image_list_items:
-                if item['frame'] and item['frame'].winfo_exists():
-                    item_top = item['frame'].winfo_y()
-                    item_bottom = item_top + item['frame'].winfo_height()
-                    
-                    # Check if item is visible in viewport
-                    if item_bottom >= canvas_top and item_top <= canvas_bottom:
-                        visible_items.append( item )
-            
-            return visible_items
-        except Exception:
-            return []
     
     def on_image_list_click( self, index, event ):
         """Handle click on image list item"""
@@ -6571,7 +8260,7 @@ class ImageViewer:
         
         # Load from database
         try:
-            conn = sqlite3.connect( self.current_database_path )
+            conn = self.catalog.reader()
             cursor = conn.cursor()
             
             # Get image basic info - use same query logic as rating to ensure consistency
@@ -6582,7 +8271,6 @@ class ImageViewer:
             result = cursor.fetchone()  # This will get the highest (most recent) ID
             
             if not result:
-                conn.close()
                 return None
             
             image_id, rating, width, height = result
@@ -6596,7 +8284,6 @@ class ImageViewer:
             ''', (image_id,) )
             tags = [row[0] for row in cursor.fetchall()]
             
-            conn.close()
             
             # Create metadata object
             metadata = {
@@ -6626,7 +8313,7 @@ class ImageViewer:
         
         # Load from database
         try:
-            conn = sqlite3.connect( self.current_database_path )
+            conn = self.catalog.reader()
             cursor = conn.cursor()
             
             # Get only tags that are actually used by files in the database
@@ -6639,7 +8326,6 @@ class ImageViewer:
             """ )
             tags = cursor.fetchall()
             
-            conn.close()
             
             # Cache the tags
             self.cache_tags( tags )
@@ -6769,11 +8455,6 @@ class ImageViewer:
                     print( "Cancelling chunked refresh operation..." )
                     delattr( self.virtual_image_list, 'chunked_refresh_data' )
             
-            # Cancel any pending thumbnail operations
-            if hasattr( self, 'visibility_check_timer' ) and self.visibility_check_timer:
-                self.root.after_cancel( self.visibility_check_timer )
-                self.visibility_check_timer = None
-            
             # Cancel any pending after() calls in TreeviewImageList
             if hasattr( self, 'virtual_image_list' ) and self.virtual_image_list:
                 try:
@@ -6788,6 +8469,9 @@ class ImageViewer:
                                     pass  # Ignore cancellation errors
                 except Exception:
                     pass  # Ignore cleanup errors
+                
+                # Stop the thumbnail decode workers
+                self.virtual_image_list.decode_pool.shutdown()
             
             # Save current directory and all state before closing
             if self.current_browse_directory:
@@ -6798,6 +8482,20 @@ class ImageViewer:
                 # If no directory to save, still save other state (window, paned positions, active tab)
                 self.save_paned_positions_only()
             
+            # Stop the preview and fullscreen prefetch workers
+            self.preview_pool.shutdown()
+            self.fullscreen_pool.shutdown()
+            
+            # Flush and close the persistent thumbnail store
+            if self.thumbnail_store:
+                self.thumbnail_store.close()
+                self.thumbnail_store = None
+                
+            # Close the catalog connections
+            if self.catalog:
+                self.catalog.close()
+                self.catalog = None
+                
         except Exception as e:
             print( f"Error during cleanup: {e}" )
         finally:
@@ -6867,46 +8565,53 @@ class ImageViewer:
             return
         
         current_image = self.fullscreen_images[self.fullscreen_index]
-        self._rate_image_by_path( current_image, rating )
+        self._rate_image_by_path( current_image, rating, self.get_fullscreen_image_id( self.fullscreen_index ) )
     
-    def _rate_image_by_path( self, image_path, rating ):
-        """Helper method to rate an image by its file path"""
+    def _rate_image_by_path( self, image_path, rating, image_id=None ):
+        """Helper method to rate an image by its file path, or directly by id when the caller knows it"""
         if not self.current_database_path:
             return
             
         try:
-            conn = sqlite3.connect( self.current_database_path )
-            cursor = conn.cursor()
-            
-            # Get relative path
-            relative_path = os.path.relpath( image_path, os.path.dirname( self.current_database_path ) )
-            filename = os.path.basename( image_path )
-            
-            # Check if image exists in database (use ORDER BY id DESC to get most recent entry)
-            cursor.execute( "SELECT id FROM images WHERE filename = ? OR relative_path = ? ORDER BY id DESC", (filename, relative_path) )
-            result = cursor.fetchone()
-            
-            if result:
-                # Update existing image
-                cursor.execute( "UPDATE images SET rating = ? WHERE id = ?", (rating, result[0]) )
+            with self.catalog.write() as conn:
+                cursor = conn.cursor()
                 
-                # Invalidate cache entry for this image so it gets fresh data next time
-                if image_path in self.image_metadata_cache:
-                    del self.image_metadata_cache[image_path]
-            else:
-                # Add new image to database
-                try:
-                    image = Image.open( image_path )
-                    width, height = image.size
-                    image.close()
+                # Get relative path
+                relative_path = os.path.relpath( image_path, os.path.dirname( self.current_database_path ) )
+                filename = os.path.basename( image_path )
+                
+                if image_id is not None:
+                    result = (image_id,)
+                else:
+                    # Check if image exists in database (use ORDER BY id DESC to get most recent entry)
+                    cursor.execute( "SELECT id FROM images WHERE filename = ? OR relative_path = ? ORDER BY id DESC", (filename, relative_path) )
+                    result = cursor.fetchone()
                     
-                    cursor.execute( "INSERT OR REPLACE INTO images (filename, relative_path, width, height, rating) VALUES (?, ?, ?, ?, ?)",
-                                  (filename, relative_path, width, height, rating) )
-                except Exception as e:
-                    print( f"Error adding image to database: {e}" )
-                    return
+                if result:
+                    # Update existing image
+                    cursor.execute( "UPDATE images SET rating = ? WHERE id = ?", (rating, result[0]) )
+                    
+                    # Invalidate cache entry for this image so it gets fresh data next time
+                    if image_path in self.image_metadata_cache:
+                        del self.image_metadata_cache[image_path]
+                else:
+                    # Add new image to database
+                    try:
+                        image = Image.open( image_path )
+                        width, height = image.size
+                        image.close()
+                        
+                        cursor.execute( "INSERT OR REPLACE INTO images (filename, relative_path, width, height, rating) VALUES (?, ?, ?, ?, ?)",
+                                      (filename, relative_path, width, height, rating) )
+                    except Exception as e:
+                        print( f"Error adding image to database: {e}" )
+                        return
             
-            conn.commit()
+            if result:
+                self.update_filter_index( [image_path] )
+            else:
+                # The index only patches rows it already holds
+                self.load_filter_index()
             
             # Update UI if this is the selected image in database tab
             if self.selected_image_files and image_path in self.selected_image_files:
@@ -6927,8 +8632,6 @@ class ImageViewer:
             
         except Exception as e:
             print( f"Error rating image: {e}" )
-        finally:
-            conn.close()
     
     def adjust_current_browse_rating( self, delta ):
         """Adjust the rating of the current browse image by delta"""
@@ -6964,7 +8667,7 @@ class ImageViewer:
             return 0
         
         try:
-            conn = sqlite3.connect( self.current_database_path )
+            conn = self.catalog.reader()
             cursor = conn.cursor()
             
             relative_path = os.path.relpath( image_path, os.path.dirname( self.current_database_path ) )
@@ -6978,8 +8681,6 @@ class ImageViewer:
         except Exception as e:
             print( f"Error getting image rating: {e}" )
             return 0
-        finally:
-            conn.close()
     
     def on_rating_arrow_press( self, event ):
         """Handle arrow key press for rating adjustment with long press support"""
@@ -7079,6 +8780,8 @@ class ImageViewer:
                 conn.commit()
                 conn.close()
                 
+                self.update_filter_index( [image_path] )
+                
                 # Invalidate cache entry
                 if image_path in self.image_metadata_cache:
                     del self.image_metadata_cache[image_path]
@@ -7177,6 +8880,8 @@ class ImageViewer:
         # Remove the deleted image from the list
         deleted_image = self.fullscreen_images[self.fullscreen_index]
         self.fullscreen_images.pop( self.fullscreen_index )
+        if self.fullscreen_index < len( self.fullscreen_image_ids ):
+            self.fullscreen_image_ids.pop( self.fullscreen_index )
         
         # Update fullscreen display
         if len( self.fullscreen_images ) == 0:
@@ -7415,9 +9120,10 @@ class ImageViewer:
             print( f"Error loading Quickmove settings: {e}" )
 
 class TagDialog:
-    def __init__( self, parent, filepath, database_path ):
+    def __init__( self, parent, filepath, database_path, catalog ):
         self.filepath = filepath
         self.database_path = database_path
+        self.catalog = catalog
         self.filename = os.path.basename( filepath )
         
         # Create dialog window
@@ -7485,7 +9191,7 @@ class TagDialog:
     def load_tags( self ):
         """Load existing tags and current image tags"""
         try:
-            conn = sqlite3.connect( self.database_path )
+            conn = self.catalog.reader()
             cursor = conn.cursor()
             
             # Get image ID
@@ -7540,7 +9246,6 @@ class TagDialog:
                     'checkbox': checkbox
                 }
                     
-            conn.close()
             
         except Exception as e:
             messagebox.showerror( "Error", f"Failed to load tags: {str(e)}" )
@@ -7549,48 +9254,46 @@ class TagDialog:
     def save_tags( self ):
         """Save tag changes to database"""
         try:
-            conn = sqlite3.connect( self.database_path )
-            cursor = conn.cursor()
-            
-            # Update rating
-            cursor.execute( "UPDATE images SET rating = ? WHERE id = ?", (self.rating_var.get(), self.image_id) )
-            
-            # Clear existing tags for this image
-            cursor.execute( "DELETE FROM image_tags WHERE image_id = ?", (self.image_id,) )
-            
-            # Add selected existing tags
-            for tag_id, tag_data in self.tag_checkboxes.items():
-                if tag_data['var'].get():
-                    cursor.execute( "INSERT INTO image_tags (image_id, tag_id) VALUES (?, ?)", (self.image_id, tag_id) )
-                    
-            # Add new tags
-            new_tags_text = self.new_tags_entry.get().strip()
-            if new_tags_text:
-                new_tags = [tag.strip() for tag in new_tags_text.split( ',' ) if tag.strip()]
+            with self.catalog.write() as conn:
+                cursor = conn.cursor()
                 
-                for tag_name in new_tags:
-                    # Insert tag if it doesn't exist
-                    cursor.execute( "INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag_name,) )
-                    
-                    # Get tag ID
-                    cursor.execute( "SELECT id FROM tags WHERE name = ?", (tag_name,) )
-                    tag_id = cursor.fetchone()[0]
-                    
-                    # Link tag to image
-                    cursor.execute( "INSERT OR IGNORE INTO image_tags (image_id, tag_id) VALUES (?, ?)", (self.image_id, tag_id) )
+                # Update rating
+                cursor.execute( "UPDATE images SET rating = ? WHERE id = ?", (self.rating_var.get(), self.image_id) )
+                
+                # Clear existing tags for this image
+                cursor.execute( "DELETE FROM image_tags WHERE image_id = ?", (self.image_id,) )
+                
+                # Add selected existing tags
+                for tag_id, tag_data in self.tag_checkboxes.items():
+                    if tag_data['var'].get():
+                        cursor.execute( "INSERT INTO image_tags (image_id, tag_id) VALUES (?, ?)", (self.image_id, tag_id) )
+                
+                # Add new tags
+                new_tags_text = self.new_tags_entry.get().strip()
+                if new_tags_text:
+                    new_tags = [tag.strip() for tag in new_tags_text.split( ',' ) if tag.strip()]
                     
-            conn.commit()
-            conn.close()
-            
+                    for tag_name in new_tags:
+                        # Insert tag if it doesn't exist
+                        cursor.execute( "INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag_name,) )
+                        
+                        # Get tag ID
+                        cursor.execute( "SELECT id FROM tags WHERE name = ?", (tag_name,) )
+                        tag_id = cursor.fetchone()[0]
+                        
+                        # Link tag to image
+                        cursor.execute( "INSERT OR IGNORE INTO image_tags (image_id, tag_id) VALUES (?, ?)", (self.image_id, tag_id) )
+                        
             self.dialog.destroy()
             
         except Exception as e:
             messagebox.showerror( "Error", f"Failed to save tags: {str(e)}" )
 
 class MultiTagDialog:
-    def __init__( self, parent, filepaths, database_path ):
+    def __init__( self, parent, filepaths, database_path, catalog ):
         self.filepaths = filepaths
         self.database_path = database_path
+        self.catalog = catalog
         self.filenames = [os.path.basename( fp ) for fp in filepaths]
         
         # Create dialog window
@@ -7672,7 +9375,7 @@ class MultiTagDialog:
     def load_tags( self ):
         """Load existing tags and analyze common/partial tags across selected images"""
         try:
-            conn = sqlite3.connect( self.database_path )
+            conn = self.catalog.reader()
             cursor = conn.cursor()
             
             # Get image IDs and their ratings
@@ -7777,7 +9480,6 @@ class MultiTagDialog:
                         'frame': tag_frame
                     }
                     
-            conn.close()
             
         except Exception as e:
             messagebox.showerror( "Error", f"Failed to load tags: {str(e)}" )
@@ -7811,52 +9513,49 @@ class MultiTagDialog:
     def save_tags( self ):
         """Save tag changes for all selected images"""
         try:
-            conn = sqlite3.connect( self.database_path )
-            cursor = conn.cursor()
-            
-            # Update ratings if scale is enabled
-            if self.rating_scale['state'] != 'disabled':
-                rating = self.rating_var.get()
-                for img_data in self.image_data.values():
-                    cursor.execute( "UPDATE images SET rating = ? WHERE id = ?", (rating, img_data['id']) )
-            
-            # Get selected tags from checkboxes
-            selected_tag_ids = []
-            for tag_id, tag_data in self.tag_checkboxes.items():
-                if tag_data['var'].get():
-                    selected_tag_ids.append( tag_id )
-            
-            # Update tags for all images
-            for img_data in self.image_data.values():
-                image_id = img_data['id']
+            with self.catalog.write() as conn:
+                cursor = conn.cursor()
                 
-                # Clear existing tags for this image
-                cursor.execute( "DELETE FROM image_tags WHERE image_id = ?", (image_id,) )
+                # Update ratings if scale is enabled
+                if self.rating_scale['state'] != 'disabled':
+                    rating = self.rating_var.get()
+                    for img_data in self.image_data.values():
+                        cursor.execute( "UPDATE images SET rating = ? WHERE id = ?", (rating, img_data['id']) )
                 
-                # Add selected tags
-                for tag_id in selected_tag_ids:
-                    cursor.execute( "INSERT INTO image_tags (image_id, tag_id) VALUES (?, ?)", (image_id, tag_id) )
-            
-            # Add new tags
-            new_tags_text = self.new_tags_entry.get().strip()
-            if new_tags_text:
-                new_tags = [tag.strip() for tag in new_tags_text.split( ',' ) if tag.strip()]
+                # Get selected tags from checkboxes
+                selected_tag_ids = []
+                for tag_id, tag_data in self.tag_checkboxes.items():
+                    if tag_data['var'].get():
+                        selected_tag_ids.append( tag_id )
                 
-                for tag_name in new_tags:
-                    # Insert tag if it doesn't exist
-                    cursor.execute( "INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag_name,) )
+                # Update tags for all images
+                for img_data in self.image_data.values():
+                    image_id = img_data['id']
                     
-                    # Get tag ID
-                    cursor.execute( "SELECT id FROM tags WHERE name = ?", (tag_name,) )
-                    tag_id = cursor.fetchone()[0]
+                    # Clear existing tags for this image
+                    cursor.execute( "DELETE FROM image_tags WHERE image_id = ?", (image_id,) )
                     
-                    # Link tag to all selected images
-                    for img_data in self.image_data.values():
-                        cursor.execute( "INSERT OR IGNORE INTO image_tags (image_id, tag_id) VALUES (?, ?)", (img_data['id'], tag_id) )
-            
-            conn.commit()
-            conn.close()
-            
+                    # Add selected tags
+                    for tag_id in selected_tag_ids:
+                        cursor.execute( "INSERT INTO image_tags (image_id, tag_id) VALUES (?, ?)", (image_id, tag_id) )
+                
+                # Add new tags
+                new_tags_text = self.new_tags_entry.get().strip()
+                if new_tags_text:
+                    new_tags = [tag.strip() for tag in new_tags_text.split( ',' ) if tag.strip()]
+                    
+                    for tag_name in new_tags:
+                        # Insert tag if it doesn't exist
+                        cursor.execute( "INSERT OR IGNORE INTO tags (name) VALUES (?)", (tag_name,) )
+                        
+                        # Get tag ID
+                        cursor.execute( "SELECT id FROM tags WHERE name = ?", (tag_name,) )
+                        tag_id = cursor.fetchone()[0]
+                        
+                        # Link tag to all selected images
+                        for img_data in self.image_data.values():
+                            cursor.execute( "INSERT OR IGNORE INTO image_tags (image_id, tag_id) VALUES (?, ?)", (img_data['id'], tag_id) )
+                            
             self.dialog.destroy()
             
         except Exception as e:
@@ -7870,4 +9569,6 @@ def main():
     root.mainloop()
 
 if __name__ == "__main__":
+    # Frozen (PyInstaller) builds re-run this module in each pool worker - hand those straight to the worker
+    multiprocessing.freeze_support()
     main()